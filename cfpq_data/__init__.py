@@ -12,6 +12,9 @@ from cfpq_data.config import *
 
 __version__ = VERSION
 
+import cfpq_data.compression
+from cfpq_data.compression import *
+
 import cfpq_data.dataset
 from cfpq_data.dataset import *
 
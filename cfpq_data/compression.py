@@ -0,0 +1,119 @@
+"""Transparent compression of the files detected by their suffixes."""
+import bz2
+import gzip
+import lzma
+import pathlib
+from typing import IO, Union
+
+__all__ = [
+    "COMPRESSIONS",
+    "compression_of",
+    "open_file",
+]
+
+COMPRESSIONS = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+
+
+def compression_of(path: Union[pathlib.Path, str]) -> Union[str, None]:
+    """Returns the compression of the file by `path` detected by its suffix.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the file.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> compression_of("graph.csv.gz")
+    'gzip'
+    >>> compression_of("graph.csv")
+
+    Returns
+    -------
+    compression : Union[str, None]
+        The compression from `COMPRESSIONS` or None for uncompressed file.
+    """
+    return COMPRESSIONS.get(pathlib.Path(path).suffix.lower())
+
+
+def _uncompressed_name(path: Union[pathlib.Path, str]) -> str:
+    """Returns the name of the file by `path` without the compression suffix."""
+    name = pathlib.Path(path).name
+
+    if compression_of(path) is not None:
+        return pathlib.Path(name).stem
+
+    return name
+
+
+def open_file(
+    path: Union[pathlib.Path, str],
+    mode: str = "r",
+    *,
+    encoding: Union[str, None] = None,
+) -> IO:
+    """Opens the file by `path` decompressing (or compressing) it on the fly
+    if its suffix is one of `COMPRESSIONS`.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the file.
+
+    mode : str
+        The mode of the file as for `open`.
+
+    encoding : Union[str, None]
+        The encoding of the text file or None for the default one.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> with open_file("test.txt.gz", "w") as f:
+    ...     f.write("1 a 2\\n")
+    6
+    >>> with open_file("test.txt.gz") as f:
+    ...     f.read()
+    '1 a 2\\n'
+
+    Returns
+    -------
+    file : IO
+        The file object.
+
+    Notes
+    -----
+    The `zstd` compression requires `zstandard` package.
+    """
+    compression = compression_of(path)
+
+    if compression is None:
+        return open(path, mode, encoding=encoding)
+
+    if "b" not in mode and "t" not in mode:
+        mode += "t"
+
+    if compression == "gzip":
+        return gzip.open(path, mode, encoding=encoding)
+
+    if compression == "bz2":
+        return bz2.open(path, mode, encoding=encoding)
+
+    if compression == "xz":
+        return lzma.open(path, mode, encoding=encoding)
+
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            f"Zstandard file {path=} requires zstandard, "
+            "install it with `pip install zstandard`"
+        ) from e
+
+    return zstandard.open(path, mode, encoding=encoding)
@@ -1,18 +1,103 @@
+import os
 import pathlib
+from typing import Union
 
 __all__ = [
     "VERSION",
     "ROOT",
     "DATA",
+    "DATA_MAX_BYTES",
     "GRAPHS_DIR",
     "GRAMMARS_DIR",
     "BENCHMARKS_DIR",
+    "MANIFESTS_DIR",
+    "set_data_root",
+    "set_data_max_bytes",
 ]
 
 VERSION = "4.0.3"
 
 ROOT = pathlib.Path(__file__).parent
-DATA = ROOT / "data"
-GRAPHS_DIR = DATA / "graphs"
-GRAMMARS_DIR = DATA / "grammars"
-BENCHMARKS_DIR = DATA / "benchmarks"
+
+
+def set_data_root(path: Union[pathlib.Path, str]) -> pathlib.Path:
+    """Sets the directory where the downloaded dataset is stored.
+
+    By default, it is the `data` directory of the package
+    or the `CFPQ_DATA_DIR` environment variable if it is set.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the directory with the downloaded dataset.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> default = cfpq_data.config.DATA
+    >>> path = set_data_root("cfpq_data_cache")
+    >>> cfpq_data.config.GRAPHS_DIR == path / "graphs"
+    True
+    >>> path = set_data_root(default)
+
+    Returns
+    -------
+    path : Path
+        Path to the directory with the downloaded dataset.
+
+    Notes
+    -----
+    The new directories are visible as attributes of `cfpq_data.config`,
+    but not as the names imported from it before the call.
+    """
+    global DATA, GRAPHS_DIR, GRAMMARS_DIR, BENCHMARKS_DIR, MANIFESTS_DIR
+
+    DATA = pathlib.Path(path).expanduser().resolve()
+    GRAPHS_DIR = DATA / "graphs"
+    GRAMMARS_DIR = DATA / "grammars"
+    BENCHMARKS_DIR = DATA / "benchmarks"
+    MANIFESTS_DIR = DATA / "manifests"
+
+    return DATA
+
+
+def set_data_max_bytes(max_bytes: Union[int, None]) -> Union[int, None]:
+    """Sets the size limit of the downloaded dataset in bytes.
+
+    When a download exceeds the limit, the least recently used graphs,
+    grammars and benchmarks are removed. By default, there is no limit
+    or it is taken from the `CFPQ_DATA_MAX_BYTES` environment variable.
+
+    Parameters
+    ----------
+    max_bytes : Union[int, None]
+        The size limit in bytes or None for no limit.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> set_data_max_bytes(10 * 2**30)
+    10737418240
+    >>> set_data_max_bytes(None)
+
+    Returns
+    -------
+    max_bytes : Union[int, None]
+        The size limit in bytes or None for no limit.
+    """
+    global DATA_MAX_BYTES
+
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError(f"{max_bytes=} cannot be negative")
+
+    DATA_MAX_BYTES = max_bytes
+
+    return DATA_MAX_BYTES
+
+
+DATA = GRAPHS_DIR = GRAMMARS_DIR = BENCHMARKS_DIR = MANIFESTS_DIR = None
+set_data_root(os.environ.get("CFPQ_DATA_DIR", ROOT / "data"))
+
+DATA_MAX_BYTES = None
+if os.environ.get("CFPQ_DATA_MAX_BYTES"):
+    set_data_max_bytes(int(os.environ["CFPQ_DATA_MAX_BYTES"]))
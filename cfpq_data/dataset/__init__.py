@@ -1 +1,8 @@
 from cfpq_data.dataset.data import *
+from cfpq_data.dataset.cache import *
+from cfpq_data.dataset.transport import *
+from cfpq_data.dataset.progress import *
+from cfpq_data.dataset.asynchronous import *
+from cfpq_data.dataset.metadata import *
+from cfpq_data.dataset.memory import *
+from cfpq_data.dataset.statistics import *
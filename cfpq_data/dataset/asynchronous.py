@@ -0,0 +1,257 @@
+"""Download graph data from dataset without blocking the asyncio event loop."""
+import asyncio
+import contextvars
+import functools
+import logging
+import pathlib
+import threading
+from typing import Any, Callable, Dict, Iterable, Tuple, Union
+
+from cfpq_data.dataset.data import download, download_grammars, download_benchmark
+from cfpq_data.dataset.progress import ProgressCallback
+from cfpq_data.dataset.transport import _cancel_event
+
+__all__ = [
+    "adownload",
+    "adownload_grammars",
+    "adownload_benchmark",
+    "adownload_many",
+]
+
+
+async def _run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Runs the blocking download `func` in a worker thread.
+
+    If the awaiting task is cancelled, the download is interrupted
+    at the next chunk of data and the cancellation is propagated
+    after the worker thread releases the downloaded artifact.
+    """
+    cancel = threading.Event()
+
+    context = contextvars.copy_context()
+    context.run(_cancel_event.set, cancel)
+
+    future = asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(context.run, func, *args, **kwargs)
+    )
+
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        cancel.set()
+        await asyncio.wait([future])
+        logging.info(f"Cancel {func.__name__} with {args=}, {kwargs=}")
+        raise
+
+
+async def adownload(
+    name: str,
+    *,
+    streaming: bool = False,
+    progress: Union[ProgressCallback, None] = None,
+) -> pathlib.Path:
+    """Download graph data from dataset without blocking the event loop.
+
+    Asynchronous counterpart of `download` with the same cache semantics.
+
+    Parameters
+    ----------
+    name : str
+        The name of the graph from the dataset.
+
+    streaming : bool
+        If true, the archive is unpacked while it is being downloaded
+        instead of being saved to disk first.
+
+    progress : Union[Callable[[Dict[str, Any]], None], None]
+        The function called with the events of the download stages
+        in the worker thread, see `download`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from cfpq_data import *
+    >>> path = asyncio.run(adownload("generations"))
+
+    Returns
+    -------
+    path : Path
+        Path to the file with graph data.
+    """
+    return await _run(download, name, streaming=streaming, progress=progress)
+
+
+async def adownload_grammars(
+    template: str,
+    *,
+    graph_name: Union[str, None] = None,
+    streaming: bool = False,
+    progress: Union[ProgressCallback, None] = None,
+) -> Union[pathlib.Path, None]:
+    """Download grammars of the given template without blocking the event loop.
+
+    Asynchronous counterpart of `download_grammars` with the same cache semantics.
+
+    Parameters
+    ----------
+    template : str
+        The name of the grammar template from the dataset.
+
+    graph_name : Union[str, None]
+        The name of the specified graph from the dataset or None for downloading example grammars.
+
+    streaming : bool
+        If true, the archive is unpacked while it is being downloaded
+        instead of being saved to disk first.
+
+    progress : Union[Callable[[Dict[str, Any]], None], None]
+        The function called with the events of the download stages
+        in the worker thread, see `download`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from cfpq_data import *
+    >>> path = asyncio.run(adownload_grammars("java_points_to", graph_name="avrora"))
+
+    Returns
+    -------
+    path : Union[Path, None]
+        Path to the directory with grammars data or None if there is no such grammars in dataset.
+    """
+    return await _run(
+        download_grammars,
+        template,
+        graph_name=graph_name,
+        streaming=streaming,
+        progress=progress,
+    )
+
+
+async def adownload_benchmark(
+    name: str,
+    *,
+    graphs: Union[Iterable[str], None] = None,
+    members: Union[Iterable[str], None] = None,
+    streaming: bool = False,
+    progress: Union[ProgressCallback, None] = None,
+) -> pathlib.Path:
+    """Download benchmark data without blocking the event loop.
+
+    Asynchronous counterpart of `download_benchmark` with the same cache semantics.
+
+    Parameters
+    ----------
+    name : str
+        The name of the benchmark.
+
+    graphs : Union[Iterable[str], None]
+        The names of the graphs whose benchmark data will be extracted
+        or None for all graphs.
+
+    members : Union[Iterable[str], None]
+        Glob patterns of the paths of files relative to the benchmark directory,
+        e.g. `*/queries/*`, that will be extracted or None for all files.
+
+    streaming : bool
+        If true, the archive is unpacked while it is being downloaded
+        instead of being saved to disk first.
+
+    progress : Union[Callable[[Dict[str, Any]], None], None]
+        The function called with the events of the download stages
+        in the worker thread, see `download`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from cfpq_data import *
+    >>> path = asyncio.run(adownload_benchmark("MS_Reachability"))
+
+    Returns
+    -------
+    path : Path
+        Path to the directory with benchmark data.
+    """
+    return await _run(
+        download_benchmark,
+        name,
+        graphs=graphs,
+        members=members,
+        streaming=streaming,
+        progress=progress,
+    )
+
+
+async def adownload_many(
+    names: Iterable[str],
+    *,
+    max_concurrency: int = 8,
+    streaming: bool = False,
+    progress: Union[ProgressCallback, None] = None,
+) -> Tuple[Dict[str, pathlib.Path], Dict[str, Exception]]:
+    """Download several graphs from dataset concurrently without blocking the event loop.
+
+    Asynchronous counterpart of `download_many`.
+    Cancelling it cancels all the downloads.
+
+    Parameters
+    ----------
+    names : Iterable[str]
+        The names of the graphs from the dataset.
+
+    max_concurrency : int
+        The maximum number of graphs downloaded at the same time.
+
+    streaming : bool
+        If true, the archives are unpacked while they are being downloaded.
+
+    progress : Union[Callable[[Dict[str, Any]], None], None]
+        The function called with the events of the download stages
+        of all graphs in the worker threads, see `download`.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from cfpq_data import *
+    >>> paths, errors = asyncio.run(adownload_many(["generations", "travel"]))
+    >>> sorted(paths)
+    ['generations', 'travel']
+    >>> errors
+    {}
+
+    Returns
+    -------
+    paths : Dict[str, Path]
+        Paths to the files with graph data of successfully downloaded graphs.
+
+    errors : Dict[str, Exception]
+        Errors raised while downloading the other graphs.
+    """
+    names = list(dict.fromkeys(names))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def bounded_download(name: str) -> pathlib.Path:
+        async with semaphore:
+            return await adownload(name, streaming=streaming, progress=progress)
+
+    results = await asyncio.gather(
+        *(bounded_download(name) for name in names), return_exceptions=True
+    )
+
+    paths = dict()
+    errors = dict()
+
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            logging.info(f"Failed to download graph with {name=}: {result!r}")
+            errors[name] = result
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            paths[name] = result
+
+    logging.info(
+        f"Download {len(paths)} of {len(names)} graphs with {max_concurrency=}"
+    )
+
+    return paths, errors
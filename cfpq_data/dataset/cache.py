@@ -0,0 +1,376 @@
+"""Checksum manifests, locks and the size limit of the downloaded dataset."""
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import shutil
+import urllib.parse
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+from cfpq_data import config
+
+__all__ = [
+    "cache_info",
+    "verify_cache",
+]
+
+CHUNK_SIZE = 1 << 20
+
+ARCHIVE_DIRS = ("graph", "grammar", "benchmark")
+
+
+def _sha256(path: Union[pathlib.Path, str]) -> str:
+    """Returns the hex digest of the SHA-256 checksum of the file by `path`."""
+    h = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def _archive_path(url: str) -> str:
+    """Returns the path of the archive by `url` relative to the root of the storage,
+    e.g. `graph/skos.tar.gz`, which is the same on the original storage and its mirrors."""
+    parts = urllib.parse.urlparse(url).path.split("/")
+
+    for i in reversed(range(len(parts) - 1)):
+        if parts[i] in ARCHIVE_DIRS:
+            return "/".join(parts[i:])
+
+    return url
+
+
+def _dataset_version() -> str:
+    """Returns the version of the dataset used by the package, e.g. `4.0.0`."""
+    return f"{config.VERSION[0]}.0.0"
+
+
+def _same_archive(manifest: Dict[str, Any], url: str) -> bool:
+    """Checks that the artifact of `manifest` was unpacked from the archive by `url`
+    or from the same archive on another mirror of the same version of the dataset."""
+    if manifest.get("version") != _dataset_version():
+        return False
+
+    return _archive_path(manifest.get("url", "")) == _archive_path(url)
+
+
+def _artifacts_dir(kind: str) -> pathlib.Path:
+    """Returns the directory with the artifacts of the given `kind`."""
+    return {
+        "graphs": config.GRAPHS_DIR,
+        "grammars": config.GRAMMARS_DIR,
+        "benchmarks": config.BENCHMARKS_DIR,
+    }[kind]
+
+
+def _manifest_path(kind: str, name: str) -> pathlib.Path:
+    """Returns the path to the manifest of the artifact `name` of the given `kind`."""
+    return config.MANIFESTS_DIR / kind / f"{name}.json"
+
+
+def _load_manifest(kind: str, name: str) -> Union[Dict[str, Any], None]:
+    """Returns the manifest of the artifact or None if there is no valid one."""
+    try:
+        with open(_manifest_path(kind, name), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(
+    kind: str,
+    name: str,
+    *,
+    url: str,
+    artifact: pathlib.Path,
+    archive_sha256: str,
+    archive_size: int,
+    index: Dict[str, int],
+    reuse: Union[Dict[str, Dict[str, Any]], None] = None,
+) -> Dict[str, Any]:
+    """Records checksums of all files of the unpacked `artifact` in its manifest
+    together with the `index` of all files in its archive.
+
+    The checksums from `reuse` are used for the files that were not changed.
+    """
+    reuse = reuse or dict()
+    files = dict()
+
+    for file in sorted(p for p in artifact.rglob("*") if p.is_file()):
+        relpath = file.relative_to(artifact).as_posix()
+        stat = file.stat()
+        meta = reuse.get(relpath)
+
+        if (
+            meta is not None
+            and meta["size"] == stat.st_size
+            and meta.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            files[relpath] = meta
+        else:
+            files[relpath] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": _sha256(file),
+            }
+
+    manifest = {
+        "version": _dataset_version(),
+        "url": url,
+        "archive_sha256": archive_sha256,
+        "archive_size": archive_size,
+        "index": index,
+        "files": files,
+    }
+
+    path = _manifest_path(kind, name)
+    path.parent.mkdir(exist_ok=True, parents=True)
+
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(tmp, path)
+
+    logging.info(f"Write manifest of {kind} {name=} to {path=}")
+
+    return manifest
+
+
+def _touch_manifest(kind: str, name: str) -> None:
+    """Marks the artifact as used now, the modification time
+    of its manifest is the time of the last access."""
+    try:
+        os.utime(_manifest_path(kind, name))
+    except OSError:
+        pass
+
+
+def _is_valid_file(
+    path: pathlib.Path, meta: Dict[str, Any], *, verify: bool = False
+) -> bool:
+    """Checks that the file by `path` has the size and the checksum from `meta`.
+
+    The checksum is computed only if `verify` is true or the modification time
+    of the file differs from the recorded one, i.e. the file may be changed.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+
+    if not path.is_file() or stat.st_size != meta["size"]:
+        return False
+
+    if not verify and stat.st_mtime_ns == meta.get("mtime_ns"):
+        return True
+
+    if _sha256(path) != meta["sha256"]:
+        logging.info(f"Checksum mismatch of {path=}")
+        return False
+
+    return True
+
+
+def _is_cached(
+    kind: str,
+    name: str,
+    *,
+    url: str,
+    artifact: pathlib.Path,
+    select: Union[Callable[[str], bool], None] = None,
+) -> bool:
+    """Checks that the artifact was unpacked from the archive by `url`
+    or from the same archive on another mirror and is not corrupted.
+
+    If `select` is given, only the files of the archive selected by it are required.
+    """
+    manifest = _load_manifest(kind, name)
+
+    if (
+        manifest is None
+        or not _same_archive(manifest, url)
+        or not manifest.get("files")
+    ):
+        return False
+
+    files = manifest["files"]
+    required = [
+        file for file in manifest.get("index", files) if select is None or select(file)
+    ]
+
+    return all(
+        file in files and _is_valid_file(artifact / file, files[file])
+        for file in required
+    )
+
+
+@contextlib.contextmanager
+def _artifact_lock(kind: str, name: str) -> Iterator[None]:
+    """Holds an exclusive inter-process lock of the artifact `name` of the given `kind`."""
+    path = config.MANIFESTS_DIR / kind / f"{name}.lock"
+    path.parent.mkdir(exist_ok=True, parents=True)
+
+    with open(path, "a+b") as f:
+        if os.name == "nt":
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+        logging.info(f"Acquire lock of {kind} {name=}")
+
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _cached_artifacts() -> List[Dict[str, Any]]:
+    """Returns the downloaded artifacts from the least to the most recently used."""
+    artifacts = []
+
+    for kind in ("graphs", "grammars", "benchmarks"):
+        for path in (config.MANIFESTS_DIR / kind).glob("*.json"):
+            manifest = _load_manifest(kind, path.stem)
+            if manifest is None:
+                continue
+
+            artifacts.append(
+                {
+                    "kind": kind,
+                    "name": path.stem,
+                    "path": _artifacts_dir(kind) / path.stem,
+                    "size": sum(f["size"] for f in manifest["files"].values()),
+                    "accessed": path.stat().st_mtime,
+                }
+            )
+
+    artifacts.sort(key=lambda artifact: artifact["accessed"])
+
+    return artifacts
+
+
+def _evict(*, keep: Union[Tuple[str, str], None] = None) -> None:
+    """Removes the least recently used artifacts except `keep`
+    while the downloaded dataset exceeds `config.DATA_MAX_BYTES`."""
+    max_bytes = config.DATA_MAX_BYTES
+    if max_bytes is None:
+        return
+
+    artifacts = _cached_artifacts()
+    used = sum(artifact["size"] for artifact in artifacts)
+
+    for artifact in artifacts:
+        if used <= max_bytes:
+            break
+
+        kind, name = artifact["kind"], artifact["name"]
+        if (kind, name) == keep:
+            continue
+
+        with _artifact_lock(kind, name):
+            manifest = _manifest_path(kind, name)
+            if not manifest.exists() or manifest.stat().st_mtime > artifact["accessed"]:
+                continue
+
+            manifest.unlink()
+            shutil.rmtree(artifact["path"], ignore_errors=True)
+
+        used -= artifact["size"]
+
+        logging.info(f"Evict {kind} {name=} of {artifact['size']} bytes")
+
+
+def verify_cache() -> List[Dict[str, Any]]:
+    """Checks the checksums of all files of the downloaded dataset.
+
+    When a downloaded artifact is used, the checksums are computed only
+    for its files whose modification times differ from the recorded ones.
+    The manifests of the corrupted artifacts are removed,
+    so they are downloaded again when they are used.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> corrupted = verify_cache()
+
+    Returns
+    -------
+    corrupted : List[Dict[str, Any]]
+        The corrupted graphs, grammars and benchmarks, see `cache_info`.
+    """
+    artifacts = _cached_artifacts()
+    corrupted = []
+
+    for artifact in artifacts:
+        kind, name = artifact["kind"], artifact["name"]
+
+        with _artifact_lock(kind, name):
+            manifest = _load_manifest(kind, name)
+
+            if manifest is None:
+                continue
+
+            if not all(
+                _is_valid_file(artifact["path"] / file, meta, verify=True)
+                for file, meta in manifest["files"].items()
+            ):
+                _manifest_path(kind, name).unlink()
+                corrupted.append(artifact)
+
+                logging.info(f"Found corrupted {kind} {name=}")
+
+    logging.info(f"Verify {len(artifacts)} artifacts, {len(corrupted)} are corrupted")
+
+    return corrupted
+
+
+def cache_info() -> Dict[str, Any]:
+    """Returns the usage of the directory with the downloaded dataset.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> info = cache_info()
+    >>> sorted(info)
+    ['artifacts', 'max_bytes', 'root', 'used_bytes']
+
+    Returns
+    -------
+    info : Dict[str, Any]
+        The root directory of the downloaded dataset (`root`),
+        its size limit (`max_bytes`) and total size (`used_bytes`) in bytes
+        and the downloaded graphs, grammars and benchmarks (`artifacts`)
+        from the least to the most recently used with their
+        `kind`, `name`, `path`, `size` in bytes and `accessed` time.
+    """
+    artifacts = _cached_artifacts()
+
+    info = {
+        "root": config.DATA,
+        "max_bytes": config.DATA_MAX_BYTES,
+        "used_bytes": sum(artifact["size"] for artifact in artifacts),
+        "artifacts": artifacts,
+    }
+
+    logging.info(f"Cache of {len(artifacts)} artifacts uses {info['used_bytes']} bytes")
+
+    return info
@@ -1,14 +1,42 @@
 """Download graph data from dataset."""
+import fnmatch
+import gzip
+import hashlib
 import logging
 import os
 import pathlib
-import shutil
+import tarfile
+import tempfile
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 
-from typing import Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Tuple, Union
 
-from cfpq_data.config import DATA, GRAPHS_DIR, GRAMMARS_DIR, BENCHMARKS_DIR, VERSION
+from cfpq_data import config
+from cfpq_data.config import VERSION
+from cfpq_data.dataset.cache import (
+    CHUNK_SIZE,
+    _artifact_lock,
+    _cached_artifacts,
+    _evict,
+    _is_cached,
+    _same_archive,
+    _sha256,
+    _touch_manifest,
+    _load_manifest,
+    _write_manifest,
+)
+from cfpq_data.dataset.progress import (
+    ProgressCallback,
+    _reporting,
+    _Stage,
+    _TimingReader,
+)
+from cfpq_data.dataset.transport import TRANSPORT_ERRORS, _check_cancelled, _open
+from cfpq_data.graphs.readwrite.npz import _csv_to_npz
 
 __all__ = [
     "DATASET_URL",
@@ -20,11 +48,16 @@ __all__ = [
     "download",
     "download_grammars",
     "download_benchmark",
+    "download_many",
+    "set_mirror",
+    "build_mirror",
 ]
 
-DATASET_URL = f"https://cfpq-data.storage.yandexcloud.net/{VERSION[0]}.0.0/graph/"
-GRAMMARS_URL = f"https://cfpq-data.storage.yandexcloud.net/{VERSION[0]}.0.0/grammar/"
-BENCHMARK_URL = f"https://cfpq-data.storage.yandexcloud.net/{VERSION[0]}.0.0/benchmark/"
+MIRROR_URL = f"https://cfpq-data.storage.yandexcloud.net/{VERSION[0]}.0.0/"
+
+DATASET_URL = MIRROR_URL + "graph/"
+GRAMMARS_URL = MIRROR_URL + "grammar/"
+BENCHMARK_URL = MIRROR_URL + "benchmark/"
 
 DATASET = [
     "skos",
@@ -96,60 +129,577 @@ BENCHMARKS = [
     "MS_Reachability",
 ]
 
+DOWNLOAD_ATTEMPTS = 5
+
+MATERIALIZE_FORMATS = (None, "binary")
+
+_EXTRACT_FILTER = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def _download_archive(url: str, archive: pathlib.Path) -> bool:
+    """Downloads the archive by `url` to the file `archive`.
+
+    The archive is first written to a partial file next to `archive`,
+    so an interrupted download is resumed from the downloaded offset,
+    e.g. with an HTTP Range request, both within the current call
+    and by the following calls.
+
+    Returns False if there is no archive by `url`.
+    """
+    partial = archive.with_name(f"{archive.name}.part")
+    download = _Stage("download", url=url)
+
+    for attempt in range(1, DOWNLOAD_ATTEMPTS + 1):
+        offset = partial.stat().st_size if partial.exists() else 0
+        size = offset
+        total = None
+        connect = _Stage("connect", url=url)
+
+        try:
+            requested = time.perf_counter()
+
+            with _open(url, offset) as (body, start, total):
+                connect.add(elapsed=time.perf_counter() - requested)
+                connect.finish()
+
+                if total is not None:
+                    download.total = download.bytes + total - start
+
+                if start != offset:
+                    logging.info(f"Restart download of {url=} from {start=}")
+                elif offset:
+                    logging.info(f"Resume download of {url=} from {offset=}")
+
+                offset = size = start
+
+                reader = _TimingReader(body, download)
+
+                with open(partial, "ab" if offset else "wb") as f:
+                    for chunk in iter(lambda: reader.read(CHUNK_SIZE), b""):
+                        _check_cancelled()
+                        f.write(chunk)
+                        size += len(chunk)
+        except FileNotFoundError:
+            return False
+        except TRANSPORT_ERRORS as e:
+            if size == offset:
+                raise
+
+            logging.info(
+                f"Interrupted download of {url=} at {size} bytes ({attempt=}): {e!r}"
+            )
+            continue
+
+        if total is not None and size != total:
+            logging.info(f"Got {size} of {total} bytes of {url=} ({attempt=})")
+            if size > total:
+                partial.unlink()
+            continue
+
+        os.replace(partial, archive)
+
+        download.finish()
+
+        return True
+
+    raise requests.exceptions.ConnectionError(
+        f"Failed to download {url=} in {DOWNLOAD_ATTEMPTS} attempts"
+    )
+
+
+class _HashingReader:
+    """File-like wrapper computing the SHA-256 checksum of the read data."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def read(self, size: Union[int, None] = None) -> bytes:
+        _check_cancelled()
+        data = self.raw.read(size)
+        self.sha256.update(data)
+        self.size += len(data)
+        return data
+
+
+def _extract(
+    tar: tarfile.TarFile,
+    directory: pathlib.Path,
+    name: str,
+    select: Union[Callable[[str], bool], None] = None,
+    stage: Union[_Stage, None] = None,
+) -> Dict[str, int]:
+    """Extracts the files of the artifact `name` selected by `select` from `tar` to `directory`.
+
+    The sizes of the extracted files are added to `stage`.
+
+    Returns the index of all files of the artifact in the archive with their sizes.
+    """
+    index = dict()
+
+    for member in tar:
+        path = pathlib.PurePosixPath(member.name)
+
+        if not member.isfile() or path.parts[:1] != (name,):
+            continue
+
+        relpath = path.relative_to(name).as_posix()
+        index[relpath] = member.size
+
+        if select is None or select(relpath):
+            tar.extract(member, directory, **_EXTRACT_FILTER)
+
+            if stage is not None:
+                stage.add(member.size)
+
+    return index
+
+
+def _unpack_archive(
+    archive: BinaryIO,
+    directory: pathlib.Path,
+    name: str,
+    select: Union[Callable[[str], bool], None] = None,
+    *,
+    url: str,
+) -> Tuple[Dict[str, int], _Stage, _Stage]:
+    """Extracts the files of the artifact `name` selected by `select`
+    from the `.tar.gz` `archive` to `directory`.
+
+    Returns the index of all files of the artifact in the archive
+    and the stages of decompression and extraction, the time
+    of decompression includes the time of reading `archive`.
+    """
+    decompress = _Stage("decompress", url=url)
+    extract = _Stage("extract", url=url)
+
+    with extract.timing():
+        with gzip.GzipFile(fileobj=archive, mode="rb") as f:
+            reader = _TimingReader(f, decompress)
+
+            with tarfile.open(fileobj=reader, mode="r|") as tar:
+                index = _extract(tar, directory, name, select, extract)
+
+    extract.elapsed -= decompress.elapsed
+
+    return index, decompress, extract
+
+
+def _stream_archive(
+    url: str,
+    directory: pathlib.Path,
+    name: str,
+    select: Union[Callable[[str], bool], None] = None,
+) -> Union[Tuple[str, int, Dict[str, int]], None]:
+    """Unpacks the archive by `url` to `directory` while it is being downloaded.
+
+    Returns the SHA-256 checksum, the size and the index of the archive
+    or None if there is no archive by `url`.
+    """
+    connect = _Stage("connect", url=url)
+    download = _Stage("download", url=url)
+
+    try:
+        requested = time.perf_counter()
+
+        with _open(url) as (body, _, total):
+            connect.add(elapsed=time.perf_counter() - requested)
+            connect.finish()
+
+            download.total = total
+            reader = _HashingReader(_TimingReader(body, download))
+
+            index, decompress, extract = _unpack_archive(
+                reader, directory, name, select, url=url
+            )
+            decompress.elapsed -= download.elapsed
+
+            for _ in iter(lambda: reader.read(CHUNK_SIZE), b""):
+                pass
+    except FileNotFoundError:
+        return None
+
+    logging.info(f"Load and unzip archive from {url=} to {directory=}")
+
+    download.finish()
+    decompress.finish()
+    extract.finish()
+
+    return reader.sha256.hexdigest(), reader.size, index
+
+
+def _link_cached_graphs(directory: pathlib.Path) -> None:
+    """Replaces the dataset graphs in `directory` by hard links
+    to the same graphs downloaded to `GRAPHS_DIR`."""
+    for file in directory.rglob("*.csv"):
+        graph = file.stem
+        manifest = _load_manifest("graphs", graph) if graph in DATASET else None
+        meta = manifest["files"].get(f"{graph}.csv") if manifest else None
+        cached = config.GRAPHS_DIR / graph / f"{graph}.csv"
+
+        if (
+            meta is None
+            or not cached.is_file()
+            or cached.stat().st_size != meta["size"]
+            or file.stat().st_size != meta["size"]
+            or _sha256(file) != meta["sha256"]
+        ):
+            continue
+
+        link = file.with_name(f".{file.name}.link")
+
+        try:
+            os.link(cached, link)
+        except OSError:
+            continue
+
+        os.replace(link, file)
+
+        logging.info(f"Link {file=} to downloaded graph {cached=}")
+
+
+def _fetch_artifact(
+    kind: str,
+    name: str,
+    *,
+    url: str,
+    directory: pathlib.Path,
+    streaming: bool = False,
+    select: Union[Callable[[str], bool], None] = None,
+    progress: Union[ProgressCallback, None] = None,
+) -> Union[pathlib.Path, None]:
+    """Returns the unpacked artifact `name` from `directory`,
+    downloading it from `url` only if there is no valid cached copy.
+
+    If `select` is given, only the files of the archive selected by it
+    are extracted and added to the artifact.
+
+    The stages of the download are reported to `progress`.
+
+    Returns None if there is no such artifact by `url`.
+    """
+    with _reporting(progress, kind, name):
+        return _fetch_artifact_reported(
+            kind, name, url=url, directory=directory, streaming=streaming, select=select
+        )
+
+
+def _fetch_artifact_reported(
+    kind: str,
+    name: str,
+    *,
+    url: str,
+    directory: pathlib.Path,
+    streaming: bool,
+    select: Union[Callable[[str], bool], None],
+) -> Union[pathlib.Path, None]:
+    """Implements `_fetch_artifact` within the context reporting the progress."""
+    artifact = directory / name
+    verify = _Stage("verify", url=url)
+
+    with verify.timing():
+        cached = _is_cached(kind, name, url=url, artifact=artifact, select=select)
+
+    if cached:
+        logging.info(f"Use cached {artifact=}")
+        _touch_manifest(kind, name)
+        verify.finish()
+        return artifact
+
+    with _artifact_lock(kind, name):
+        with verify.timing():
+            cached = _is_cached(kind, name, url=url, artifact=artifact, select=select)
+
+        if cached:
+            logging.info(f"Use {artifact=} downloaded by another process")
+            _touch_manifest(kind, name)
+            verify.finish()
+            return artifact
+
+        publish = _Stage("publish", url=url)
+        cleanup = _Stage("cleanup", url=url)
+
+        directory.mkdir(exist_ok=True, parents=True)
+
+        with tempfile.TemporaryDirectory(prefix=f".{name}.", dir=directory) as tmp:
+            staging = pathlib.Path(tmp)
+
+            if streaming:
+                streamed = _stream_archive(url, staging, name, select)
+
+                if streamed is None:
+                    return None
+
+                verify.finish()
+
+                archive_sha256, archive_size, index = streamed
+            else:
+                archive = directory / f"{name}.tar.gz"
+
+                if not _download_archive(url, archive):
+                    return None
+
+                logging.info(f"Load archive {archive=}")
+
+                with verify.timing():
+                    archive_sha256 = _sha256(archive)
+                    archive_size = archive.stat().st_size
+
+                verify.finish()
+
+                with open(archive, "rb") as f:
+                    index, decompress, extract = _unpack_archive(
+                        f, staging, name, select, url=url
+                    )
+
+                logging.info(f"Unzip {archive=} to {staging=}")
+
+                decompress.finish()
+                extract.finish()
+
+                with cleanup.timing():
+                    os.remove(archive)
+
+                logging.info(f"Remove archive {archive=}")
+
+            if not index:
+                raise FileNotFoundError(f"No {artifact=} found in archive from {url=}")
+
+            with publish.timing():
+                staged = staging / name
+                staged.mkdir(exist_ok=True)
+
+                if kind == "benchmarks":
+                    _link_cached_graphs(staged)
+
+                manifest = _load_manifest(kind, name)
+
+                if (
+                    select is None
+                    or manifest is None
+                    or not _same_archive(manifest, url)
+                    or not artifact.is_dir()
+                ):
+                    reuse = None
+
+                    if artifact.exists():
+                        os.replace(artifact, staging / f"{name}.old")
+
+                    os.replace(staged, artifact)
+                else:
+                    updated = set()
+
+                    for file in sorted(p for p in staged.rglob("*") if p.is_file()):
+                        relpath = file.relative_to(staged).as_posix()
+                        (artifact / relpath).parent.mkdir(exist_ok=True, parents=True)
+                        os.replace(file, artifact / relpath)
+                        updated.add(relpath)
+
+                    reuse = {
+                        file: meta
+                        for file, meta in manifest["files"].items()
+                        if file not in updated
+                    }
+
+            logging.info(f"Publish {artifact=}")
+
+            cleanup_started = time.perf_counter()
+
+        cleanup.add(elapsed=time.perf_counter() - cleanup_started)
+
+        with publish.timing():
+            _write_manifest(
+                kind,
+                name,
+                url=url,
+                artifact=artifact,
+                archive_sha256=archive_sha256,
+                archive_size=archive_size,
+                index=index,
+                reuse=reuse,
+            )
+
+        publish.finish()
+
+    with cleanup.timing():
+        _evict(keep=(kind, name))
+
+    cleanup.finish()
+
+    return artifact
+
+
+def _file_size(path: pathlib.Path) -> Union[int, None]:
+    """Returns the size of the file by `path` or None if there is no such file."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
 
-def download(name: str) -> pathlib.Path:
+def _materialize_graph(
+    name: str,
+    graph: pathlib.Path,
+    filename: str,
+    convert: Callable[[pathlib.Path, pathlib.Path], pathlib.Path],
+) -> pathlib.Path:
+    """Returns the file `filename` next to the CSV file of the downloaded graph,
+    converting the CSV file by `convert` only if there is no valid file.
+
+    The file is added to the manifest of the graph, so it is verified
+    and counted in the size of the downloaded dataset.
+    """
+    path = graph / filename
+
+    def materialized(manifest: Union[Dict[str, Any], None]) -> bool:
+        meta = manifest["files"].get(filename) if manifest else None
+        return meta is not None and _file_size(path) == meta["size"]
+
+    if materialized(_load_manifest("graphs", name)):
+        logging.info(f"Use materialized {path=}")
+        return path
+
+    with _artifact_lock("graphs", name):
+        manifest = _load_manifest("graphs", name)
+
+        if manifest is None:
+            raise FileNotFoundError(f"No downloaded graph with {name=} found")
+
+        if materialized(manifest):
+            logging.info(f"Use {path=} materialized by another process")
+            return path
+
+        materialize = _Stage("materialize", url=manifest["url"])
+
+        with materialize.timing():
+            tmp = graph / f".{filename}.{os.getpid()}.tmp"
+
+            try:
+                convert(graph / f"{name}.csv", tmp)
+                os.replace(tmp, path)
+            finally:
+                if tmp.exists():
+                    tmp.unlink()
+
+            manifest = _write_manifest(
+                "graphs",
+                name,
+                url=manifest["url"],
+                artifact=graph,
+                archive_sha256=manifest["archive_sha256"],
+                archive_size=manifest["archive_size"],
+                index=manifest.get("index", manifest["files"]),
+                reuse=manifest["files"],
+            )
+
+        materialize.add(manifest["files"][filename]["size"])
+        materialize.finish()
+
+    _evict(keep=("graphs", name))
+
+    return path
+
+
+def download(
+    name: str,
+    *,
+    streaming: bool = False,
+    progress: Union[ProgressCallback, None] = None,
+    materialize: Union[str, None] = None,
+) -> pathlib.Path:
     """Download graph data from dataset.
 
+    The graph is downloaded only if there is no valid copy of it
+    in the local cache, i.e. it is missing, corrupted or outdated.
+
+    If `materialize` is "binary", the downloaded CSV file is converted once
+    to the NPZ file next to it, which is loaded by `graph_from_npz`
+    much faster than the CSV file by `graph_from_csv`.
+
     Parameters
     ----------
     name : str
         The name of the graph from the dataset.
 
+    streaming : bool
+        If true, the archive is unpacked while it is being downloaded
+        instead of being saved to disk first. Such downloads are not resumed
+        after interruption.
+
+    progress : Union[Callable[[Dict[str, Any]], None], None]
+        The function called with the events of the download stages
+        `verify` (checksums), `connect` (time to the first byte), `download`,
+        `decompress`, `extract`, `publish` and `cleanup`. Each event is a dictionary
+        with the `kind` and the `name` of the downloaded artifact, its `url`,
+        the `stage`, the number of processed `bytes`, the `total` number of bytes
+        of the stage or None if it is unknown, the `elapsed` time in seconds,
+        the `throughput` in bytes per second or None and whether the stage is `done`.
+        While a stage is in progress, it is reported at most every 0.1 seconds.
+        The function is called in the thread running the download.
+        The conversion of the graph is reported as the `materialize` stage.
+
+    materialize : Union[str, None]
+        The format to which the graph is converted: "binary" for NPZ file
+        or None for the CSV file only.
+
     Examples
     --------
     >>> from cfpq_data import *
     >>> path = download("generations")
+    >>> events = []
+    >>> path = download("generations", progress=events.append)
+    >>> [event["stage"] for event in events]
+    ['verify']
+    >>> path = download("generations", materialize="binary")
+    >>> path.name
+    'generations.npz'
 
     Returns
     -------
     path : Path
-        Path to the file with graph data.
+        Path to the file with graph data,
+        the NPZ one if `materialize` is "binary".
     """
+    if materialize not in MATERIALIZE_FORMATS:
+        raise ValueError(f"{materialize=} is not one of {MATERIALIZE_FORMATS=}")
+
     if name in DATASET:
         logging.info(f"Found graph with {name=}")
 
-        GRAPHS_DIR.mkdir(exist_ok=True, parents=True)
-
-        graph_archive = GRAPHS_DIR / f"{name}.tar.gz"
-        graph = GRAPHS_DIR / name / f"{name}.csv"
-
-        with requests.get(
+        graph = _fetch_artifact(
+            "graphs",
+            name,
             url=DATASET_URL + f"{name}.tar.gz",
-            stream=True,
-        ) as r:
-            with open(graph_archive, "wb") as f:
-                shutil.copyfileobj(r.raw, f)
-
-        logging.info(f"Load archive {graph_archive=}")
-
-        shutil.unpack_archive(graph_archive, GRAPHS_DIR)
+            directory=config.GRAPHS_DIR,
+            streaming=streaming,
+            progress=progress,
+        )
 
-        logging.info(f"Unzip graph {name=} to file {graph=}")
+        if graph is None:
+            raise FileNotFoundError(f"No graph with {name=} found by {DATASET_URL=}")
 
-        os.remove(graph_archive)
+        if materialize == "binary":
+            with _reporting(progress, "graphs", name):
+                return _materialize_graph(name, graph, f"{name}.npz", _csv_to_npz)
 
-        logging.info(f"Remove archive {graph_archive=}")
-
-        return graph
+        return graph / f"{name}.csv"
     else:
         raise FileNotFoundError(f"No graph with {name=} found")
 
 
 def download_grammars(
-    template: str, *, graph_name: Union[str, None] = None
+    template: str,
+    *,
+    graph_name: Union[str, None] = None,
+    streaming: bool = False,
+    progress: Union[ProgressCallback, None] = None,
 ) -> Union[pathlib.Path, None]:
     """Download grammars of the given template.
 
+    The grammars are downloaded only if there is no valid copy of them
+    in the local cache, i.e. they are missing, corrupted or outdated.
+
     Parameters
     ----------
     template : str
@@ -158,6 +708,14 @@ def download_grammars(
     graph_name : Union[str, None]
         The name of the specified graph from the dataset or None for downloading example grammars.
 
+    streaming : bool
+        If true, the archive is unpacked while it is being downloaded
+        instead of being saved to disk first. Such downloads are not resumed
+        after interruption.
+
+    progress : Union[Callable[[Dict[str, Any]], None], None]
+        The function called with the events of the download stages, see `download`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -182,51 +740,66 @@ def download_grammars(
     else:
         raise FileNotFoundError(f"No graph with {graph_name=} found")
 
-    GRAMMARS_DIR.mkdir(exist_ok=True, parents=True)
-
-    grammar_archive = GRAMMARS_DIR / f"{grammars_name}.tar.gz"
-    grammars = GRAMMARS_DIR / grammars_name
-
-    with requests.get(
+    grammars = _fetch_artifact(
+        "grammars",
+        grammars_name,
         url=url,
-        stream=True,
-    ) as r:
-        if r.status_code == 404:
-            logging.info(
-                f"No grammars with {template=} for graph with {graph_name=} found"
-            )
-            return None
-        else:
-            with open(grammar_archive, "wb") as f:
-                shutil.copyfileobj(r.raw, f)
-
-    logging.info(f"Load archive {grammar_archive=}")
-
-    shutil.unpack_archive(grammar_archive, GRAMMARS_DIR)
-
-    logging.info(
-        f"Unzip grammars with {template=} for graph with {graph_name=} to directory {grammars=}"
+        directory=config.GRAMMARS_DIR,
+        streaming=streaming,
+        progress=progress,
     )
 
-    os.remove(grammar_archive)
-
-    logging.info(f"Remove archive {grammar_archive=}")
+    if grammars is None:
+        logging.info(f"No grammars with {template=} for graph with {graph_name=} found")
 
     return grammars
 
 
-def download_benchmark(name: str) -> pathlib.Path:
+def download_benchmark(
+    name: str,
+    *,
+    graphs: Union[Iterable[str], None] = None,
+    members: Union[Iterable[str], None] = None,
+    streaming: bool = False,
+    progress: Union[ProgressCallback, None] = None,
+) -> pathlib.Path:
     """Download benchmark data.
 
+    The benchmark is downloaded only if there is no valid copy of it
+    in the local cache, i.e. it is missing, corrupted or outdated.
+
+    If `graphs` or `members` are given, only the selected files
+    of the benchmark are extracted and added to the local copy,
+    the other ones are skipped while unpacking the archive.
+    The graphs already downloaded by `download` are reused
+    as hard links instead of being stored twice.
+
     Parameters
     ----------
     name : str
         The name of the benchmark.
 
+    graphs : Union[Iterable[str], None]
+        The names of the graphs whose benchmark data will be extracted
+        or None for all graphs.
+
+    members : Union[Iterable[str], None]
+        Glob patterns of the paths of files relative to the benchmark directory,
+        e.g. `*/queries/*`, that will be extracted or None for all files.
+
+    streaming : bool
+        If true, the archive is unpacked while it is being downloaded
+        instead of being saved to disk first. Such downloads are not resumed
+        after interruption.
+
+    progress : Union[Callable[[Dict[str, Any]], None], None]
+        The function called with the events of the download stages, see `download`.
+
     Examples
     --------
     >>> from cfpq_data import *
     >>> path = download_benchmark("MS_Reachability")
+    >>> path = download_benchmark("MS_Reachability", graphs=["core"], members=["*/queries/*"])
 
     Returns
     -------
@@ -236,28 +809,220 @@ def download_benchmark(name: str) -> pathlib.Path:
     if name in BENCHMARKS:
         logging.info(f"Found benchmark with {name=}")
 
-        BENCHMARKS_DIR.mkdir(exist_ok=True, parents=True)
+        select = None
+
+        if graphs is not None or members is not None:
+            graphs = None if graphs is None else set(graphs)
+            members = None if members is None else list(members)
 
-        benchmark_archive = BENCHMARKS_DIR / f"{name}.tar.gz"
-        benchmark = BENCHMARKS_DIR / name
+            def select(path: str) -> bool:
+                return (graphs is None or path.split("/", 1)[0] in graphs) and (
+                    members is None
+                    or any(fnmatch.fnmatchcase(path, pattern) for pattern in members)
+                )
 
-        with requests.get(
+        benchmark = _fetch_artifact(
+            "benchmarks",
+            name,
             url=BENCHMARK_URL + f"{name}.tar.gz",
-            stream=True,
-        ) as r:
-            with open(benchmark_archive, "wb") as f:
-                shutil.copyfileobj(r.raw, f)
+            directory=config.BENCHMARKS_DIR,
+            streaming=streaming,
+            select=select,
+            progress=progress,
+        )
 
-        logging.info(f"Load archive {benchmark_archive=}")
+        if benchmark is None:
+            raise FileNotFoundError(
+                f"No benchmark with {name=} found by {BENCHMARK_URL=}"
+            )
 
-        shutil.unpack_archive(benchmark_archive, BENCHMARKS_DIR)
+        return benchmark
+    else:
+        raise FileNotFoundError(f"No benchmark with {name=} found")
 
-        logging.info(f"Unzip benchmark {name=} to directory {benchmark=}")
 
-        os.remove(benchmark_archive)
+def download_many(
+    names: Iterable[str],
+    *,
+    max_workers: int = 8,
+    streaming: bool = False,
+    progress: Union[ProgressCallback, None] = None,
+) -> Tuple[Dict[str, pathlib.Path], Dict[str, Exception]]:
+    """Download several graphs from dataset concurrently.
 
-        logging.info(f"Remove archive {benchmark_archive=}")
+    The graphs are downloaded and unpacked on a thread pool
+    over a shared keep-alive HTTP session with retries.
 
-        return benchmark
-    else:
-        raise FileNotFoundError(f"No benchmark with {name=} found")
+    Parameters
+    ----------
+    names : Iterable[str]
+        The names of the graphs from the dataset.
+
+    max_workers : int
+        The maximum number of graphs downloaded at the same time.
+
+    streaming : bool
+        If true, the archives are unpacked while they are being downloaded.
+
+    progress : Union[Callable[[Dict[str, Any]], None], None]
+        The function called with the events of the download stages
+        of all graphs, see `download`. It is called from several threads.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> paths, errors = download_many(["generations", "travel"])
+    >>> sorted(paths)
+    ['generations', 'travel']
+    >>> errors
+    {}
+
+    Returns
+    -------
+    paths : Dict[str, Path]
+        Paths to the files with graph data of successfully downloaded graphs.
+
+    errors : Dict[str, Exception]
+        Errors raised while downloading the other graphs.
+    """
+    names = list(dict.fromkeys(names))
+
+    paths = dict()
+    errors = dict()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                download, name, streaming=streaming, progress=progress
+            ): name
+            for name in names
+        }
+
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                paths[name] = future.result()
+            except Exception as e:
+                logging.info(f"Failed to download graph with {name=}: {e!r}")
+                errors[name] = e
+
+    logging.info(f"Download {len(paths)} of {len(names)} graphs with {max_workers=}")
+
+    return paths, errors
+
+
+def set_mirror(url: Union[pathlib.Path, str, None] = None) -> str:
+    """Sets the mirror of the dataset from which graphs, grammars and benchmarks are downloaded.
+
+    The mirror has the same layout as the original storage, i.e.
+    `graph/<name>.tar.gz`, `grammar/<name>.tar.gz`, `grammar/example/<name>.tar.gz`
+    and `benchmark/<name>.tar.gz`. By default, it is the original storage
+    or the `CFPQ_DATA_MIRROR` environment variable if it is set.
+
+    Parameters
+    ----------
+    url : Union[Path, str, None]
+        The URL of the mirror, the path to a local directory with it
+        or None for the original storage.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> set_mirror("/mnt/nfs/cfpq_data")
+    'file:///mnt/nfs/cfpq_data/'
+    >>> DATASET_URL = cfpq_data.dataset.data.DATASET_URL
+    >>> DATASET_URL
+    'file:///mnt/nfs/cfpq_data/graph/'
+    >>> mirror = set_mirror()
+
+    Returns
+    -------
+    url : str
+        The URL of the mirror.
+    """
+    global DATASET_URL, GRAMMARS_URL, BENCHMARK_URL
+
+    if url is None:
+        url = MIRROR_URL
+    elif len(urllib.parse.urlparse(str(url)).scheme) <= 1:
+        url = pathlib.Path(url).expanduser().resolve().as_uri()
+
+    if not url.endswith("/"):
+        url += "/"
+
+    DATASET_URL = url + "graph/"
+    GRAMMARS_URL = url + "grammar/"
+    BENCHMARK_URL = url + "benchmark/"
+
+    logging.info(f"Use dataset mirror {url=}")
+
+    return url
+
+
+def build_mirror(path: Union[pathlib.Path, str]) -> pathlib.Path:
+    """Builds a mirror of the dataset from the downloaded graphs, grammars and benchmarks.
+
+    The benchmarks downloaded only partly, i.e. with `graphs` or `members`,
+    and the corrupted artifacts are skipped, so the mirror has only complete archives.
+    Only the files from the original archives are added, e.g. the NPZ files
+    materialized by `download` are not.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the directory where the mirror will be built.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> p = download("generations")
+    >>> mirror = build_mirror("cfpq_data_mirror")
+    >>> url = set_mirror(mirror)
+    >>> p = download("generations")
+
+    Returns
+    -------
+    path : Path
+        Path to the directory with the mirror.
+    """
+    dest = pathlib.Path(path).resolve()
+
+    for artifact in _cached_artifacts():
+        kind, name = artifact["kind"], artifact["name"]
+
+        if kind == "graphs":
+            archive = dest / "graph" / f"{name}.tar.gz"
+        elif kind == "benchmarks":
+            archive = dest / "benchmark" / f"{name}.tar.gz"
+        elif name in GRAMMAR_TEMPLATES:
+            archive = dest / "grammar" / "example" / f"{name}.tar.gz"
+        else:
+            archive = dest / "grammar" / f"{name}.tar.gz"
+
+        with _artifact_lock(kind, name):
+            manifest = _load_manifest(kind, name)
+
+            if manifest is None:
+                continue
+
+            if not _is_cached(
+                kind, name, url=manifest["url"], artifact=artifact["path"]
+            ):
+                logging.info(f"Skip partly downloaded or corrupted {kind} {name=}")
+                continue
+
+            archive.parent.mkdir(exist_ok=True, parents=True)
+
+            tmp = archive.with_name(f"{archive.name}.{os.getpid()}.tmp")
+            with tarfile.open(tmp, "w:gz") as tar:
+                for file in sorted(manifest.get("index", manifest["files"])):
+                    tar.add(artifact["path"] / file, arcname=f"{name}/{file}")
+            os.replace(tmp, archive)
+
+        logging.info(f"Add {kind} {name=} to mirror {archive=}")
+
+    return dest
+
+
+if os.environ.get("CFPQ_DATA_MIRROR"):
+    set_mirror(os.environ["CFPQ_DATA_MIRROR"])
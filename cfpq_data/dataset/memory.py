@@ -0,0 +1,182 @@
+"""Lazily loaded dataset graphs kept in memory with LRU eviction."""
+import collections
+import logging
+import threading
+from collections.abc import Mapping
+from typing import Iterable, Iterator, List, Union
+
+import networkx as nx
+
+from cfpq_data.dataset.data import DATASET, MATERIALIZE_FORMATS, download
+from cfpq_data.graphs.readwrite.csv import graph_from_csv
+from cfpq_data.graphs.readwrite.npz import graph_from_npz
+
+__all__ = [
+    "Dataset",
+    "estimate_graph_bytes",
+]
+
+NODE_BYTES = 430
+EDGE_BYTES = 480
+
+
+def estimate_graph_bytes(graph: nx.MultiDiGraph) -> int:
+    """Returns the estimated memory size of the labeled `graph` in bytes.
+
+    Parameters
+    ----------
+    graph : MultiDiGraph
+        The graph whose size is estimated.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> g = graph_from_text(["1 a 2", "2 b 1"])
+    >>> estimate_graph_bytes(g)
+    1820
+
+    Returns
+    -------
+    size : int
+        The estimated size of the graph in bytes.
+
+    Notes
+    -----
+    The estimate is linear in the number of nodes and edges and is fitted
+    to the memory allocated by networkx for graphs with one label per edge.
+    """
+    return NODE_BYTES * graph.number_of_nodes() + EDGE_BYTES * graph.number_of_edges()
+
+
+class Dataset(Mapping):
+    """Mapping from the names of the dataset graphs to the loaded graphs.
+
+    A graph is downloaded and loaded on the first access by its name
+    and kept in memory until the total estimated size of the loaded graphs
+    exceeds `max_bytes`, then the least recently used graphs are evicted.
+
+    Parameters
+    ----------
+    max_bytes : Union[int, None]
+        The memory budget for the loaded graphs in bytes or None for no limit.
+
+    names : Union[Iterable[str], None]
+        The names of the graphs from the dataset available by the mapping
+        or None for all graphs.
+
+    materialize : Union[str, None]
+        The format to which the graphs are converted once on download,
+        see `download`. With "binary" they are loaded from NPZ files.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> dataset = Dataset(max_bytes=2**30)
+    >>> g = dataset["generations"]
+    >>> g is dataset["generations"]
+    True
+    >>> dataset.loaded()
+    ['generations']
+    """
+
+    def __init__(
+        self,
+        max_bytes: Union[int, None] = None,
+        *,
+        names: Union[Iterable[str], None] = None,
+        materialize: Union[str, None] = None,
+    ):
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"{max_bytes=} cannot be negative")
+
+        if materialize not in MATERIALIZE_FORMATS:
+            raise ValueError(f"{materialize=} is not one of {MATERIALIZE_FORMATS=}")
+
+        self.max_bytes = max_bytes
+        self.materialize = materialize
+        self._names = list(DATASET if names is None else dict.fromkeys(names))
+
+        for name in self._names:
+            if name not in DATASET:
+                raise FileNotFoundError(f"No graph with {name=} found")
+
+        self._graphs = collections.OrderedDict()
+        self._sizes = dict()
+        self._lock = threading.RLock()
+
+    def __getitem__(self, name: str) -> nx.MultiDiGraph:
+        if name not in self:
+            raise KeyError(name)
+
+        with self._lock:
+            if name in self._graphs:
+                self._graphs.move_to_end(name)
+                return self._graphs[name]
+
+        graph = self._load(name)
+        size = estimate_graph_bytes(graph)
+
+        with self._lock:
+            if name in self._graphs:
+                self._graphs.move_to_end(name)
+                return self._graphs[name]
+
+            if self.max_bytes is not None and size > self.max_bytes:
+                logging.info(f"Do not keep graph with {name=} of {size} bytes")
+                return graph
+
+            self._graphs[name] = graph
+            self._sizes[name] = size
+            self._evict()
+
+        return graph
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def _load(self, name: str) -> nx.MultiDiGraph:
+        """Downloads and loads the graph `name`."""
+        path = download(name, materialize=self.materialize)
+
+        if self.materialize == "binary":
+            return graph_from_npz(path)
+
+        return graph_from_csv(path)
+
+    def _evict(self) -> None:
+        """Evicts the least recently used graphs while the budget is exceeded."""
+        while self.max_bytes is not None and self.memory_bytes > self.max_bytes:
+            name, _ = self._graphs.popitem(last=False)
+            size = self._sizes.pop(name)
+
+            logging.info(f"Evict graph with {name=} of {size} bytes")
+
+    @property
+    def memory_bytes(self) -> int:
+        """The total estimated size of the loaded graphs in bytes."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def loaded(self) -> List[str]:
+        """Returns the names of the loaded graphs
+        from the least to the most recently used."""
+        with self._lock:
+            return list(self._graphs)
+
+    def evict(self, name: str) -> None:
+        """Removes the graph `name` from memory if it is loaded."""
+        with self._lock:
+            if self._graphs.pop(name, None) is not None:
+                self._sizes.pop(name)
+
+    def clear(self) -> None:
+        """Removes all the loaded graphs from memory."""
+        with self._lock:
+            self._graphs.clear()
+            self._sizes.clear()
@@ -0,0 +1,127 @@
+"""Metadata of the dataset graphs available without downloading them."""
+import json
+import logging
+import pathlib
+from typing import Any, Dict, Iterable, List, Union
+
+__all__ = [
+    "METADATA_PATH",
+    "graph_metadata",
+    "select_graphs",
+]
+
+METADATA_PATH = pathlib.Path(__file__).parent / "metadata.json"
+
+with open(METADATA_PATH, "r") as f:
+    _METADATA = json.load(f)
+
+
+def graph_metadata(name: str) -> Dict[str, Any]:
+    """Returns the metadata of the graph from the dataset.
+
+    Parameters
+    ----------
+    name : str
+        The name of the graph from the dataset.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> metadata = graph_metadata("generations")
+    >>> metadata["nodes"], metadata["edges"]
+    (129, 273)
+    >>> metadata["labels"]["type"]
+    78
+
+    Returns
+    -------
+    metadata : Dict[str, Any]
+        The number of nodes (`nodes`) and edges (`edges`) of the graph,
+        the number of edges with each label (`labels`),
+        the size in bytes (`archive_size`) and the SHA-256 checksum (`archive_sha256`)
+        of its archive or None if they are unknown.
+
+    Notes
+    -----
+    For the graphs of Java programs the edges labeled with `load_f` and `store_f`
+    are counted only over all fields `f` as `load` and `store` in `field_edges`,
+    so these labels are not in `labels` and the graphs are not selected by them.
+
+    The sizes and the checksums of the archives are None until the metadata
+    is regenerated from the downloaded archives by `utils/update_dataset_metadata.py`.
+    """
+    if name not in _METADATA["graphs"]:
+        raise FileNotFoundError(f"No graph with {name=} found")
+
+    metadata = _METADATA["graphs"][name]
+    copy = {**metadata, "labels": dict(metadata["labels"])}
+
+    if "field_edges" in metadata:
+        copy["field_edges"] = dict(metadata["field_edges"])
+
+    return copy
+
+
+def select_graphs(
+    *,
+    min_nodes: Union[int, None] = None,
+    max_nodes: Union[int, None] = None,
+    min_edges: Union[int, None] = None,
+    max_edges: Union[int, None] = None,
+    labels_include: Union[Iterable[str], None] = None,
+    labels_exclude: Union[Iterable[str], None] = None,
+) -> List[str]:
+    """Returns the names of the dataset graphs that satisfy all the given conditions.
+
+    Parameters
+    ----------
+    min_nodes : Union[int, None]
+        The minimum number of nodes.
+
+    max_nodes : Union[int, None]
+        The maximum number of nodes.
+
+    min_edges : Union[int, None]
+        The minimum number of edges.
+
+    max_edges : Union[int, None]
+        The maximum number of edges.
+
+    labels_include : Union[Iterable[str], None]
+        Edge labels each of which must be used in the graph.
+
+    labels_exclude : Union[Iterable[str], None]
+        Edge labels none of which may be used in the graph.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> select_graphs(max_edges=300, labels_include=["subClassOf", "type"])
+    ['skos', 'travel', 'univ']
+
+    Returns
+    -------
+    names : List[str]
+        The names of the selected graphs sorted by the number of edges.
+    """
+    labels_include = set(labels_include or [])
+    labels_exclude = set(labels_exclude or [])
+
+    names = []
+
+    for name, metadata in _METADATA["graphs"].items():
+        if (
+            (min_nodes is None or metadata["nodes"] >= min_nodes)
+            and (max_nodes is None or metadata["nodes"] <= max_nodes)
+            and (min_edges is None or metadata["edges"] >= min_edges)
+            and (max_edges is None or metadata["edges"] <= max_edges)
+            and labels_include.issubset(metadata["labels"])
+            and labels_exclude.isdisjoint(metadata["labels"])
+        ):
+            names.append(name)
+
+    names.sort(key=lambda name: _METADATA["graphs"][name]["edges"])
+
+    logging.info(f"Select {len(names)} graphs from dataset")
+
+    return names
@@ -0,0 +1,120 @@
+"""Structured progress events and per-stage timings of the dataset downloads."""
+import contextlib
+import contextvars
+import logging
+import time
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Union
+
+__all__ = [
+    "STAGES",
+    "ProgressCallback",
+]
+
+STAGES = (
+    "verify",
+    "connect",
+    "download",
+    "decompress",
+    "extract",
+    "publish",
+    "cleanup",
+    "materialize",
+)
+
+PROGRESS_INTERVAL = 0.1
+
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+_progress: contextvars.ContextVar = contextvars.ContextVar("_progress", default=None)
+
+
+@contextlib.contextmanager
+def _reporting(
+    callback: Union[ProgressCallback, None], kind: str, name: str
+) -> Iterator[None]:
+    """Reports the stages of the download of the artifact `name`
+    of the given `kind` running in this context to `callback`."""
+    token = _progress.set((callback, kind, name))
+
+    try:
+        yield
+    finally:
+        _progress.reset(token)
+
+
+class _Stage:
+    """Duration and processed bytes of a stage of the download."""
+
+    def __init__(self, stage: str, *, url: str, total: Union[int, None] = None):
+        self.stage = stage
+        self.url = url
+        self.total = total
+        self.bytes = 0
+        self.elapsed = 0.0
+        self.reported = time.perf_counter()
+
+    def add(self, size: int = 0, elapsed: float = 0.0) -> None:
+        """Adds processed bytes and time to the stage, reporting the progress
+        at most once in `PROGRESS_INTERVAL` seconds."""
+        self.bytes += size
+        self.elapsed += elapsed
+
+        now = time.perf_counter()
+        if now - self.reported >= PROGRESS_INTERVAL:
+            self.reported = now
+            self._emit(done=False)
+
+    @contextlib.contextmanager
+    def timing(self) -> Iterator["_Stage"]:
+        """Adds the time spent in the block to the stage."""
+        start = time.perf_counter()
+
+        try:
+            yield self
+        finally:
+            self.elapsed += time.perf_counter() - start
+
+    def finish(self) -> None:
+        """Reports the completed stage."""
+        self._emit(done=True)
+
+        url = self.url
+
+        logging.info(
+            f"Finish {self.stage} of {url=} "
+            f"in {self.elapsed:.3f} seconds with {self.bytes} bytes"
+        )
+
+    def _emit(self, *, done: bool) -> None:
+        callback, kind, name = _progress.get() or (None, None, None)
+
+        if callback is None:
+            return
+
+        callback(
+            {
+                "kind": kind,
+                "name": name,
+                "url": self.url,
+                "stage": self.stage,
+                "bytes": self.bytes,
+                "total": self.total,
+                "elapsed": self.elapsed,
+                "throughput": self.bytes / self.elapsed if self.elapsed > 0 else None,
+                "done": done,
+            }
+        )
+
+
+class _TimingReader:
+    """File-like wrapper adding the read bytes and the time spent in reading to `stage`."""
+
+    def __init__(self, raw: BinaryIO, stage: _Stage):
+        self.raw = raw
+        self.stage = stage
+
+    def read(self, size: Union[int, None] = None) -> bytes:
+        start = time.perf_counter()
+        data = self.raw.read(size)
+        self.stage.add(len(data), time.perf_counter() - start)
+        return data
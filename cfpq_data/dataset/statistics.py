@@ -0,0 +1,185 @@
+"""Statistics of the dataset graphs computed in parallel and cached by checksums."""
+import collections
+import json
+import logging
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+from cfpq_data import config
+from cfpq_data.dataset.cache import _load_manifest, _sha256
+from cfpq_data.dataset.data import DATASET, download_many
+from cfpq_data.graphs.readwrite.csv import iter_edges_csv
+
+__all__ = [
+    "csv_statistics",
+    "dataset_statistics",
+]
+
+STATISTICS_CHUNK_SIZE = 1 << 20
+
+
+def csv_statistics(
+    path: Union[pathlib.Path, str], *, chunksize: int = STATISTICS_CHUNK_SIZE
+) -> Dict[str, Any]:
+    """Returns the numbers of nodes, edges and edges with each label
+    of the graph from CSV file scanning it by chunks without loading the graph.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the CSV file with the graph.
+
+    chunksize : int
+        The number of edges read at once.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> statistics = csv_statistics(download("generations"))
+    >>> statistics["nodes"], statistics["edges"]
+    (129, 273)
+    >>> statistics["labels"]["type"]
+    78
+
+    Returns
+    -------
+    statistics : Dict[str, Any]
+        The number of nodes (`nodes`) and edges (`edges`) of the graph
+        and the number of edges with each label (`labels`)
+        sorted by it in descending order and then by the label.
+    """
+    edges = 0
+    labels = collections.Counter()
+    nodes = []
+
+    # The columns are read as strings, since their types inferred
+    # for each chunk separately may differ, e.g. 1 in one chunk and "1" in another.
+    chunks = iter_edges_csv(
+        path, chunksize=chunksize, dtype={"from": str, "to": str, "label": str}
+    )
+
+    for chunk in chunks:
+        edges += len(chunk)
+        labels.update(chunk["label"].value_counts().to_dict())
+        nodes.append(
+            pd.unique(
+                np.concatenate([chunk["from"].to_numpy(), chunk["to"].to_numpy()])
+            )
+        )
+
+    statistics = {
+        "nodes": len(pd.unique(np.concatenate(nodes))) if nodes else 0,
+        "edges": edges,
+        "labels": dict(sorted(labels.items(), key=lambda x: (-x[1], x[0]))),
+    }
+
+    logging.info(f"Scan {path=} with {statistics['nodes']} nodes and {edges} edges")
+
+    return statistics
+
+
+def _statistics_path(checksum: str) -> pathlib.Path:
+    """Returns the path to the cached statistics of the CSV file with `checksum`."""
+    return config.DATA / "statistics" / f"{checksum}.json"
+
+
+def _load_statistics(checksum: str) -> Union[Dict[str, Any], None]:
+    """Returns the cached statistics or None if there are no valid ones."""
+    try:
+        with open(_statistics_path(checksum), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_statistics(checksum: str, statistics: Dict[str, Any]) -> None:
+    """Caches the statistics of the CSV file with `checksum`."""
+    path = _statistics_path(checksum)
+    path.parent.mkdir(exist_ok=True, parents=True)
+
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w") as f:
+        json.dump(statistics, f, indent=4)
+    os.replace(tmp, path)
+
+
+def _graph_checksum(name: str, path: pathlib.Path) -> str:
+    """Returns the SHA-256 checksum of the downloaded CSV file of the graph,
+    taking it from the manifest of the graph if it is recorded there."""
+    manifest = _load_manifest("graphs", name)
+    meta = manifest["files"].get(path.name) if manifest else None
+
+    return meta["sha256"] if meta is not None else _sha256(path)
+
+
+def dataset_statistics(
+    names: Union[Iterable[str], None] = None,
+    *,
+    max_workers: Union[int, None] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Returns the statistics of the dataset graphs.
+
+    The graphs are downloaded if needed and scanned by `csv_statistics`
+    on a process pool. The statistics are cached by the checksums
+    of the CSV files, so only new or changed graphs are scanned.
+
+    Parameters
+    ----------
+    names : Union[Iterable[str], None]
+        The names of the graphs from the dataset or None for all graphs.
+
+    max_workers : Union[int, None]
+        The maximum number of graphs scanned at the same time
+        or None for the number of processors.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> statistics = dataset_statistics(["generations", "travel"])
+    >>> statistics["generations"]["edges"]
+    273
+
+    Returns
+    -------
+    statistics : Dict[str, Dict[str, Any]]
+        The statistics of each graph, see `csv_statistics`.
+    """
+    names = list(dict.fromkeys(DATASET if names is None else names))
+
+    paths, errors = download_many(names)
+
+    if errors:
+        raise next(iter(errors.values()))
+
+    statistics = dict()
+    checksums = dict()
+
+    for name in names:
+        checksums[name] = _graph_checksum(name, paths[name])
+        cached = _load_statistics(checksums[name])
+
+        if cached is not None:
+            logging.info(f"Use cached statistics of graph with {name=}")
+            statistics[name] = cached
+
+    missing = [name for name in names if name not in statistics]
+
+    if len(missing) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            scanned = executor.map(csv_statistics, [paths[name] for name in missing])
+            computed = dict(zip(missing, scanned))
+    else:
+        computed = {name: csv_statistics(paths[name]) for name in missing}
+
+    for name, result in computed.items():
+        _save_statistics(checksums[name], result)
+        statistics[name] = result
+
+    logging.info(f"Compute statistics of {len(missing)} of {len(names)} graphs")
+
+    return {name: statistics[name] for name in names}
@@ -0,0 +1,189 @@
+"""Transports used to fetch the dataset archives from HTTP(S) servers
+and local or `file://` mirrors."""
+import asyncio
+import contextlib
+import contextvars
+import logging
+import os
+import pathlib
+import threading
+import urllib.parse
+import urllib.request
+from typing import BinaryIO, Callable, ContextManager, Dict, Iterator, Tuple, Union
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+__all__ = [
+    "TRANSPORTS",
+    "register_transport",
+]
+
+HTTP_POOL_SIZE = 32
+HTTP_TIMEOUT = (10, 60)
+HTTP_RETRIES = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+)
+
+TRANSPORT_ERRORS = (
+    requests.exceptions.RequestException,
+    urllib3.exceptions.HTTPError,
+    OSError,
+)
+
+Transport = Callable[[str, int], ContextManager[Tuple[BinaryIO, int, Union[int, None]]]]
+
+_session = None
+_session_lock = threading.Lock()
+
+_cancel_event: contextvars.ContextVar = contextvars.ContextVar(
+    "_cancel_event", default=None
+)
+
+
+def _check_cancelled() -> None:
+    """Raises CancelledError if the download running in this context is cancelled."""
+    event = _cancel_event.get()
+
+    if event is not None and event.is_set():
+        raise asyncio.CancelledError()
+
+
+def _get_session() -> requests.Session:
+    """Returns the keep-alive HTTP session shared by all downloads."""
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=HTTP_RETRIES,
+            )
+            _session = requests.Session()
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+
+    return _session
+
+
+@contextlib.contextmanager
+def _http_open(
+    url: str, offset: int = 0
+) -> Iterator[Tuple[BinaryIO, int, Union[int, None]]]:
+    """Opens the file by HTTP(S) `url` starting from `offset` with a Range request.
+
+    Yields the response body, the offset it actually starts from
+    and the total size of the file if it is known.
+    """
+    session = _get_session()
+
+    r = session.get(
+        url=url,
+        headers={"Range": f"bytes={offset}-"} if offset else None,
+        stream=True,
+        timeout=HTTP_TIMEOUT,
+    )
+
+    content_range = r.headers.get("Content-Range", "")
+
+    if r.status_code == 416 or (
+        r.status_code == 206 and not content_range.startswith(f"bytes {offset}-")
+    ):
+        logging.info(f"Discard unsatisfiable range of {url=} from {offset=}")
+        r.close()
+        r = session.get(url=url, stream=True, timeout=HTTP_TIMEOUT)
+
+    with r:
+        if r.status_code == 404:
+            raise FileNotFoundError(f"No file by {url=} found")
+
+        r.raise_for_status()
+
+        if r.status_code == 206:
+            start = offset
+            total = content_range.rsplit("/", 1)[-1]
+        else:
+            start = 0
+            total = r.headers.get("Content-Length")
+
+        yield r.raw, start, int(total) if total and total.isdigit() else None
+
+
+def _url_to_path(url: str) -> pathlib.Path:
+    """Returns the local path of a `file://` URL or a plain path."""
+    parsed = urllib.parse.urlparse(url)
+
+    if parsed.scheme == "file":
+        return pathlib.Path(urllib.request.url2pathname(parsed.path))
+
+    return pathlib.Path(url)
+
+
+@contextlib.contextmanager
+def _file_open(
+    url: str, offset: int = 0
+) -> Iterator[Tuple[BinaryIO, int, Union[int, None]]]:
+    """Opens the local file by `file://` URL or path starting from `offset`.
+
+    Yields the file, the offset it actually starts from and its total size.
+    """
+    with open(_url_to_path(url), "rb") as f:
+        total = os.fstat(f.fileno()).st_size
+        start = min(offset, total)
+        f.seek(start)
+
+        yield f, start, total
+
+
+TRANSPORTS: Dict[str, Transport] = {
+    "http": _http_open,
+    "https": _http_open,
+    "file": _file_open,
+    "": _file_open,
+}
+
+
+def register_transport(scheme: str, transport: Transport) -> None:
+    """Registers the transport used to fetch the dataset archives
+    by URLs with the given `scheme`.
+
+    Parameters
+    ----------
+    scheme : str
+        URL scheme, e.g. 's3'. The empty scheme is used for plain local paths.
+
+    transport : Callable[[str, int], ContextManager[Tuple[BinaryIO, int, Union[int, None]]]]
+        A function that takes the URL and the offset to start reading from
+        and returns a context manager. It yields a binary file-like object,
+        the offset it actually starts from (0 if the offset is not supported)
+        and the total size of the file or None if it is unknown.
+        It raises FileNotFoundError if there is no file by the URL.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> register_transport("mirror", TRANSPORTS["file"])
+    >>> del TRANSPORTS["mirror"]
+    """
+    TRANSPORTS[scheme.lower()] = transport
+
+    logging.info(f"Register {transport=} for {scheme=}")
+
+
+def _open(url: str, offset: int = 0) -> ContextManager:
+    """Opens the file by `url` starting from `offset` with the matching transport."""
+    scheme = urllib.parse.urlparse(url).scheme.lower()
+
+    if len(scheme) == 1:
+        scheme = ""
+
+    if scheme not in TRANSPORTS:
+        raise ValueError(f"No transport for {scheme=} of {url=}")
+
+    return TRANSPORTS[scheme](url, offset)
@@ -5,6 +5,8 @@ from typing import Union
 
 from pyformlang.cfg import Variable, CFG
 
+from cfpq_data.compression import open_file
+
 __all__ = [
     "cfg_from_text",
     "cfg_to_text",
@@ -118,7 +120,7 @@ def cfg_from_txt(
     ----------
     .. [1] https://en.wikipedia.org/wiki/Context-free_grammar#Formal_definitions
     """
-    with open(path, "r") as f:
+    with open_file(path, "r") as f:
         productions = f.read()
 
     cfg = cfg_from_text(productions, start_symbol=start_symbol)
@@ -156,7 +158,7 @@ def cfg_to_txt(cfg: CFG, path: Union[pathlib.Path, str]) -> pathlib.Path:
     ----------
     .. [1] https://en.wikipedia.org/wiki/Context-free_grammar#Formal_definitions
     """
-    with open(path, "w") as f:
+    with open_file(path, "w") as f:
         f.write(cfg_to_text(cfg))
 
     dest = pathlib.Path(path).resolve()
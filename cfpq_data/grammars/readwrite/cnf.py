@@ -6,6 +6,7 @@ from typing import Union
 
 from pyformlang.cfg import Variable, CFG
 
+from cfpq_data.compression import open_file
 from cfpq_data.grammars.converters.cnf import cnf_from_cfg
 from cfpq_data.grammars.readwrite.cfg import cfg_from_text
 
@@ -82,7 +83,7 @@ def cnf_from_txt(
     ----------
     .. [1] https://en.wikipedia.org/wiki/Chomsky_normal_form
     """
-    with open(path, "r") as f:
+    with open_file(path, "r") as f:
         productions = f.read()
 
     cnf = cnf_from_text(productions, start_symbol=start_symbol)
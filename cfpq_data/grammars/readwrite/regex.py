@@ -5,6 +5,8 @@ from typing import Union
 
 from pyformlang.regular_expression import Regex
 
+from cfpq_data.compression import open_file
+
 __all__ = [
     "regex_from_text",
     "regex_to_text",
@@ -102,7 +104,7 @@ def regex_from_txt(path: Union[pathlib.Path, str]) -> Regex:
     ----------
     .. [1] https://en.wikipedia.org/wiki/Regular_expression#Formal_definition
     """
-    with open(path, "r") as f:
+    with open_file(path, "r") as f:
         expression = f.read()
 
     regex = regex_from_text(expression)
@@ -140,7 +142,7 @@ def regex_to_txt(regex: Regex, path: Union[pathlib.Path, str]) -> pathlib.Path:
     ----------
     .. [1] https://en.wikipedia.org/wiki/Regular_expression#Formal_definition
     """
-    with open(path, "w") as f:
+    with open_file(path, "w") as f:
         f.write(regex_to_text(regex))
 
     dest = pathlib.Path(path).resolve()
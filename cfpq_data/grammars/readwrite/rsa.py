@@ -9,6 +9,8 @@ from pyformlang.finite_automaton.finite_automaton import to_symbol
 from pyformlang.regular_expression import Regex
 from pyformlang.rsa import Box, RecursiveAutomaton as RSA
 
+from cfpq_data.compression import open_file
+
 __all__ = [
     "rsa_from_text",
     "rsa_to_text",
@@ -155,7 +157,7 @@ def rsa_from_txt(
        Lecture Notes in Computer Science, vol 2102.
        Springer, Berlin, Heidelberg. https://doi.org/10.1007/3-540-44585-4_18
     """
-    with open(path, "r") as f:
+    with open_file(path, "r") as f:
         productions = f.read()
 
     rsa = rsa_from_text(productions, start_symbol=start_symbol)
@@ -196,7 +198,7 @@ def rsa_to_txt(rsa: RSA, path: Union[pathlib.Path, str]) -> pathlib.Path:
        Lecture Notes in Computer Science, vol 2102.
        Springer, Berlin, Heidelberg. https://doi.org/10.1007/3-540-44585-4_18
     """
-    with open(path, "w") as f:
+    with open_file(path, "w") as f:
         f.write(rsa_to_text(rsa))
 
     dest = pathlib.Path(path).resolve()
@@ -1,3 +1,4 @@
+from cfpq_data.graphs.edge_list import *
 from cfpq_data.graphs.generators import *
 from cfpq_data.graphs.readwrite import *
 from cfpq_data.graphs.utils import *
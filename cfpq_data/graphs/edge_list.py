@@ -0,0 +1,260 @@
+"""Compact labeled graph backed by numpy arrays."""
+import logging
+from typing import Any, Iterable, Iterator, Tuple, Union
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "BACKENDS",
+    "LabeledEdgeList",
+]
+
+BACKENDS = ("networkx", "edgelist")
+
+
+class LabeledEdgeList:
+    """Directed graph with labeled multiple edges stored as numpy arrays.
+
+    The edge `i` goes from the node `nodes[sources[i]]`
+    to the node `nodes[targets[i]]` and is labeled with `labels[label_codes[i]]`.
+
+    It takes a few bytes per edge instead of the nested dictionaries
+    of `MultiDiGraph`, so the largest dataset graphs fit into memory.
+
+    Parameters
+    ----------
+    nodes : ndarray
+        The names of the nodes.
+
+    labels : ndarray
+        The names of the labels.
+
+    sources : ndarray
+        The codes of the source nodes of the edges.
+
+    targets : ndarray
+        The codes of the target nodes of the edges.
+
+    label_codes : ndarray
+        The codes of the labels of the edges.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> g = LabeledEdgeList.from_edges([(1, 2, "a"), (2, 1, "b")])
+    >>> g.number_of_nodes(), g.number_of_edges()
+    (2, 2)
+    >>> list(g.edges())
+    [(1, 2, 'a'), (2, 1, 'b')]
+    >>> list(g.to_networkx().edges(data=True))
+    [(1, 2, {'label': 'a'}), (2, 1, {'label': 'b'})]
+    """
+
+    __slots__ = ("nodes", "labels", "sources", "targets", "label_codes")
+
+    def __init__(
+        self,
+        nodes: np.ndarray,
+        labels: np.ndarray,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        label_codes: np.ndarray,
+    ):
+        if not len(sources) == len(targets) == len(label_codes):
+            raise ValueError(
+                f"Edges with {len(sources)} sources, {len(targets)} targets "
+                f"and {len(label_codes)} labels do not match"
+            )
+
+        self.nodes = np.asarray(nodes)
+        self.labels = np.asarray(labels)
+        self.sources = np.asarray(sources)
+        self.targets = np.asarray(targets)
+        self.label_codes = np.asarray(label_codes)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__} with {self.number_of_nodes()} nodes, "
+            f"{self.number_of_edges()} edges and {len(self.labels)} labels"
+        )
+
+    def __len__(self) -> int:
+        return self.number_of_edges()
+
+    def number_of_nodes(self) -> int:
+        """Returns the number of nodes."""
+        return len(self.nodes)
+
+    def number_of_edges(self) -> int:
+        """Returns the number of edges."""
+        return len(self.sources)
+
+    def edges(self) -> Iterator[Tuple[Any, Any, Any]]:
+        """Returns an iterator over the edges as (source, target, label) triples."""
+        nodes = self.nodes.tolist()
+        labels = self.labels.tolist()
+
+        for u, v, e in zip(
+            self.sources.tolist(), self.targets.tolist(), self.label_codes.tolist()
+        ):
+            yield nodes[u], nodes[v], labels[e]
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[Tuple[Any, Any, Any]],
+        *,
+        nodes: Union[Iterable[Any], None] = None,
+    ) -> "LabeledEdgeList":
+        """Returns the graph with the given (source, target, label) `edges`.
+
+        The nodes are numbered in the order of their first appearance
+        after the given `nodes` if any.
+        """
+        edges = list(edges)
+        nodes = list(nodes) if nodes is not None else []
+
+        ends = pd.Series(
+            nodes + [node for u, v, _ in edges for node in (u, v)], dtype=object
+        )
+        node_codes, node_names = pd.factorize(ends, use_na_sentinel=False)
+        node_codes = node_codes[len(nodes) :]
+
+        label_codes, label_names = _factorize_labels(
+            pd.Series([e for _, _, e in edges], dtype=object)
+        )
+
+        return cls(
+            _names_array(node_names),
+            label_names,
+            node_codes[0::2],
+            node_codes[1::2],
+            label_codes,
+        )
+
+    @classmethod
+    def from_networkx(cls, graph: nx.MultiDiGraph) -> "LabeledEdgeList":
+        """Returns the graph with the nodes and the labeled edges of `graph`."""
+        edge_list = cls.from_edges(graph.edges(data="label"), nodes=graph.nodes)
+
+        logging.info(f"Convert {graph=} to {edge_list=}")
+
+        return edge_list
+
+    def to_networkx(self) -> nx.MultiDiGraph:
+        """Returns the `MultiDiGraph` with the same nodes and labeled edges."""
+        graph = nx.MultiDiGraph()
+        graph.add_nodes_from(self.nodes.tolist())
+        graph.add_edges_from((u, v, {"label": e}) for u, v, e in self.edges())
+
+        logging.info(f"Convert {self=} to {graph=}")
+
+        return graph
+
+
+def _names_array(names: Any) -> np.ndarray:
+    """Returns the array of node or label `names` keeping their types."""
+    if isinstance(names, (np.ndarray, pd.Index)):
+        array = np.asarray(names)
+    else:
+        # np.asarray would format the mixed names, e.g. 1 and "x", as strings.
+        array = np.fromiter(names, dtype=object)
+
+    if array.dtype.kind in "iu":
+        return array.astype(np.int64, copy=False)
+
+    if array.dtype.kind == "U":
+        return array
+
+    names = array.tolist()
+
+    if names and all(type(name) is int for name in names):
+        return np.array(names, dtype=np.int64)
+
+    if names and all(type(name) is str for name in names):
+        return np.array(names, dtype=np.str_)
+
+    array = np.empty(len(names), dtype=object)
+    array[:] = names
+    return array
+
+
+def _factorize_labels(labels: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the codes of the edge `labels` and the array of the distinct labels.
+
+    The missing labels (None or NaN) are not coded,
+    so that the edges without labels are not mixed up with the other edges.
+    """
+    codes, names = pd.factorize(labels)
+    missing = np.flatnonzero(codes < 0)
+
+    if len(missing) > 0:
+        raise ValueError(
+            f"{len(missing)} edges have no labels, the first one is edge {missing[0]}"
+        )
+
+    return codes, _names_array(names)
+
+
+def _edge_list_from_frame(data: pd.DataFrame) -> LabeledEdgeList:
+    """Returns the graph with the edges from the `from`, `to`
+    and `label` columns of `data`."""
+    node_codes, nodes = pd.factorize(
+        np.column_stack([data["from"].to_numpy(), data["to"].to_numpy()]).ravel(),
+        use_na_sentinel=False,
+    )
+    label_codes, labels = _factorize_labels(data["label"])
+
+    return LabeledEdgeList(
+        _names_array(nodes),
+        labels,
+        node_codes[0::2],
+        node_codes[1::2],
+        label_codes,
+    )
+
+
+def _named_edges(
+    graph: Union[nx.MultiDiGraph, LabeledEdgeList]
+) -> Iterator[Tuple[str, str, str]]:
+    """Returns an iterator over the (source, target, label) edges of `graph`
+    formatted as strings, each node and label is formatted only once.
+
+    The edge of `MultiDiGraph` is repeated for each value of its attributes.
+    """
+    if isinstance(graph, LabeledEdgeList):
+        nodes = [f"{node}" for node in graph.nodes.tolist()]
+        labels = [f"{label}" for label in graph.labels.tolist()]
+
+        for u, v, e in zip(
+            graph.sources.tolist(), graph.targets.tolist(), graph.label_codes.tolist()
+        ):
+            yield nodes[u], nodes[v], labels[e]
+
+        return
+
+    nodes = {node: f"{node}" for node in graph.nodes}
+
+    for u, v, edge_labels in graph.edges(data=True):
+        for label in edge_labels.values():
+            yield nodes[u], nodes[v], f"{label}"
+
+
+def _as_backend(
+    graph: nx.MultiDiGraph, backend: str
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
+    """Returns the `graph` as the graph of the given `backend`."""
+    _check_backend(backend)
+
+    if backend == "edgelist":
+        return LabeledEdgeList.from_networkx(graph)
+
+    return graph
+
+
+def _check_backend(backend: str) -> None:
+    """Checks that `backend` is one of `BACKENDS`."""
+    if backend not in BACKENDS:
+        raise ValueError(f"{backend=} is not one of {BACKENDS=}")
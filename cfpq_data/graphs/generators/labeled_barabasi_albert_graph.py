@@ -10,6 +10,8 @@ from typing import List, Union, Callable
 
 import networkx as nx
 
+from cfpq_data.graphs.edge_list import LabeledEdgeList, _as_backend
+
 __all__ = ["labeled_barabasi_albert_graph"]
 
 
@@ -20,7 +22,8 @@ def labeled_barabasi_albert_graph(
     labels: List[str] = "abcd",
     choice: Callable[[List[str]], str] = random.choice,
     seed: Union[int, None] = None,
-) -> nx.MultiDiGraph:
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
     """Returns a random graph according to the Barabási–Albert preferential attachment model.
     With labeled edges.
 
@@ -44,6 +47,10 @@ def labeled_barabasi_albert_graph(
     seed : Union[int, RandomState, None]
         Indicator of random number generation state.
 
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -55,7 +62,7 @@ def labeled_barabasi_albert_graph(
 
     Returns
     -------
-    g : MultiDiGraph
+    g : Union[MultiDiGraph, LabeledEdgeList]
         A random graph according to the Barabási–Albert preferential attachment model.
 
     Raises
@@ -82,4 +89,4 @@ def labeled_barabasi_albert_graph(
         f"with {n=}, {m=}, {labels=}, {choice=}, {seed=}"
     )
 
-    return graph
+    return _as_backend(graph, backend)
@@ -7,6 +7,8 @@ from typing import Union, List, Callable
 
 import networkx as nx
 
+from cfpq_data.graphs.edge_list import LabeledEdgeList, _as_backend
+
 __all__ = ["labeled_binomial_graph"]
 
 
@@ -17,7 +19,8 @@ def labeled_binomial_graph(
     labels: List[str] = "a",
     choice: Callable[[List[str]], str] = random.choice,
     seed: Union[int, None] = None,
-) -> nx.MultiDiGraph:
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
     """Returns a $G_{n,p}$ random graph, also known as an Erdős-Rényi graph or
     a binomial graph. With labeled edges.
 
@@ -40,6 +43,10 @@ def labeled_binomial_graph(
     seed : integer, random_state, or None (default)
         Indicator of random number generation state.
 
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -51,7 +58,7 @@ def labeled_binomial_graph(
 
     Returns
     -------
-    g : MultiDiGraph
+    g : Union[MultiDiGraph, LabeledEdgeList]
         An Erdős-Rényi graph random graph.
 
     Notes
@@ -77,4 +84,4 @@ def labeled_binomial_graph(
         f"with {n=}, {p=}, {labels=}, {choice=}, {seed=}"
     )
 
-    return graph
+    return _as_backend(graph, backend)
@@ -7,13 +7,17 @@ from typing import Union, Iterable, Any
 
 import networkx as nx
 
+from cfpq_data.graphs.edge_list import LabeledEdgeList, _as_backend
+
 __all__ = ["labeled_cycle_graph"]
 
 
 def labeled_cycle_graph(
     n: Union[int, Iterable[Any]],
     label: str = "a",
-) -> nx.MultiDiGraph:
+    *,
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
     """Returns a cycle graph $C_n$ of cyclically connected nodes.
     With labeled edges.
 
@@ -28,6 +32,10 @@ def labeled_cycle_graph(
     label: str
         Label that will be used to mark the edges of the graph.
 
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -39,7 +47,7 @@ def labeled_cycle_graph(
 
     Returns
     -------
-    g : MultiDiGraph
+    g : Union[MultiDiGraph, LabeledEdgeList]
         A cycle graph $C_n$.
     """
     graph = nx.cycle_graph(n=n, create_using=nx.MultiDiGraph)
@@ -49,4 +57,4 @@ def labeled_cycle_graph(
 
     logging.info(f"Create a cycle {graph=} with {n=}, {label=}")
 
-    return graph
+    return _as_backend(graph, backend)
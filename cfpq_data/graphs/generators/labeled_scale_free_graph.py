@@ -5,6 +5,8 @@ from typing import Union, Iterable, Callable
 
 import networkx as nx
 
+from cfpq_data.graphs.edge_list import LabeledEdgeList, _as_backend
+
 __all__ = ["labeled_scale_free_graph"]
 
 
@@ -19,7 +21,8 @@ def labeled_scale_free_graph(
     labels: Iterable[str] = "abcd",
     choice: Callable[[Iterable[str]], str] = random.choice,
     seed: Union[int, None] = None,
-) -> nx.MultiDiGraph:
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
     """Returns a scale-free directed graph. With labeled edges.
 
     Parameters
@@ -56,6 +59,10 @@ def labeled_scale_free_graph(
     seed : integer, random_state, or None (default)
         Indicator of random number generation state.
 
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -67,7 +74,7 @@ def labeled_scale_free_graph(
 
     Returns
     -------
-    g : MultiDiGraph
+    g : Union[MultiDiGraph, LabeledEdgeList]
         A scale-free directed graph.
 
     Notes
@@ -103,4 +110,4 @@ def labeled_scale_free_graph(
         f"{labels=}, {choice=}, {seed=}"
     )
 
-    return graph
+    return _as_backend(graph, backend)
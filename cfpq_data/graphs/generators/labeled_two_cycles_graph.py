@@ -4,6 +4,8 @@ from typing import Union, Iterable, Any, Tuple
 
 import networkx as nx
 
+from cfpq_data.graphs.edge_list import LabeledEdgeList, _as_backend
+
 __all__ = ["labeled_two_cycles_graph"]
 
 
@@ -13,7 +15,8 @@ def labeled_two_cycles_graph(
     *,
     common_node: Union[int, Any] = 0,
     labels: Tuple[str, str] = ("a", "b"),
-) -> nx.MultiDiGraph:
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
     """Returns a graph with two cycles connected by one node. With labeled edges.
 
     Parameters
@@ -34,6 +37,10 @@ def labeled_two_cycles_graph(
     labels: Tuple[str, str]
         Labels that will be used to mark the edges of the graph.
 
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -45,7 +52,7 @@ def labeled_two_cycles_graph(
 
     Returns
     -------
-    g : MultiDiGraph
+    g : Union[MultiDiGraph, LabeledEdgeList]
         A graph with two cycles connected by one node.
     """
     g1 = nx.path_graph(n=n, create_using=nx.MultiDiGraph)
@@ -81,4 +88,4 @@ def labeled_two_cycles_graph(
         f"with {n=}, {m=}, {common_node=}, {labels=}"
     )
 
-    return graph
+    return _as_backend(graph, backend)
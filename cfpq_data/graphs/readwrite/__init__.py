@@ -1,3 +1,5 @@
 from cfpq_data.graphs.readwrite.rdf import *
 from cfpq_data.graphs.readwrite.txt import *
 from cfpq_data.graphs.readwrite.csv import *
+from cfpq_data.graphs.readwrite.npz import *
+from cfpq_data.graphs.readwrite.arrow import *
@@ -0,0 +1,384 @@
+"""Read (and write) a graph from (and to) Parquet and Arrow IPC (Feather) files."""
+import logging
+import pathlib
+from typing import Any, Iterable, List, Union
+
+import networkx as nx
+import numpy as np
+
+from cfpq_data.graphs.edge_list import LabeledEdgeList, _check_backend
+from cfpq_data.graphs.readwrite.csv import _graph_from_frame
+from cfpq_data.graphs.readwrite.npz import _stored_names
+
+__all__ = [
+    "graph_from_feather",
+    "graph_from_parquet",
+    "graph_to_feather",
+    "graph_to_parquet",
+    "load_feather_table",
+    "load_parquet_table",
+]
+
+EDGE_COLUMNS = ("from", "to", "label")
+
+ROW_GROUP_SIZE = 1 << 20
+
+
+def _pyarrow():
+    """Returns `pyarrow` which is an optional dependency."""
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.dataset
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Arrow IPC files require pyarrow, "
+            "install it with `pip install pyarrow`"
+        ) from e
+
+    return pyarrow
+
+
+def _dictionary_array(codes: np.ndarray, names: List[str]) -> Any:
+    """Returns the dictionary-encoded array of the `names` by their `codes`."""
+    pa = _pyarrow()
+
+    index_type = pa.int32() if len(names) <= np.iinfo(np.int32).max else pa.int64()
+
+    return pa.DictionaryArray.from_arrays(
+        pa.array(codes, type=index_type), pa.array(names, type=pa.string())
+    )
+
+
+def _edge_table(graph: Union[nx.MultiDiGraph, LabeledEdgeList]) -> Any:
+    """Returns the table of the edges of `graph` sorted by labels and sources
+    with the `label` column dictionary-encoded by the sorted labels and the `from` and `to` columns
+    of the nodes which are integers if all nodes are integers
+    and dictionary-encoded strings otherwise."""
+    pa = _pyarrow()
+
+    if not isinstance(graph, LabeledEdgeList):
+        graph = LabeledEdgeList.from_networkx(graph)
+
+    labels = [f"{label}" for label in _stored_names(graph.labels).tolist()]
+    ranks = np.empty(len(labels), dtype=np.int64)
+    ranks[np.argsort(np.array(labels, dtype=np.str_), kind="stable")] = np.arange(
+        len(labels)
+    )
+    label_codes = ranks[graph.label_codes]
+
+    order = np.lexsort((graph.sources, label_codes))
+    sources = graph.sources[order]
+    targets = graph.targets[order]
+
+    nodes = _stored_names(graph.nodes)
+
+    if nodes.dtype.kind == "i":
+        from_column = pa.array(nodes[sources], type=pa.int64())
+        to_column = pa.array(nodes[targets], type=pa.int64())
+    else:
+        nodes = nodes.tolist()
+        from_column = _dictionary_array(sources, nodes)
+        to_column = _dictionary_array(targets, nodes)
+
+    label_column = _dictionary_array(label_codes[order], sorted(labels))
+
+    return pa.table([from_column, to_column, label_column], names=list(EDGE_COLUMNS))
+
+
+def _label_filter(labels: Iterable[Any]) -> Any:
+    """Returns the expression selecting the edges with the given `labels`."""
+    pa = _pyarrow()
+
+    return pa.compute.field("label").isin(
+        pa.array([f"{label}" for label in labels], type=pa.string())
+    )
+
+
+def _graph_from_table(
+    table: Any, backend: str
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
+    """Returns the graph with the edges from the table of `load_parquet_table`."""
+    return _graph_from_frame(table.to_pandas(), backend)
+
+
+def graph_to_parquet(
+    graph: Union[nx.MultiDiGraph, LabeledEdgeList],
+    path: Union[pathlib.Path, str],
+    *,
+    row_group_size: int = ROW_GROUP_SIZE,
+) -> pathlib.Path:
+    """Saves the `graph` to the Parquet file by `path`.
+
+    The edges are sorted by labels, so the row groups
+    of the file with other labels are skipped by `load_parquet_table`.
+    The labels are dictionary-encoded strings, the nodes are
+    integers if all of them are integers and dictionary-encoded strings otherwise.
+    The nodes or the labels formatted the same, e.g. 1 and "1", cannot be stored.
+
+    Parameters
+    ----------
+    graph : Union[MultiDiGraph, LabeledEdgeList]
+        Graph to save.
+
+    path : Union[Path, str]
+        The path to the Parquet file where the graph will be saved.
+
+    row_group_size : int
+        The maximum number of edges in one row group.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> g = labeled_two_cycles_graph(42, 29, labels=("a", "b"))
+    >>> path = graph_to_parquet(g, "test.parquet")
+
+    Returns
+    -------
+    path : Path
+        Path to the Parquet file where the graph will be saved.
+    """
+    pa = _pyarrow()
+
+    table = _edge_table(graph)
+    dest = pathlib.Path(path).resolve()
+
+    pa.parquet.write_table(table, dest, row_group_size=row_group_size)
+
+    logging.info(f"Save {graph=} to {dest=} with {row_group_size=}")
+
+    return dest
+
+
+def load_parquet_table(
+    path: Union[pathlib.Path, str],
+    *,
+    columns: Union[Iterable[str], None] = None,
+    labels: Union[Iterable[Any], None] = None,
+) -> Any:
+    """Loads the table of the edges of the graph from Parquet file.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the Parquet file with the graph.
+
+    columns : Union[Iterable[str], None]
+        The columns to be loaded from `from`, `to` and `label` or None for all.
+        The other columns are not read.
+
+    labels : Union[Iterable[Any], None]
+        The labels of the edges to be loaded or None for all edges.
+        The row groups without these labels are not read.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> g = labeled_two_cycles_graph(42, 29, labels=("a", "b"))
+    >>> path = graph_to_parquet(g, "test.parquet")
+    >>> table = load_parquet_table(path, columns=["from"], labels=["b"])
+    >>> table.column_names, table.num_rows
+    (['from'], 30)
+
+    Returns
+    -------
+    table : pyarrow.Table
+        The table of the edges with the given columns.
+    """
+    pa = _pyarrow()
+
+    columns = list(EDGE_COLUMNS if columns is None else columns)
+    filters = None if labels is None else _label_filter(labels)
+
+    table = pa.parquet.read_table(path, columns=columns, filters=filters)
+
+    logging.info(f"Load table of {table.num_rows} edges from {path=} with {columns=}")
+
+    return table
+
+
+def graph_from_parquet(
+    path: Union[pathlib.Path, str],
+    *,
+    labels: Union[Iterable[Any], None] = None,
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
+    """Loads a graph from Parquet file.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the Parquet file with which the graph will be created.
+
+    labels : Union[Iterable[Any], None]
+        The labels of the edges to be loaded or None for all edges.
+        The row groups without these labels are not read.
+
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> g = labeled_two_cycles_graph(42, 29, labels=("a", "b"))
+    >>> path = graph_to_parquet(g, "test.parquet")
+    >>> graph_from_parquet(path).number_of_edges()
+    73
+    >>> graph_from_parquet(path, labels=["a"]).number_of_edges()
+    43
+
+    Returns
+    -------
+    g : Union[MultiDiGraph, LabeledEdgeList]
+        Loaded graph.
+    """
+    _check_backend(backend)
+
+    graph = _graph_from_table(load_parquet_table(path, labels=labels), backend)
+
+    logging.info(f"Load {graph=} from {path=} with {labels=}")
+
+    return graph
+
+
+def graph_to_feather(
+    graph: Union[nx.MultiDiGraph, LabeledEdgeList],
+    path: Union[pathlib.Path, str],
+    *,
+    compression: Union[str, None] = "lz4",
+) -> pathlib.Path:
+    """Saves the `graph` to the Arrow IPC (Feather) file by `path`.
+
+    The edges are stored as by `graph_to_parquet`.
+
+    Parameters
+    ----------
+    graph : Union[MultiDiGraph, LabeledEdgeList]
+        Graph to save.
+
+    path : Union[Path, str]
+        The path to the Feather file where the graph will be saved.
+
+    compression : Union[str, None]
+        The compression of the file: "lz4", "zstd" or None for uncompressed
+        file which columns are memory-mapped by `load_feather_table`.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> g = labeled_two_cycles_graph(42, 29, labels=("a", "b"))
+    >>> path = graph_to_feather(g, "test.feather")
+
+    Returns
+    -------
+    path : Path
+        Path to the Feather file where the graph will be saved.
+    """
+    pa = _pyarrow()
+
+    table = _edge_table(graph)
+    dest = pathlib.Path(path).resolve()
+
+    pa.feather.write_feather(
+        table, dest, compression="uncompressed" if compression is None else compression
+    )
+
+    logging.info(f"Save {graph=} to {dest=} with {compression=}")
+
+    return dest
+
+
+def load_feather_table(
+    path: Union[pathlib.Path, str],
+    *,
+    columns: Union[Iterable[str], None] = None,
+    labels: Union[Iterable[Any], None] = None,
+) -> Any:
+    """Loads the table of the edges of the graph from Arrow IPC (Feather) file.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the Feather file with the graph.
+
+    columns : Union[Iterable[str], None]
+        The columns to be loaded from `from`, `to` and `label` or None for all.
+        The other columns are not read.
+
+    labels : Union[Iterable[Any], None]
+        The labels of the edges to be loaded or None for all edges.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> g = labeled_two_cycles_graph(42, 29, labels=("a", "b"))
+    >>> path = graph_to_feather(g, "test.feather")
+    >>> table = load_feather_table(path, columns=["from"], labels=["b"])
+    >>> table.column_names, table.num_rows
+    (['from'], 30)
+
+    Returns
+    -------
+    table : pyarrow.Table
+        The table of the edges with the given columns.
+    """
+    pa = _pyarrow()
+
+    columns = list(EDGE_COLUMNS if columns is None else columns)
+
+    if labels is None:
+        table = pa.feather.read_table(path, columns=columns, memory_map=True)
+    else:
+        table = pa.feather.read_table(
+            path, columns=list(dict.fromkeys(columns + ["label"])), memory_map=True
+        )
+        table = table.filter(_label_filter(labels)).select(columns)
+
+    logging.info(f"Load table of {table.num_rows} edges from {path=} with {columns=}")
+
+    return table
+
+
+def graph_from_feather(
+    path: Union[pathlib.Path, str],
+    *,
+    labels: Union[Iterable[Any], None] = None,
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
+    """Loads a graph from Arrow IPC (Feather) file.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the Feather file with which the graph will be created.
+
+    labels : Union[Iterable[Any], None]
+        The labels of the edges to be loaded or None for all edges.
+
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> g = labeled_two_cycles_graph(42, 29, labels=("a", "b"))
+    >>> path = graph_to_feather(g, "test.feather")
+    >>> graph_from_feather(path).number_of_edges()
+    73
+
+    Returns
+    -------
+    g : Union[MultiDiGraph, LabeledEdgeList]
+        Loaded graph.
+    """
+    _check_backend(backend)
+
+    graph = _graph_from_table(load_feather_table(path, labels=labels), backend)
+
+    logging.info(f"Load {graph=} from {path=} with {labels=}")
+
+    return graph
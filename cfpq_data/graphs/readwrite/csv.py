@@ -1,18 +1,108 @@
 """Read (and write) a graph from (and to) CSV file."""
+import itertools
 import logging
 import pathlib
-from typing import Union
+from typing import Any, Dict, Iterable, Iterator, Set, Union
 
 import networkx as nx
 import pandas as pd
 
+from cfpq_data.compression import open_file
+from cfpq_data.graphs.edge_list import (
+    LabeledEdgeList,
+    _check_backend,
+    _edge_list_from_frame,
+    _named_edges,
+)
+
 __all__ = [
     "graph_from_csv",
     "graph_to_csv",
+    "iter_edges_csv",
 ]
 
+EDGES_CHUNK_SIZE = 1 << 20
+
+WRITE_BLOCK_SIZE = 1 << 16
+
+
+def _read_csv(path: Union[pathlib.Path, str], **kwargs) -> pd.DataFrame:
+    """Reads the edges of the graph from CSV file by `path` with `pd.read_csv`.
+
+    Only the empty fields are missing values, so the nodes
+    and the labels such as `NA` or `null` are read as they are.
+    """
+    return pd.read_csv(
+        filepath_or_buffer=path,
+        sep=" ",
+        header=None,
+        names=["from", "to", "label"],
+        engine="c",
+        keep_default_na=False,
+        na_values=[""],
+        **kwargs,
+    )
+
+
+def _read_csv_labels(path: Union[pathlib.Path, str], labels: Set[str]) -> pd.DataFrame:
+    """Reads the edges with the given `labels` from CSV file by `path` by chunks.
+
+    The columns are read as strings, so the labels are compared as strings.
+    The node columns are converted to numbers once after reading
+    if all their values in the file are numbers, so the nodes
+    are of the same types as if the whole file were read at once.
+    """
+    numeric = {"from": True, "to": True}
+    missing = {"from": False, "to": False}
+    chunks = []
+
+    for chunk in iter_edges_csv(
+        path, chunksize=EDGES_CHUNK_SIZE, dtype={"from": str, "to": str, "label": str}
+    ):
+        for column in numeric:
+            values = chunk[column].dropna()
+            missing[column] |= len(values) < len(chunk)
+            numeric[column] &= bool(
+                pd.to_numeric(values, errors="coerce").notna().all()
+            )
+
+        chunks.append(chunk[chunk["label"].isin(labels)])
 
-def graph_from_csv(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
+    data = pd.concat(chunks, ignore_index=True)
+
+    for column in numeric:
+        if numeric[column]:
+            data[column] = pd.to_numeric(data[column])
+
+            if missing[column]:
+                data[column] = data[column].astype(float)
+
+    return data
+
+
+def _graph_from_frame(
+    data: pd.DataFrame, backend: str
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
+    """Returns the graph with the edges from the `from`, `to`
+    and `label` columns of `data`."""
+    if backend == "edgelist":
+        return _edge_list_from_frame(data)
+
+    return nx.from_pandas_edgelist(
+        df=data,
+        source="from",
+        target="to",
+        edge_attr="label",
+        create_using=nx.MultiDiGraph,
+    )
+
+
+def graph_from_csv(
+    path: Union[pathlib.Path, str],
+    *,
+    labels: Union[Iterable[Any], None] = None,
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
     """Loads a graph from CSV file.
 
     Parameters
@@ -21,6 +111,16 @@ def graph_from_csv(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
         The path to the CSV file with which
         the graph will be created.
 
+    labels : Union[Iterable[Any], None]
+        The labels of the edges to be loaded or None for all edges.
+        The other edges are skipped while parsing, so the nodes
+        incident only to them are not added to the graph.
+        The labels are compared and loaded as strings, e.g. 1 and "1" are the same.
+
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -30,41 +130,40 @@ def graph_from_csv(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
     129
     >>> g.number_of_edges()
     273
+    >>> graph_from_csv(p, labels=["type"]).number_of_edges()
+    78
 
     Returns
     -------
-    g : MultiDiGraph
+    g : Union[MultiDiGraph, LabeledEdgeList]
         Loaded graph.
     """
-    data = pd.read_csv(
-        filepath_or_buffer=path,
-        sep=" ",
-        header=None,
-        names=["from", "to", "label"],
-        engine="c",
-    )
+    _check_backend(backend)
 
-    graph = nx.from_pandas_edgelist(
-        df=data,
-        source="from",
-        target="to",
-        edge_attr="label",
-        create_using=nx.MultiDiGraph,
-    )
+    if labels is None:
+        data = _read_csv(path)
+    else:
+        labels = {f"{label}" for label in labels}
+        data = _read_csv_labels(path, labels)
+
+    graph = _graph_from_frame(data, backend)
 
-    logging.info(f"Load {graph=} from {path=}")
+    logging.info(f"Load {graph=} from {path=} with {labels=}")
 
     return graph
 
 
 def graph_to_csv(
-    graph: nx.MultiDiGraph, path: Union[pathlib.Path, str]
+    graph: Union[nx.MultiDiGraph, LabeledEdgeList], path: Union[pathlib.Path, str]
 ) -> pathlib.Path:
     """Saves the `graph` to the CSV file by `path`.
 
+    The edges are formatted and written by blocks
+    and each node is formatted only once.
+
     Parameters
     ----------
-    graph : MultiDiGraph
+    graph : Union[MultiDiGraph, LabeledEdgeList]
         Graph to save.
 
     path : Union[Path, str]
@@ -82,13 +181,62 @@ def graph_to_csv(
     path : Path
         Path to the CSV file where the graph will be saved.
     """
-    with open(file=path, mode="w") as f:
-        for u, v, edge_labels in graph.edges(data=True):
-            for e in edge_labels.values():
-                f.write(f"{u} {v} {e}\n")
+    edges = _named_edges(graph)
+
+    with open_file(path, "w") as f:
+        while True:
+            block = list(itertools.islice(edges, WRITE_BLOCK_SIZE))
+
+            if not block:
+                break
+
+            f.write("".join([f"{u} {v} {e}\n" for u, v, e in block]))
 
     dest = pathlib.Path(path).resolve()
 
     logging.info(f"Save {graph=} to {dest=}")
 
     return dest
+
+
+def iter_edges_csv(
+    path: Union[pathlib.Path, str],
+    *,
+    chunksize: int = EDGES_CHUNK_SIZE,
+    dtype: Union[Dict[str, Any], None] = None,
+) -> Iterator[pd.DataFrame]:
+    """Returns an iterator over the edges of the graph from CSV file
+    read by chunks, so only one chunk of the edges is in memory at once.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the CSV file with the graph.
+
+    chunksize : int
+        The maximum number of edges in one chunk.
+
+    dtype : Union[Dict[str, Any], None]
+        The types of the columns, e.g. `{"label": str}`,
+        the types of the other columns are inferred for each chunk separately.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> p = download("generations")
+    >>> [len(chunk) for chunk in iter_edges_csv(p, chunksize=100)]
+    [100, 100, 73]
+
+    Returns
+    -------
+    chunks : Iterator[DataFrame]
+        The chunks of the edges with the `from`, `to` and `label` columns.
+    """
+    chunks = 0
+
+    with _read_csv(path, chunksize=chunksize, dtype=dtype) as reader:
+        for chunk in reader:
+            chunks += 1
+            yield chunk
+
+    logging.info(f"Read {chunks} chunks of edges from {path=} with {chunksize=}")
@@ -0,0 +1,371 @@
+"""Read (and write) a graph from (and to) binary NPZ file with label-partitioned CSR arrays."""
+import io
+import logging
+import pathlib
+import struct
+import zipfile
+from typing import Any, Dict, Union
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from cfpq_data.compression import compression_of, open_file
+from cfpq_data.graphs.edge_list import (
+    LabeledEdgeList,
+    _check_backend,
+    _edge_list_from_frame,
+    _factorize_labels,
+    _names_array,
+)
+from cfpq_data.graphs.readwrite.csv import _read_csv
+
+__all__ = [
+    "graph_from_npz",
+    "graph_to_npz",
+    "load_npz_arrays",
+]
+
+NPZ_ARRAYS = (
+    "nodes",
+    "labels",
+    "label_indptr",
+    "rows",
+    "indptr",
+    "indices",
+    "label_codes",
+)
+
+
+def _stored_names(names: Any) -> np.ndarray:
+    """Returns the array of node or label `names` to be stored,
+    they are stored as integers if all of them are integers
+    and as strings otherwise."""
+    array = _names_array(names)
+
+    if array.dtype.kind != "O":
+        return array
+
+    formatted = [f"{name}" for name in array.tolist()]
+
+    if len(set(formatted)) < len(formatted):
+        raise ValueError(
+            f"{len(formatted) - len(set(formatted))} names cannot be stored "
+            "since they are formatted the same as other names, e.g. 1 and '1'"
+        )
+
+    return np.array(formatted, dtype=np.str_)
+
+
+def _codes_dtype(size: int) -> np.dtype:
+    """Returns the smallest unsigned integer type for the codes less than `size`."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if size <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+    return np.dtype(np.uint64)
+
+
+def _save_npz(
+    path: Union[pathlib.Path, str],
+    *,
+    nodes: np.ndarray,
+    labels: np.ndarray,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    label_codes: np.ndarray,
+) -> pathlib.Path:
+    """Saves the edges given by the codes of their nodes and labels
+    to NPZ file as the CSR arrays partitioned by labels.
+
+    The edges are sorted by labels and then by sources keeping
+    their order otherwise. For each label `l` the non-empty rows
+    `rows[label_indptr[l]:label_indptr[l + 1]]` are stored, the edges
+    of the row `r` are `indices[indptr[r]:indptr[r + 1]]`.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    label_codes = np.asarray(label_codes, dtype=np.int64)
+
+    order = np.lexsort((sources, label_codes))
+    sources = sources[order]
+    targets = targets[order]
+    label_codes = label_codes[order]
+
+    starts = np.ones(len(order), dtype=bool)
+    starts[1:] = (label_codes[1:] != label_codes[:-1]) | (sources[1:] != sources[:-1])
+    starts = np.flatnonzero(starts)
+
+    node_dtype = _codes_dtype(len(nodes))
+    edge_dtype = _codes_dtype(len(order))
+
+    arrays = dict(
+        nodes=nodes,
+        labels=labels,
+        label_indptr=np.searchsorted(
+            label_codes[starts], np.arange(len(labels) + 1)
+        ).astype(edge_dtype),
+        rows=sources[starts].astype(node_dtype),
+        indptr=np.append(starts, len(order)).astype(edge_dtype),
+        indices=targets.astype(node_dtype),
+        label_codes=label_codes.astype(_codes_dtype(len(labels))),
+    )
+
+    if compression_of(path) is None:
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+    else:
+        # Zip archive is written with seeks, so it is compressed as a whole.
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+
+        with open_file(path, "wb") as f:
+            f.write(buffer.getbuffer())
+
+    return pathlib.Path(path).resolve()
+
+
+def _csv_to_npz(
+    source: Union[pathlib.Path, str], path: Union[pathlib.Path, str]
+) -> pathlib.Path:
+    """Converts the graph from CSV file by `source` to NPZ file by `path`
+    without loading it as a networkx graph."""
+    edge_list = _edge_list_from_frame(_read_csv(source))
+
+    dest = _save_npz(
+        path,
+        nodes=_stored_names(edge_list.nodes),
+        labels=_stored_names(edge_list.labels),
+        sources=edge_list.sources,
+        targets=edge_list.targets,
+        label_codes=edge_list.label_codes,
+    )
+
+    logging.info(f"Convert graph from {source=} to {dest=}")
+
+    return dest
+
+
+def _mmap_npy(path: Union[pathlib.Path, str], offset: int) -> np.ndarray:
+    """Maps the NPY array stored in the file by `path` from `offset` to memory."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        version = np.lib.format.read_magic(f)
+
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+
+        offset = f.tell()
+
+    if dtype.hasobject:
+        raise ValueError(f"Array with {dtype=} from {path=} cannot be mapped")
+
+    if 0 in shape:
+        return np.empty(shape, dtype=dtype)
+
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=offset,
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def load_npz_arrays(
+    path: Union[pathlib.Path, str], *, mmap: bool = True
+) -> Dict[str, np.ndarray]:
+    """Loads the label-partitioned CSR arrays of the graph from NPZ file.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the NPZ file with the graph.
+
+    mmap : bool
+        If true, the arrays are memory-mapped read-only instead of being read,
+        so loading does not depend on the size of the graph
+        and the processes loading the same file share its pages.
+        The compressed files, e.g. `graph.npz.gz`, are always read.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> p = download("generations", materialize="binary")
+    >>> arrays = load_npz_arrays(p)
+    >>> len(arrays["nodes"]), len(arrays["indices"])
+    (129, 273)
+
+    Returns
+    -------
+    arrays : Dict[str, ndarray]
+        The node names (`nodes`), the label names (`labels`),
+        the offsets of the rows of each label (`label_indptr`),
+        the source node codes of the rows (`rows`), the offsets
+        of the edges of each row (`indptr`), the target node codes
+        of the edges (`indices`) and the label codes of the edges (`label_codes`).
+    """
+    if compression_of(path) is not None:
+        # Zip archive is read with seeks, so it is decompressed as a whole.
+        with open_file(path, "rb") as f:
+            buffer = io.BytesIO(f.read())
+
+        with np.load(buffer, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in NPZ_ARRAYS}
+    elif not mmap:
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in NPZ_ARRAYS}
+    else:
+        arrays = dict()
+
+        with zipfile.ZipFile(path) as archive:
+            with open(path, "rb") as f:
+                for info in archive.infolist():
+                    name = info.filename[: -len(".npy")]
+
+                    if name not in NPZ_ARRAYS:
+                        continue
+
+                    if info.compress_type != zipfile.ZIP_STORED:
+                        raise ValueError(
+                            f"Compressed {name=} from {path=} cannot be mapped"
+                        )
+
+                    f.seek(info.header_offset + 26)
+                    name_length, extra_length = struct.unpack("<HH", f.read(4))
+                    offset = info.header_offset + 30 + name_length + extra_length
+
+                    arrays[name] = _mmap_npy(path, offset)
+
+        missing = [name for name in NPZ_ARRAYS if name not in arrays]
+
+        if missing:
+            raise ValueError(f"No arrays {missing=} found in {path=}")
+
+    logging.info(f"Load arrays of graph from {path=} with {mmap=}")
+
+    return arrays
+
+
+def graph_from_npz(
+    path: Union[pathlib.Path, str], *, backend: str = "networkx"
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
+    """Loads a graph from NPZ file.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the NPZ file with which
+        the graph will be created.
+
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+        The arrays of `LabeledEdgeList` except the sources are memory-mapped.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> p = cfpq_data.download("generations", materialize="binary")
+    >>> g = cfpq_data.graph_from_npz(p)
+    >>> g.number_of_nodes()
+    129
+    >>> g.number_of_edges()
+    273
+
+    Returns
+    -------
+    g : Union[MultiDiGraph, LabeledEdgeList]
+        Loaded graph.
+    """
+    _check_backend(backend)
+
+    arrays = load_npz_arrays(path)
+
+    if backend == "edgelist":
+        graph = LabeledEdgeList(
+            arrays["nodes"],
+            arrays["labels"],
+            np.repeat(arrays["rows"], np.diff(arrays["indptr"])),
+            arrays["indices"],
+            arrays["label_codes"],
+        )
+
+        logging.info(f"Load {graph=} from {path=}")
+
+        return graph
+
+    nodes = arrays["nodes"].tolist()
+    labels = arrays["labels"].tolist()
+    sources = np.repeat(arrays["rows"], np.diff(arrays["indptr"]))
+
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(nodes)
+    graph.add_edges_from(
+        (nodes[u], nodes[v], {"label": labels[e]})
+        for u, v, e in zip(
+            sources.tolist(),
+            arrays["indices"].tolist(),
+            arrays["label_codes"].tolist(),
+        )
+    )
+
+    logging.info(f"Load {graph=} from {path=}")
+
+    return graph
+
+
+def graph_to_npz(
+    graph: nx.MultiDiGraph, path: Union[pathlib.Path, str]
+) -> pathlib.Path:
+    """Saves the `graph` to the NPZ file by `path`.
+
+    The edges are stored as CSR arrays partitioned by labels,
+    see `load_npz_arrays`. Nodes and labels are stored as integers
+    if all of them are integers and as strings otherwise.
+    The edges without labels and the nodes or the labels
+    formatted the same, e.g. 1 and "1", cannot be stored.
+
+    Parameters
+    ----------
+    graph : MultiDiGraph
+        Graph to save.
+
+    path : Union[Path, str]
+        The path to the NPZ file where the graph will be saved.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> p = download("generations")
+    >>> g = graph_from_csv(p)
+    >>> path = graph_to_npz(g, "test.npz")
+
+    Returns
+    -------
+    path : Path
+        Path to the NPZ file where the graph will be saved.
+    """
+    nodes = list(graph.nodes)
+    node_codes = {node: i for i, node in enumerate(nodes)}
+
+    edges = list(graph.edges(data="label"))
+    label_codes, labels = _factorize_labels(
+        pd.Series([e for _, _, e in edges], dtype=object)
+    )
+
+    dest = _save_npz(
+        path,
+        nodes=_stored_names(nodes),
+        labels=_stored_names(labels),
+        sources=[node_codes[u] for u, _, _ in edges],
+        targets=[node_codes[v] for _, v, _ in edges],
+        label_codes=label_codes,
+    )
+
+    logging.info(f"Save {graph=} to {dest=}")
+
+    return dest
@@ -1,18 +1,273 @@
 """Read (and write) a graph from (and to) RDF file."""
+import itertools
 import logging
 import pathlib
-from typing import Union
+import re
+from typing import Any, Dict, Iterable, Iterator, Tuple, Union
 
 import networkx as nx
 import rdflib
+import rdflib.util
+
+from cfpq_data.compression import open_file, _uncompressed_name
+from cfpq_data.graphs.edge_list import LabeledEdgeList, _check_backend, _named_edges
 
 __all__ = [
     "graph_from_rdf",
     "graph_to_rdf",
 ]
 
+STREAMING_FORMATS = ("nt", "turtle")
+
+WRITE_BLOCK_SIZE = 1 << 16
+
+RDF_TERM = re.compile(
+    r"""\s*(?:
+        <(?P<iri>[^<>"\s]*)>
+        |_:(?P<bnode>[A-Za-z0-9_](?:[-A-Za-z0-9_.]*[-A-Za-z0-9_])?)
+        |"(?P<literal>(?:[^"\\\n\r]|\\.)*)"
+            (?:\^\^(?:<(?P<datatype>[^<>"\s]*)>
+                |(?P<datatype_prefix>[A-Za-z](?:[-\w.]*[-\w])?)?:(?P<datatype_local>[-\w]*))
+            |@(?P<lang>[A-Za-z]+(?:-[A-Za-z0-9]+)*))?
+        |(?P<prefix>[A-Za-z](?:[-\w.]*[-\w])?)?:(?P<local>[-\w]*)
+        |(?P<a>a)(?=\s)
+    )""",
+    re.VERBOSE,
+)
+
+RDF_TRIPLE_END = re.compile(r"\s*\.\s*(?:\#.*)?")
+
+RDF_PREFIX = re.compile(
+    r"(?:@prefix\s+(?P<prefix>[A-Za-z](?:[-\w.]*[-\w])?)?:\s*<(?P<iri>[^<>\"\s]*)>\s*\."
+    r"|PREFIX\s+(?P<sparql_prefix>[A-Za-z](?:[-\w.]*[-\w])?)?:\s*<(?P<sparql_iri>[^<>\"\s]*)>)"
+    r"\s*(?:\#.*)?"
+)
+
+RDF_ESCAPE = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))")
+
+RDF_ESCAPES = {
+    "t": "\t",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "f": "\f",
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+}
+
+
+def _unescape(value: str) -> str:
+    """Returns the string `value` with N-Triples escapes replaced."""
+    if "\\" not in value:
+        return value
+
+    def replace(match: re.Match) -> str:
+        if match[3] is None:
+            return chr(int(match[1] or match[2], 16))
+
+        if match[3] not in RDF_ESCAPES:
+            raise ValueError(f"Unknown escape in {value=}")
+
+        return RDF_ESCAPES[match[3]]
+
+    return RDF_ESCAPE.sub(replace, value)
+
+
+def _iri(value: str) -> rdflib.URIRef:
+    """Returns the absolute IRI from the escaped `value`."""
+    value = _unescape(value)
+
+    if ":" not in value:
+        raise ValueError(f"Relative {value=} needs a base IRI")
+
+    return rdflib.URIRef(value)
+
+
+def _prefixed_iri(prefixes: Dict[str, str], prefix: str, local: str) -> rdflib.URIRef:
+    """Returns the IRI of the prefixed name `prefix:local`."""
+    if prefix not in prefixes:
+        raise ValueError(f"Undefined {prefix=}")
+
+    return rdflib.URIRef(prefixes[prefix] + local)
+
+
+def _rdf_term(
+    match: re.Match,
+    position: int,
+    prefixes: Dict[str, str],
+    bnodes: Dict[str, rdflib.BNode],
+) -> rdflib.term.Node:
+    """Returns the RDF term from the `match` of `RDF_TERM`."""
+    if match["iri"] is not None:
+        return _iri(match["iri"])
+
+    if match["bnode"] is not None:
+        bnode = bnodes.get(match["bnode"])
+
+        if bnode is None:
+            bnode = bnodes[match["bnode"]] = rdflib.BNode()
+
+        return bnode
+
+    if match["literal"] is not None:
+        if match["datatype"] is not None:
+            datatype = _iri(match["datatype"])
+        elif match["datatype_local"] is not None:
+            datatype = _prefixed_iri(
+                prefixes, match["datatype_prefix"] or "", match["datatype_local"]
+            )
+        else:
+            datatype = None
+
+        return rdflib.Literal(
+            _unescape(match["literal"]), lang=match["lang"], datatype=datatype
+        )
+
+    if match["local"] is not None:
+        return _prefixed_iri(prefixes, match["prefix"] or "", match["local"])
+
+    if position != 1:
+        raise ValueError("Keyword `a` is allowed only as a predicate")
+
+    return rdflib.RDF.type
+
+
+def _ntriples_literal(value: str) -> str:
+    """Returns the N-Triples `xsd:string` literal of the string `value`."""
+    value = (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+    return f'"{value}"^^<{rdflib.XSD.string}>'
+
+
+def _ntriples_lines(graph: Union[nx.MultiDiGraph, LabeledEdgeList]) -> Iterator[str]:
+    """Returns an iterator over the N-Triples lines of the edges of `graph`.
+
+    As `rdflib.BNode(node)`, the nodes with the same string are the same
+    blank node which is labeled by the number of its first appearance.
+    """
+    bnodes = dict()
+    literals = dict()
+
+    for u, v, label in _named_edges(graph):
+        subj = bnodes.get(u)
+        if subj is None:
+            subj = bnodes[u] = f"_:n{len(bnodes)}"
+
+        obj = bnodes.get(v)
+        if obj is None:
+            obj = bnodes[v] = f"_:n{len(bnodes)}"
+
+        pred = literals.get(label)
+        if pred is None:
+            pred = literals[label] = _ntriples_literal(label)
+
+        yield f"{subj} {pred} {obj} .\n"
+
+
+def _read_triples(
+    path: Union[pathlib.Path, str], *, turtle: bool
+) -> Iterator[Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]]:
+    """Returns an iterator over the triples from N-Triples file
+    or from Turtle file with one triple per line.
 
-def graph_from_rdf(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
+    Besides N-Triples lines, Turtle files may only have prefix declarations,
+    prefixed names and `a`. The blank nodes are created as by `rdflib`,
+    the other terms are created once per spelling.
+    Raises ValueError on the first line with some other syntax.
+    """
+    prefixes = dict()
+    bnodes = dict()
+    cache = dict()
+
+    with open_file(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+
+            if not line or line.startswith("#"):
+                continue
+
+            if turtle:
+                match = RDF_PREFIX.fullmatch(line)
+
+                if match is not None:
+                    prefix = match["prefix"] or match["sparql_prefix"] or ""
+                    prefixes[prefix] = _iri(match["iri"] or match["sparql_iri"])
+                    cache.clear()
+                    continue
+
+            terms = []
+            end = 0
+
+            for position in range(3):
+                match = RDF_TERM.match(line, end)
+
+                if match is None or (match["a"] is not None and not turtle):
+                    raise ValueError(f"{line=} from {path=} is not a simple triple")
+
+                key = match.group().lstrip()
+                term = cache.get(key)
+
+                if term is None:
+                    term = _rdf_term(match, position, prefixes, bnodes)
+
+                    if match["a"] is None:
+                        cache[key] = term
+
+                terms.append(term)
+                end = match.end()
+
+            if RDF_TRIPLE_END.fullmatch(line, end) is None:
+                raise ValueError(f"{line=} from {path=} is not a simple triple")
+
+            yield tuple(terms)
+
+
+def _graph_from_triples(
+    triples: Iterable[Tuple[rdflib.term.Node, rdflib.term.Node, rdflib.term.Node]],
+    labels: Union[Iterable[Any], None],
+    backend: str,
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
+    """Returns the graph with the edges from the subjects to the objects
+    of `triples` labeled by their predicates, repeated triples are skipped."""
+    if labels is not None:
+        triples = (
+            (subj, pred, obj)
+            for subj, pred, obj in triples
+            if pred in labels or str(pred) in labels
+        )
+
+    if backend == "edgelist":
+        return LabeledEdgeList.from_edges(
+            (subj, obj, pred) for subj, pred, obj in dict.fromkeys(triples)
+        )
+
+    graph = nx.MultiDiGraph()
+
+    for subj, pred, obj in triples:
+        edges = graph.get_edge_data(subj, obj)
+
+        if edges is None or all(edge["label"] != pred for edge in edges.values()):
+            graph.add_edge(
+                u_for_edge=subj,
+                v_for_edge=obj,
+                label=pred,
+            )
+
+    return graph
+
+
+def graph_from_rdf(
+    path: Union[pathlib.Path, str],
+    *,
+    labels: Union[Iterable[Any], None] = None,
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
     """Loads a graph from RDF file.
 
     Parameters
@@ -20,6 +275,16 @@ def graph_from_rdf(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
     path : Union[Path, str]
         The path to the RDF file with which the graph will be created.
 
+    labels : Union[Iterable[Any], None]
+        The labels of the edges to be loaded or None for all edges.
+        The predicates are matched by themselves and by their strings,
+        so `labels=["type"]` selects the `Literal("type")` predicates.
+        The nodes incident only to the other edges are not added to the graph.
+
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -32,36 +297,59 @@ def graph_from_rdf(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
     >>> generations.number_of_edges()
     273
 
+    Notes
+    -----
+    N-Triples files and Turtle files with one triple per line are read
+    line by line straight into the graph. Other files and formats
+    are parsed by `rdflib.Graph` first.
+
     Returns
     -------
-    g : MultiDiGraph
+    g : Union[MultiDiGraph, LabeledEdgeList]
         Loaded graph.
     """
-    tmp = rdflib.Graph()
-    tmp.parse(str(path))
+    _check_backend(backend)
 
-    graph = nx.MultiDiGraph()
+    if labels is not None:
+        labels = set(labels)
 
-    for subj, pred, obj in tmp:
-        graph.add_edge(
-            u_for_edge=subj,
-            v_for_edge=obj,
-            label=pred,
-        )
+    rdf_format = rdflib.util.guess_format(_uncompressed_name(path))
+    graph = None
+
+    if rdf_format in STREAMING_FORMATS:
+        try:
+            graph = _graph_from_triples(
+                _read_triples(path, turtle=rdf_format == "turtle"), labels, backend
+            )
+        except ValueError as e:
+            logging.info(f"Parse {path=} with rdflib since {e}")
 
-    logging.info(f"Load {graph=} from {path=}")
+    if graph is None:
+        tmp = rdflib.Graph()
+
+        with open_file(path, "rb") as f:
+            tmp.parse(
+                f, format=rdf_format, publicID=pathlib.Path(path).resolve().as_uri()
+            )
+
+        graph = _graph_from_triples(tmp, labels, backend)
+
+    logging.info(f"Load {graph=} from {path=} with {labels=}")
 
     return graph
 
 
 def graph_to_rdf(
-    graph: nx.MultiDiGraph, path: Union[pathlib.Path, str]
+    graph: Union[nx.MultiDiGraph, LabeledEdgeList], path: Union[pathlib.Path, str]
 ) -> pathlib.Path:
     """Saves the `graph` to the RDF file by `path`.
 
+    The nodes are saved as blank nodes and the labels
+    as the predicates which are `xsd:string` literals.
+
     Parameters
     ----------
-    graph : MultiDiGraph
+    graph : Union[MultiDiGraph, LabeledEdgeList]
         Graph to save.
 
     path : Union[Path, str]
@@ -74,23 +362,45 @@ def graph_to_rdf(
     >>> g = graph_from_csv(p)
     >>> path = graph_to_rdf(g, "test.ttl")
 
+    Notes
+    -----
+    N-Triples and Turtle files are written as N-Triples by blocks of lines
+    without building `rdflib.Graph`, so the repeated edges are saved
+    as many times as they are in the graph. The files of other formats
+    are serialized by `rdflib.Graph` as Turtle.
+
     Returns
     -------
     path : Path
         Path to the RDF file where the graph will be saved.
     """
-    tmp = rdflib.Graph()
+    dest = pathlib.Path(path).resolve()
 
-    for u, v, edge_labels in graph.edges(data=True):
-        subj = rdflib.BNode(u)
-        obj = rdflib.BNode(v)
+    if rdflib.util.guess_format(_uncompressed_name(dest)) in STREAMING_FORMATS:
+        lines = _ntriples_lines(graph)
 
-        for label in edge_labels.values():
-            pred = rdflib.Literal(f"{label}", datatype=rdflib.XSD.string)
-            tmp.add((subj, pred, obj))
+        with open_file(dest, "w", encoding="utf-8") as f:
+            while True:
+                block = list(itertools.islice(lines, WRITE_BLOCK_SIZE))
 
-    dest = pathlib.Path(path).resolve()
-    tmp.serialize(destination=str(dest))
+                if not block:
+                    break
+
+                f.write("".join(block))
+    else:
+        tmp = rdflib.Graph()
+
+        for u, v, label in _named_edges(graph):
+            tmp.add(
+                (
+                    rdflib.BNode(u),
+                    rdflib.Literal(label, datatype=rdflib.XSD.string),
+                    rdflib.BNode(v),
+                )
+            )
+
+        with open_file(dest, "wb") as f:
+            tmp.serialize(destination=f)
 
     logging.info(f"Save {graph=} to {dest=}")
 
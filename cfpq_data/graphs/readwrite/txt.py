@@ -1,20 +1,67 @@
 """Read (and write) a graph from (and to) TXT file."""
+import itertools
 import logging
 import pathlib
+import re
 import shlex
-from typing import Union, Iterable, Iterator
+from typing import Any, Union, Iterable, Iterator, Tuple
 
 import networkx as nx
+import pandas as pd
+
+from cfpq_data.compression import open_file
+from cfpq_data.graphs.edge_list import LabeledEdgeList, _check_backend, _named_edges
 
 __all__ = [
     "graph_from_text",
     "graph_to_text",
     "graph_from_txt",
     "graph_to_txt",
+    "iter_edges_txt",
 ]
 
+EDGES_CHUNK_SIZE = 1 << 20
+
+WRITE_BLOCK_SIZE = 1 << 16
+
+QUOTED_LINE = re.compile(r"['\"\\]|[^\S \t\r\n]")
+
+
+def _edges_from_text(
+    text: Iterable[str], labels: Union[Iterable[Any], None] = None
+) -> Iterator[Tuple[Any, Any, Any]]:
+    """Returns an iterator over the (source, target, label) edges from text
+    with the given `labels` or all of them if `labels` is None.
+
+    The lines without quotes, escapes and unusual whitespace are split
+    by `str.split` giving the same result as `shlex.split` much faster.
+    """
+    if labels is not None:
+        labels = {f"{label}" for label in labels}
+
+    search = QUOTED_LINE.search
 
-def graph_from_text(text: Iterable[str]) -> nx.MultiDiGraph:
+    for edge in text:
+        try:
+            if search(edge) is None:
+                u, label, v = edge.split()
+            else:
+                u, label, v = shlex.split(edge.strip())
+        except Exception as e:
+            raise ValueError(
+                f"{edge} does not match the input format: FROM LABEL TO"
+            ) from e
+
+        if labels is None or label in labels:
+            yield u, v, label
+
+
+def graph_from_text(
+    text: Iterable[str],
+    *,
+    labels: Union[Iterable[Any], None] = None,
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
     """Returns a graph from text.
 
     Parameters
@@ -22,6 +69,16 @@ def graph_from_text(text: Iterable[str]) -> nx.MultiDiGraph:
     text : Iterable[str]
         The text with which the graph will be created.
 
+    labels : Union[Iterable[Any], None]
+        The labels of the edges to be loaded or None for all edges.
+        The other edges are skipped while parsing, so the nodes
+        incident only to them are not added to the graph.
+        The labels are compared as strings, e.g. 1 and "1" are the same.
+
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -30,38 +87,38 @@ def graph_from_text(text: Iterable[str]) -> nx.MultiDiGraph:
     2
     >>> g.number_of_edges()
     1
+    >>> list(graph_from_text(["1 A 2", "2 B 3"], labels=["B"]).nodes)
+    ['2', '3']
 
     Returns
     -------
-    g : MultiDiGraph
+    g : Union[MultiDiGraph, LabeledEdgeList]
         Loaded graph.
     """
-    graph = nx.MultiDiGraph()
+    _check_backend(backend)
 
-    for edge in text:
-        try:
-            u, label, v = shlex.split(edge.strip())
-            graph.add_edge(
-                u_for_edge=u,
-                v_for_edge=v,
-                label=label,
-            )
-        except Exception as e:
-            raise ValueError(
-                f"{edge} does not match the input format: FROM LABEL TO"
-            ) from e
+    if backend == "edgelist":
+        graph = LabeledEdgeList.from_edges(_edges_from_text(text, labels))
+    else:
+        graph = nx.MultiDiGraph()
+
+        graph.add_edges_from(
+            (u, v, {"label": label}) for u, v, label in _edges_from_text(text, labels)
+        )
 
-    logging.info(f"Load {graph=} from {text=}")
+    logging.info(f"Load {graph=} from {text=} with {labels=}")
 
     return graph
 
 
-def graph_to_text(graph: nx.MultiDiGraph, *, quoting: bool = False) -> Iterator[str]:
+def graph_to_text(
+    graph: Union[nx.MultiDiGraph, LabeledEdgeList], *, quoting: bool = False
+) -> Iterator[str]:
     """Turns a graph into its text representation.
 
     Parameters
     ----------
-    graph : MultiDiGraph
+    graph : Union[MultiDiGraph, LabeledEdgeList]
         Graph to text.
 
     quoting : bool
@@ -81,17 +138,22 @@ def graph_to_text(graph: nx.MultiDiGraph, *, quoting: bool = False) -> Iterator[
     text : str
         Generator of graph edges.
     """
-    for u, v, edge_labels in graph.edges(data=True):
-        for label in edge_labels.values():
-            if quoting:
-                yield f"'{u}' '{label}' '{v}'"
-            else:
-                yield f"{u} {label} {v}"
+    if quoting:
+        for u, v, label in _named_edges(graph):
+            yield f"'{u}' '{label}' '{v}'"
+    else:
+        for u, v, label in _named_edges(graph):
+            yield f"{u} {label} {v}"
 
     logging.info(f"Turn {graph=} into text with {quoting=}")
 
 
-def graph_from_txt(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
+def graph_from_txt(
+    path: Union[pathlib.Path, str],
+    *,
+    labels: Union[Iterable[Any], None] = None,
+    backend: str = "networkx",
+) -> Union[nx.MultiDiGraph, LabeledEdgeList]:
     """Returns a graph loaded from a TXT file.
 
     Parameters
@@ -99,6 +161,16 @@ def graph_from_txt(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
     path : Union[Path, str]
         The path to the TXT file with which the graph will be created.
 
+    labels : Union[Iterable[Any], None]
+        The labels of the edges to be loaded or None for all edges.
+        The other edges are skipped while parsing, so the nodes
+        incident only to them are not added to the graph.
+        The labels are compared as strings, e.g. 1 and "1" are the same.
+
+    backend : str
+        The type of the returned graph: "networkx" for `MultiDiGraph`
+        or "edgelist" for `LabeledEdgeList`.
+
     Examples
     --------
     >>> from cfpq_data import *
@@ -112,11 +184,11 @@ def graph_from_txt(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
 
     Returns
     -------
-    g : MultiDiGraph
+    g : Union[MultiDiGraph, LabeledEdgeList]
         Loaded graph.
     """
-    with open(path, "r") as f:
-        graph = graph_from_text(f)
+    with open_file(path, "r") as f:
+        graph = graph_from_text(f, labels=labels, backend=backend)
 
     logging.info(f"Load {graph=} from {path=}")
 
@@ -124,16 +196,18 @@ def graph_from_txt(path: Union[pathlib.Path, str]) -> nx.MultiDiGraph:
 
 
 def graph_to_txt(
-    graph: nx.MultiDiGraph,
+    graph: Union[nx.MultiDiGraph, LabeledEdgeList],
     path: Union[pathlib.Path, str],
     *,
     quoting: bool = False,
 ) -> pathlib.Path:
     """Returns a path to the TXT file where the graph will be saved.
 
+    The lines of the edges are written by blocks.
+
     Parameters
     ----------
-    graph : MultiDiGraph
+    graph : Union[MultiDiGraph, LabeledEdgeList]
         Graph to save.
 
     path: Union[Path, str]
@@ -153,12 +227,65 @@ def graph_to_txt(
     path : Path
         Path to a TXT file where the graph will be saved.
     """
-    with open(path, "w") as f:
-        for edge in graph_to_text(graph=graph, quoting=quoting):
-            f.write(edge + "\n")
+    lines = graph_to_text(graph=graph, quoting=quoting)
+
+    with open_file(path, "w") as f:
+        while True:
+            block = list(itertools.islice(lines, WRITE_BLOCK_SIZE))
+
+            if not block:
+                break
+
+            f.write("\n".join(block) + "\n")
 
     dest = pathlib.Path(path).resolve()
 
     logging.info(f"Save {graph=} to {dest=}")
 
     return dest
+
+
+def iter_edges_txt(
+    path: Union[pathlib.Path, str], *, chunksize: int = EDGES_CHUNK_SIZE
+) -> Iterator[pd.DataFrame]:
+    """Returns an iterator over the edges of the graph from TXT file
+    read by chunks, so only one chunk of the edges is in memory at once.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the TXT file with the graph.
+
+    chunksize : int
+        The maximum number of edges in one chunk.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> p = graph_to_txt(labeled_cycle_graph(5), "test.txt")
+    >>> [len(chunk) for chunk in iter_edges_txt(p, chunksize=2)]
+    [2, 2, 1]
+    >>> next(iter_edges_txt(p)).columns.tolist()
+    ['from', 'to', 'label']
+
+    Returns
+    -------
+    chunks : Iterator[DataFrame]
+        The chunks of the edges with the `from`, `to` and `label` columns
+        of the names of the nodes and the labels as they are in the file.
+    """
+    chunks = 0
+
+    with open_file(path, "r") as f:
+        edges = _edges_from_text(f)
+
+        while True:
+            chunk = list(itertools.islice(edges, chunksize))
+
+            if not chunk:
+                break
+
+            chunks += 1
+            yield pd.DataFrame(chunk, columns=["from", "to", "label"])
+
+    logging.info(f"Read {chunks} chunks of edges from {path=} with {chunksize=}")
@@ -4,3 +4,4 @@ from cfpq_data.graphs.utils.filter_edges import *
 from cfpq_data.graphs.utils.edges_statistics import *
 from cfpq_data.graphs.utils.nodes_to_integers import *
 from cfpq_data.graphs.utils.multiple_source_utils import *
+from cfpq_data.graphs.utils.label_matrices import *
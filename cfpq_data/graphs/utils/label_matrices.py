@@ -0,0 +1,212 @@
+"""Returns boolean sparse adjacency matrices of graph edge labels."""
+import logging
+import pathlib
+from typing import Any, Dict, List, Tuple, Union
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from cfpq_data.graphs.edge_list import _edge_list_from_frame, _factorize_labels
+from cfpq_data.graphs.readwrite.csv import _read_csv
+from cfpq_data.graphs.readwrite.npz import load_npz_arrays
+
+__all__ = [
+    "graph_to_label_matrices",
+    "label_matrices_from_csv",
+    "label_matrices_from_npz",
+]
+
+
+def _sparse():
+    """Returns `scipy.sparse` which is an optional dependency."""
+    try:
+        import scipy.sparse
+    except ImportError as e:
+        raise ImportError(
+            "Label matrices require scipy, install it with `pip install scipy`"
+        ) from e
+
+    return scipy.sparse
+
+
+def _label_matrices(
+    sources: np.ndarray,
+    targets: np.ndarray,
+    label_codes: np.ndarray,
+    nodes: List[Any],
+    labels: List[Any],
+) -> Tuple[Dict[Any, Any], Dict[Any, int]]:
+    """Returns the matrices of the edges given by the codes of their nodes and labels."""
+    sparse = _sparse()
+
+    order = np.argsort(label_codes, kind="stable")
+    bounds = np.concatenate(
+        [[0], np.cumsum(np.bincount(label_codes, minlength=len(labels)))]
+    )
+
+    matrices = dict()
+
+    for code, label in enumerate(labels):
+        edges = order[bounds[code] : bounds[code + 1]]
+        matrix = sparse.csr_matrix(
+            (np.ones(len(edges), dtype=bool), (sources[edges], targets[edges])),
+            shape=(len(nodes), len(nodes)),
+        )
+        matrix.sum_duplicates()
+        matrices[label] = matrix
+
+    return matrices, {node: i for i, node in enumerate(nodes)}
+
+
+def graph_to_label_matrices(
+    graph: nx.MultiDiGraph,
+) -> Tuple[Dict[Any, Any], Dict[Any, int]]:
+    """Returns a boolean sparse adjacency matrix for each edge label of the graph.
+
+    Parameters
+    ----------
+    graph : MultiDiGraph
+        Given graph.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> g = labeled_two_cycles_graph(1, 1, labels=("a", "b"))
+    >>> matrices, nodes = graph_to_label_matrices(g)
+    >>> sorted(matrices)
+    ['a', 'b']
+    >>> matrices["a"][nodes[0], nodes[1]]
+    True
+
+    Returns
+    -------
+    matrices : Dict[Any, csr_matrix]
+        The boolean CSR matrix of the edges with each label.
+
+    nodes : Dict[Any, int]
+        The index of each node in the rows and the columns of the matrices.
+    """
+    nodes = list(graph.nodes)
+    node_codes = {node: i for i, node in enumerate(nodes)}
+
+    edges = list(graph.edges(data="label"))
+    label_codes, labels = _factorize_labels(
+        pd.Series([e for _, _, e in edges], dtype=object)
+    )
+
+    matrices, index = _label_matrices(
+        np.fromiter((node_codes[u] for u, _, _ in edges), dtype=np.int64),
+        np.fromiter((node_codes[v] for _, v, _ in edges), dtype=np.int64),
+        label_codes,
+        nodes,
+        labels.tolist(),
+    )
+
+    logging.info(f"Construct {len(matrices)} label matrices of {graph=}")
+
+    return matrices, index
+
+
+def label_matrices_from_csv(
+    path: Union[pathlib.Path, str]
+) -> Tuple[Dict[Any, Any], Dict[Any, int]]:
+    """Returns a boolean sparse adjacency matrix for each edge label
+    of the graph from CSV file without loading it as a networkx graph.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the CSV file with the graph.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> matrices, nodes = label_matrices_from_csv(download("generations"))
+    >>> len(nodes)
+    129
+    >>> matrices["type"].nnz
+    78
+
+    Returns
+    -------
+    matrices : Dict[Any, csr_matrix]
+        The boolean CSR matrix of the edges with each label.
+
+    nodes : Dict[Any, int]
+        The index of each node in the rows and the columns of the matrices.
+    """
+    edge_list = _edge_list_from_frame(_read_csv(path))
+
+    matrices, index = _label_matrices(
+        edge_list.sources,
+        edge_list.targets,
+        edge_list.label_codes,
+        edge_list.nodes.tolist(),
+        edge_list.labels.tolist(),
+    )
+
+    logging.info(f"Load {len(matrices)} label matrices from {path=}")
+
+    return matrices, index
+
+
+def label_matrices_from_npz(
+    path: Union[pathlib.Path, str]
+) -> Tuple[Dict[Any, Any], Dict[Any, int]]:
+    """Returns a boolean sparse adjacency matrix for each edge label
+    of the graph from NPZ file built directly from its CSR arrays.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path to the NPZ file with the graph.
+
+    Examples
+    --------
+    >>> from cfpq_data import *
+    >>> p = download("generations", materialize="binary")
+    >>> matrices, nodes = label_matrices_from_npz(p)
+    >>> matrices["type"].nnz
+    78
+
+    Returns
+    -------
+    matrices : Dict[Any, csr_matrix]
+        The boolean CSR matrix of the edges with each label.
+
+    nodes : Dict[Any, int]
+        The index of each node in the rows and the columns of the matrices.
+    """
+    sparse = _sparse()
+
+    arrays = load_npz_arrays(path)
+    nodes = arrays["nodes"].tolist()
+    labels = arrays["labels"].tolist()
+    label_indptr = arrays["label_indptr"].astype(np.int64)
+    indptr = arrays["indptr"].astype(np.int64)
+
+    matrices = dict()
+
+    for code, label in enumerate(labels):
+        first, last = label_indptr[code], label_indptr[code + 1]
+
+        counts = np.zeros(len(nodes) + 1, dtype=np.int64)
+        counts[arrays["rows"][first:last].astype(np.int64) + 1] = np.diff(
+            indptr[first : last + 1]
+        )
+
+        matrix = sparse.csr_matrix(
+            (
+                np.ones(indptr[last] - indptr[first], dtype=bool),
+                arrays["indices"][indptr[first] : indptr[last]],
+                np.cumsum(counts),
+            ),
+            shape=(len(nodes), len(nodes)),
+        )
+        matrix.sum_duplicates()
+        matrices[label] = matrix
+
+    logging.info(f"Load {len(matrices)} label matrices from {path=}")
+
+    return matrices, {node: i for i, node in enumerate(nodes)}
@@ -7,6 +7,8 @@ from typing import Set, Tuple, Union
 
 import networkx as nx
 
+from cfpq_data.compression import open_file
+
 __all__ = [
     "generate_multiple_source",
     "generate_multiple_source_percent",
@@ -138,7 +140,7 @@ def multiple_source_from_txt(path: Union[pathlib.Path, str]) -> Set[int]:
 
     source_vertices = set()
 
-    with open(path, "r") as f:
+    with open_file(path, "r") as f:
         for vertex in f:
             vertex = vertex.strip()
             if not vertex.isnumeric():
@@ -175,7 +177,7 @@ def multiple_source_to_txt(
     path : Path
         Path to a TXT file where the set of source vertices will be saved.
     """
-    with open(path, "w") as f:
+    with open_file(path, "w") as f:
         for vertex in source_vertices:
             f.write(str(vertex) + "\n")
 
@@ -213,7 +215,7 @@ def multiple_source_result_from_txt(
 
     reachable_pairs = set()
 
-    with open(path, "r") as f:
+    with open_file(path, "r") as f:
         for vertex_pair in f:
             u, v = shlex.split(vertex_pair.strip())
             if u.isnumeric() and v.isnumeric():
@@ -250,7 +252,7 @@ def multiple_source_result_to_txt(
     path : Path
         Path to a TXT file where the multiple-source query evaluation result will be saved.
     """
-    with open(path, "w") as f:
+    with open_file(path, "w") as f:
         for u, v in reachable_pairs:
             f.write(f"{u} {v}\n")
 
@@ -66,7 +66,7 @@ def parse_requirements_file(filename):
 install_requires = parse_requirements_file(root / "requirements" / "default.txt")
 extras_require = {
     dep: parse_requirements_file(root / "requirements" / f"{dep}.txt")
-    for dep in ["developer", "docs", "tests"]
+    for dep in ["developer", "docs", "extra", "tests"]
 }
 
 if __name__ == "__main__":
@@ -81,6 +81,7 @@ if __name__ == "__main__":
         version=version,
         keywords=keywords,
         packages=find_packages(),
+        package_data={"cfpq_data": ["dataset/metadata.json"]},
         platforms=platforms,
         url=url,
         project_urls=project_urls,
@@ -0,0 +1,103 @@
+import http.server
+import io
+import tarfile
+import threading
+import time
+
+import pytest
+
+import cfpq_data
+
+
+def make_archive(root, files):
+    """Returns the bytes of a `.tar.gz` archive with `files` inside `root` directory."""
+    buffer = io.BytesIO()
+
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            info = tarfile.TarInfo(f"{root}/{name}")
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+
+    return buffer.getvalue()
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests.append((self.path, self.headers.get("Range")))
+        time.sleep(self.server.delay)
+
+        body = self.server.files.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        start = 0
+        if self.headers.get("Range") and self.server.ranges:
+            start = int(self.headers["Range"][len("bytes=") : -len("-")])
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}"
+            )
+        else:
+            self.send_response(200)
+
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+
+        drops = self.server.drops.get(self.path)
+        if drops:
+            self.wfile.write(body[start : start + drops.pop(0)])
+            self.close_connection = True
+        else:
+            self.wfile.write(body[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.files = dict()
+    httpd.requests = list()
+    httpd.drops = dict()
+    httpd.ranges = True
+    httpd.delay = 0
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+
+    yield httpd
+
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def dataset(server, tmp_path, monkeypatch):
+    data = cfpq_data.dataset.data
+
+    monkeypatch.setattr(data, "DATASET_URL", f"{server.url}/graph/")
+    monkeypatch.setattr(data, "GRAMMARS_URL", f"{server.url}/grammar/")
+    monkeypatch.setattr(data, "BENCHMARK_URL", f"{server.url}/benchmark/")
+
+    root = cfpq_data.config.DATA
+    cfpq_data.config.set_data_root(tmp_path)
+
+    server.files["/graph/skos.tar.gz"] = make_archive(
+        "skos", {"skos.csv": b"0 1 a\n1 0 b\n", "skos.md": b"# skos\n"}
+    )
+    server.files["/grammar/example/dyck.tar.gz"] = make_archive(
+        "dyck", {"dyck.cfg": b"S -> a S b S\n"}
+    )
+    server.files["/benchmark/MS_Reachability.tar.gz"] = make_archive(
+        "MS_Reachability", {"core/queries/q1.txt": b"type*\n"}
+    )
+
+    yield server
+
+    cfpq_data.config.set_data_root(root)
+    cfpq_data.config.set_data_max_bytes(None)
@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+import pytest
+
+import cfpq_data
+
+from conftest import make_archive
+
+
+def test_adownload(dataset):
+    async def main():
+        return await asyncio.gather(
+            cfpq_data.adownload("skos"),
+            cfpq_data.adownload_grammars("dyck"),
+            cfpq_data.adownload_grammars("dyck", graph_name="skos"),
+            cfpq_data.adownload_benchmark("MS_Reachability", streaming=True),
+        )
+
+    graph, grammars, none, benchmark = asyncio.run(main())
+
+    assert graph.read_bytes() == b"0 1 a\n1 0 b\n"
+    assert (grammars / "dyck.cfg").exists()
+    assert none is None
+    assert (benchmark / "core" / "queries" / "q1.txt").exists()
+
+    assert asyncio.run(cfpq_data.adownload("skos")) == graph
+    assert len(dataset.requests) == 4
+
+
+def test_adownload_rise(dataset):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(cfpq_data.adownload(""))
+
+
+def test_adownload_does_not_block(dataset):
+    dataset.delay = 0.5
+
+    async def main():
+        ticks = 0
+        task = asyncio.create_task(cfpq_data.adownload("skos"))
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        return ticks, task.result()
+
+    ticks, path = asyncio.run(main())
+
+    assert ticks > 10
+    assert path.exists()
+
+
+def test_adownload_many(dataset):
+    for name in ["wc", "travel", "univ"]:
+        dataset.files[f"/graph/{name}.tar.gz"] = make_archive(
+            name, {f"{name}.csv": b"0 1 a\n"}
+        )
+    dataset.delay = 0.3
+
+    start = time.monotonic()
+    paths, errors = asyncio.run(
+        cfpq_data.adownload_many(["skos", "wc", "travel", "univ", "go", "wc"])
+    )
+
+    assert time.monotonic() - start < 1.0
+    assert sorted(paths) == ["skos", "travel", "univ", "wc"]
+    assert sorted(errors) == ["go"]
+
+
+def test_adownload_many_bounded(dataset):
+    for name in ["wc", "travel", "univ"]:
+        dataset.files[f"/graph/{name}.tar.gz"] = make_archive(
+            name, {f"{name}.csv": b"0 1 a\n"}
+        )
+    dataset.delay = 0.2
+
+    start = time.monotonic()
+    paths, _ = asyncio.run(
+        cfpq_data.adownload_many(["skos", "wc", "travel", "univ"], max_concurrency=1)
+    )
+
+    assert time.monotonic() - start >= 0.8
+    assert len(paths) == 4
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_adownload_cancel(dataset, streaming):
+    dataset.delay = 0.3
+
+    async def main():
+        task = asyncio.create_task(cfpq_data.adownload("skos", streaming=streaming))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main())
+
+    graphs = cfpq_data.config.GRAPHS_DIR
+    assert not (graphs / "skos").exists()
+    assert [p.name for p in graphs.iterdir()] in ([], ["skos.tar.gz.part"])
+
+    dataset.delay = 0
+    assert cfpq_data.download("skos").read_bytes() == b"0 1 a\n1 0 b\n"
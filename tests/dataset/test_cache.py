@@ -0,0 +1,183 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import cfpq_data
+
+from conftest import make_archive
+
+
+def test_download_cached(dataset):
+    path = cfpq_data.download("skos")
+    assert path.read_bytes() == b"0 1 a\n1 0 b\n"
+
+    assert cfpq_data.download("skos") == path
+    assert dataset.requests == [("/graph/skos.tar.gz", None)]
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda p: p.unlink(),
+        lambda p: p.write_bytes(b"0 1 c\n"),
+        lambda p: p.write_bytes(b"0 1 c\n1 0 d\n"),
+    ],
+)
+def test_download_corrupted(dataset, corrupt):
+    path = cfpq_data.download("skos")
+    corrupt(path)
+
+    assert cfpq_data.download("skos").read_bytes() == b"0 1 a\n1 0 b\n"
+    assert len(dataset.requests) == 2
+
+
+def test_download_outdated(dataset, monkeypatch):
+    dataset.files["/4.0.0/graph/skos.tar.gz"] = dataset.files["/graph/skos.tar.gz"]
+    monkeypatch.setattr(
+        cfpq_data.dataset.data, "DATASET_URL", f"{dataset.url}/4.0.0/graph/"
+    )
+    monkeypatch.setattr(cfpq_data.config, "VERSION", "4.0.3")
+
+    cfpq_data.download("skos")
+
+    dataset.files["/5.0.0/graph/skos.tar.gz"] = make_archive(
+        "skos", {"skos.csv": b"0 0 a\n"}
+    )
+    monkeypatch.setattr(
+        cfpq_data.dataset.data, "DATASET_URL", f"{dataset.url}/5.0.0/graph/"
+    )
+    monkeypatch.setattr(cfpq_data.config, "VERSION", "5.0.0")
+
+    assert cfpq_data.download("skos").read_bytes() == b"0 0 a\n"
+    assert not (cfpq_data.config.GRAPHS_DIR / "skos" / "skos.md").exists()
+
+
+def test_download_other_mirror(dataset, monkeypatch):
+    cfpq_data.download("skos")
+
+    dataset.files["/mirror/graph/skos.tar.gz"] = dataset.files["/graph/skos.tar.gz"]
+    monkeypatch.setattr(
+        cfpq_data.dataset.data, "DATASET_URL", f"{dataset.url}/mirror/graph/"
+    )
+
+    assert cfpq_data.download("skos").read_bytes() == b"0 1 a\n1 0 b\n"
+    assert dataset.requests == [("/graph/skos.tar.gz", None)]
+
+
+def test_download_cached_without_checksums(dataset, monkeypatch):
+    path = cfpq_data.download("skos")
+
+    def sha256(path):
+        raise AssertionError(f"Checksum of {path=} is computed")
+
+    monkeypatch.setattr(cfpq_data.dataset.cache, "_sha256", sha256)
+
+    assert cfpq_data.download("skos") == path
+
+
+def test_verify_cache(dataset):
+    path = cfpq_data.download("skos")
+    cfpq_data.download_grammars("dyck")
+
+    assert cfpq_data.verify_cache() == []
+
+    stat = path.stat()
+    path.write_bytes(b"0 1 c\n1 0 d\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert cfpq_data.download("skos").read_bytes() == b"0 1 c\n1 0 d\n"
+    assert [a["name"] for a in cfpq_data.verify_cache()] == ["skos"]
+    assert cfpq_data.download("skos").read_bytes() == b"0 1 a\n1 0 b\n"
+    assert len(dataset.requests) == 3
+
+
+def test_download_grammars_cached(dataset):
+    path = cfpq_data.download_grammars("dyck")
+
+    assert cfpq_data.download_grammars("dyck") == path
+    assert (path / "dyck.cfg").exists()
+    assert len(dataset.requests) == 1
+
+
+def test_download_grammars_not_found(dataset):
+    assert cfpq_data.download_grammars("dyck", graph_name="skos") is None
+
+
+def test_download_benchmark_cached(dataset):
+    path = cfpq_data.download_benchmark("MS_Reachability")
+
+    assert cfpq_data.download_benchmark("MS_Reachability") == path
+    assert (path / "core" / "queries" / "q1.txt").exists()
+    assert len(dataset.requests) == 1
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_download_concurrent(dataset, streaming):
+    dataset.delay = 0.2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        paths = list(
+            executor.map(
+                lambda _: cfpq_data.download("skos", streaming=streaming), range(8)
+            )
+        )
+
+    assert len(set(paths)) == 1
+    assert paths[0].read_bytes() == b"0 1 a\n1 0 b\n"
+    assert len(dataset.requests) == 1
+    assert sorted(p.name for p in paths[0].parent.parent.iterdir()) == ["skos"]
+
+
+def test_download_replace(dataset):
+    path = cfpq_data.download("skos")
+    (path.parent / "stale.txt").write_bytes(b"")
+    path.write_bytes(b"")
+
+    assert cfpq_data.download("skos") == path
+    assert sorted(p.name for p in path.parent.iterdir()) == ["skos.csv", "skos.md"]
+
+
+def test_cache_info(dataset):
+    assert cfpq_data.cache_info()["artifacts"] == []
+
+    cfpq_data.download("skos")
+    cfpq_data.download_grammars("dyck")
+
+    info = cfpq_data.cache_info()
+
+    assert info["root"] == cfpq_data.config.DATA
+    assert info["used_bytes"] == 12 + 7 + 13
+    assert [(a["kind"], a["name"], a["size"]) for a in info["artifacts"]] == [
+        ("graphs", "skos", 19),
+        ("grammars", "dyck", 13),
+    ]
+
+
+def test_cache_eviction(dataset):
+    dataset.files["/graph/wc.tar.gz"] = make_archive("wc", {"wc.csv": b"0 1 a\n"})
+
+    cfpq_data.config.set_data_max_bytes(30)
+
+    skos = cfpq_data.download("skos")
+    time.sleep(0.01)
+    dyck = cfpq_data.download_grammars("dyck")
+    time.sleep(0.01)
+    cfpq_data.download("skos")
+    time.sleep(0.01)
+    wc = cfpq_data.download("wc")
+
+    assert skos.exists() and wc.exists() and not dyck.exists()
+    assert cfpq_data.cache_info()["used_bytes"] == 19 + 6
+
+    cfpq_data.config.set_data_max_bytes(0)
+    cfpq_data.download_grammars("dyck")
+
+    assert [a["name"] for a in cfpq_data.cache_info()["artifacts"]] == ["dyck"]
+    assert not skos.exists() and not wc.exists()
+
+
+def test_set_data_max_bytes_rise():
+    with pytest.raises(ValueError):
+        cfpq_data.config.set_data_max_bytes(-1)
@@ -1,7 +1,12 @@
+import hashlib
+
 import pytest
+import requests
 
 import cfpq_data
 
+from conftest import make_archive
+
 
 def test_download_rise():
     with pytest.raises(FileNotFoundError):
@@ -26,3 +31,164 @@ def test_download_grammars_success(template, graph_name):
 def test_download_benchmark_rise():
     with pytest.raises(FileNotFoundError):
         cfpq_data.download_benchmark("")
+
+
+def test_download_many(dataset):
+    dataset.files["/graph/wc.tar.gz"] = make_archive("wc", {"wc.csv": b"0 1 a\n"})
+
+    paths, errors = cfpq_data.download_many(["skos", "wc", "skos", "go", ""])
+
+    assert sorted(paths) == ["skos", "wc"]
+    assert all(path.exists() for path in paths.values())
+    assert sorted(errors) == ["", "go"]
+    assert isinstance(errors[""], FileNotFoundError)
+    assert isinstance(errors["go"], FileNotFoundError)
+    assert sorted(path for path, _ in dataset.requests) == [
+        "/graph/go.tar.gz",
+        "/graph/skos.tar.gz",
+        "/graph/wc.tar.gz",
+    ]
+
+
+def test_download_resume(dataset):
+    archive = make_archive("skos", {"skos.csv": bytes(range(256)) * 1024})
+    dataset.files["/graph/skos.tar.gz"] = archive
+    dataset.drops["/graph/skos.tar.gz"] = [100, 200]
+
+    path = cfpq_data.download("skos")
+
+    assert path.read_bytes() == bytes(range(256)) * 1024
+    assert dataset.requests == [
+        ("/graph/skos.tar.gz", None),
+        ("/graph/skos.tar.gz", "bytes=100-"),
+        ("/graph/skos.tar.gz", "bytes=300-"),
+    ]
+    assert not list(path.parent.parent.glob("*.part"))
+
+
+def test_download_resume_unsupported(dataset):
+    dataset.ranges = False
+    dataset.drops["/graph/skos.tar.gz"] = [10]
+
+    assert cfpq_data.download("skos").read_bytes() == b"0 1 a\n1 0 b\n"
+    assert len(dataset.requests) == 2
+
+
+def test_download_resume_later(dataset):
+    dataset.drops["/graph/skos.tar.gz"] = [
+        10
+    ] * cfpq_data.dataset.data.DOWNLOAD_ATTEMPTS
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        cfpq_data.download("skos")
+
+    partial = cfpq_data.config.GRAPHS_DIR / "skos.tar.gz.part"
+    assert partial.stat().st_size == 10 * cfpq_data.dataset.data.DOWNLOAD_ATTEMPTS
+
+    assert cfpq_data.download("skos").read_bytes() == b"0 1 a\n1 0 b\n"
+    assert not partial.exists()
+
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_download_streaming(dataset, streaming):
+    path = cfpq_data.download("skos", streaming=streaming)
+
+    assert path.read_bytes() == b"0 1 a\n1 0 b\n"
+    assert (path.parent / "skos.md").exists()
+    assert sorted(p.name for p in path.parent.parent.iterdir()) == ["skos"]
+
+    manifest = cfpq_data.dataset.cache._load_manifest("graphs", "skos")
+    assert (
+        manifest["archive_sha256"]
+        == hashlib.sha256(dataset.files["/graph/skos.tar.gz"]).hexdigest()
+    )
+
+
+def test_download_streaming_not_found(dataset):
+    assert cfpq_data.download_grammars("dyck", graph_name="go", streaming=True) is None
+    assert cfpq_data.download_benchmark("MS_Reachability", streaming=True).exists()
+
+
+@pytest.fixture
+def benchmark(dataset):
+    dataset.files["/benchmark/MS_Reachability.tar.gz"] = make_archive(
+        "MS_Reachability",
+        {
+            "core/core.csv": b"0 1 a\n",
+            "core/queries/q1.txt": b"type*\n",
+            "core/src_vertices/10.txt": b"0\n",
+            "core/src_vertices/100.txt": b"0\n1\n",
+            "skos/skos.csv": b"0 1 a\n1 0 b\n",
+            "skos/results/q1.txt": b"0 1\n",
+        },
+    )
+    return dataset
+
+
+def files(path):
+    return sorted(
+        p.relative_to(path).as_posix() for p in path.rglob("*") if p.is_file()
+    )
+
+
+def test_download_benchmark_selective(benchmark):
+    path = cfpq_data.download_benchmark(
+        "MS_Reachability",
+        graphs=["core"],
+        members=["*/queries/*", "*/src_vertices/10.*"],
+    )
+
+    assert files(path) == ["core/queries/q1.txt", "core/src_vertices/10.txt"]
+
+    path = cfpq_data.download_benchmark("MS_Reachability", members=["*/results/*"])
+
+    assert files(path) == [
+        "core/queries/q1.txt",
+        "core/src_vertices/10.txt",
+        "skos/results/q1.txt",
+    ]
+
+    manifest = cfpq_data.dataset.cache._load_manifest("benchmarks", "MS_Reachability")
+    assert len(manifest["index"]) == 6
+    assert sorted(manifest["files"]) == files(path)
+
+
+def test_download_benchmark_selective_cached(benchmark):
+    cfpq_data.download_benchmark("MS_Reachability", streaming=True)
+    benchmark.requests.clear()
+
+    path = cfpq_data.download_benchmark("MS_Reachability", graphs=["skos"])
+
+    assert len(files(path)) == 6
+    assert benchmark.requests == []
+
+
+def test_download_benchmark_reuses_graphs(benchmark):
+    graph = cfpq_data.download("skos")
+
+    path = cfpq_data.download_benchmark("MS_Reachability", graphs=["skos"])
+
+    assert (path / "skos" / "skos.csv").samefile(graph)
+    assert (path / "skos" / "skos.csv").read_bytes() == b"0 1 a\n1 0 b\n"
+
+
+def test_download_materialize_binary(dataset):
+    path = cfpq_data.download("skos", materialize="binary")
+
+    assert path == cfpq_data.download("skos").with_suffix(".npz")
+    assert sorted(cfpq_data.graph_from_npz(path).edges(data="label")) == [
+        (0, 1, "a"),
+        (1, 0, "b"),
+    ]
+
+    manifest = cfpq_data.dataset.cache._load_manifest("graphs", "skos")
+    assert manifest["files"]["skos.npz"]["size"] == path.stat().st_size
+
+    events = []
+    assert cfpq_data.download("skos", materialize="binary", progress=events.append)
+    assert [event["stage"] for event in events] == ["verify"]
+
+
+def test_download_materialize_rise(dataset):
+    with pytest.raises(ValueError):
+        cfpq_data.download("skos", materialize="parquet")
@@ -0,0 +1,79 @@
+import pytest
+
+import cfpq_data
+
+from conftest import make_archive
+
+
+@pytest.fixture
+def graphs(dataset):
+    dataset.files["/graph/wc.tar.gz"] = make_archive(
+        "wc", {"wc.csv": b"0 1 a\n1 2 a\n2 0 b\n"}
+    )
+    return dataset
+
+
+@pytest.mark.parametrize("materialize", [None, "binary"])
+def test_dataset(graphs, materialize):
+    dataset = cfpq_data.Dataset(names=["skos", "wc"], materialize=materialize)
+
+    assert list(dataset) == ["skos", "wc"]
+    assert "go" not in dataset
+    assert dataset.loaded() == []
+
+    g = dataset["skos"]
+
+    assert g.number_of_edges() == 2
+    assert dataset["skos"] is g
+    assert dataset.loaded() == ["skos"]
+    assert dataset.memory_bytes == cfpq_data.estimate_graph_bytes(g)
+
+    graphs.requests.clear()
+    dataset["skos"]
+    assert graphs.requests == []
+
+
+def test_dataset_eviction(graphs):
+    dataset = cfpq_data.Dataset(max_bytes=3000, names=["skos", "wc"])
+
+    skos = dataset["skos"]
+    dataset["wc"]
+
+    assert dataset.loaded() == ["wc"]
+    assert dataset.memory_bytes <= 3000
+    assert dataset["skos"] is not skos
+
+
+def test_dataset_lru(graphs):
+    dataset = cfpq_data.Dataset(max_bytes=5000, names=["skos", "wc"])
+
+    dataset["skos"]
+    dataset["wc"]
+    assert dataset.loaded() == ["skos", "wc"]
+
+    dataset["skos"]
+    assert dataset.loaded() == ["wc", "skos"]
+
+    dataset.evict("wc")
+    assert dataset.loaded() == ["skos"]
+
+    dataset.clear()
+    assert dataset.memory_bytes == 0
+
+
+def test_dataset_too_large(graphs):
+    dataset = cfpq_data.Dataset(max_bytes=100, names=["skos"])
+
+    assert dataset["skos"].number_of_edges() == 2
+    assert dataset.loaded() == []
+
+
+def test_dataset_rise():
+    with pytest.raises(KeyError):
+        cfpq_data.Dataset()[""]
+
+    with pytest.raises(FileNotFoundError):
+        cfpq_data.Dataset(names=[""])
+
+    with pytest.raises(ValueError):
+        cfpq_data.Dataset(max_bytes=-1)
@@ -0,0 +1,66 @@
+import pytest
+
+import cfpq_data
+
+
+def test_metadata_covers_dataset():
+    for name in cfpq_data.DATASET:
+        metadata = cfpq_data.graph_metadata(name)
+
+        assert metadata["nodes"] > 0
+        assert (
+            sum(metadata["labels"].values())
+            + sum(metadata.get("field_edges", {}).values())
+            == metadata["edges"]
+        )
+
+
+def test_metadata_archives():
+    for name in cfpq_data.DATASET:
+        metadata = cfpq_data.graph_metadata(name)
+
+        assert metadata["archive_size"] is None or metadata["archive_size"] > 0
+        assert (
+            metadata["archive_sha256"] is None or len(metadata["archive_sha256"]) == 64
+        )
+
+
+def test_graph_metadata_rise():
+    with pytest.raises(FileNotFoundError):
+        cfpq_data.graph_metadata("")
+
+
+def test_graph_metadata_copy():
+    cfpq_data.graph_metadata("skos")["labels"].clear()
+
+    assert cfpq_data.graph_metadata("skos")["labels"]
+
+
+@pytest.mark.parametrize(
+    "conditions, expected",
+    [
+        (dict(max_edges=300), ["skos", "wc", "generations", "travel", "univ"]),
+        (dict(min_edges=20_000_000), ["taxonomy_hierarchy"]),
+        (dict(min_nodes=10_000_000), ["kernel"]),
+        (
+            dict(max_nodes=150, labels_include=["type"]),
+            ["skos", "generations", "travel"],
+        ),
+        (dict(max_edges=300, labels_exclude=["type"]), ["wc"]),
+        (dict(labels_include=["alloc", "subClassOf"]), []),
+    ],
+)
+def test_select_graphs(conditions, expected):
+    assert cfpq_data.select_graphs(**conditions) == expected
+
+
+def test_select_graphs_all():
+    assert sorted(cfpq_data.select_graphs()) == sorted(cfpq_data.DATASET)
+
+
+def test_select_graphs_java():
+    names = cfpq_data.select_graphs(labels_include=["alloc", "assign"])
+
+    assert len(names) == 14
+    assert all("field_edges" in cfpq_data.graph_metadata(name) for name in names)
+    assert cfpq_data.select_graphs(labels_include=["load_*"]) == []
@@ -0,0 +1,40 @@
+import pytest
+
+import cfpq_data
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_download_progress(dataset, streaming):
+    events = []
+
+    cfpq_data.download("skos", streaming=streaming, progress=events.append)
+
+    done = {event["stage"]: event for event in events if event["done"]}
+    assert set(done) == set(cfpq_data.STAGES) - {"materialize"}
+    assert all(event["kind"] == "graphs" for event in events)
+    assert all(event["name"] == "skos" for event in events)
+    assert all(event["elapsed"] >= 0 for event in events)
+
+    archive = dataset.files["/graph/skos.tar.gz"]
+    assert done["download"]["bytes"] == done["download"]["total"] == len(archive)
+    assert done["extract"]["bytes"] == len(b"0 1 a\n1 0 b\n") + len(b"# skos\n")
+
+
+def test_download_progress_cached(dataset):
+    cfpq_data.download("skos")
+    events = []
+
+    cfpq_data.download("skos", progress=events.append)
+
+    assert [event["stage"] for event in events] == ["verify"]
+
+
+def test_download_many_progress(dataset):
+    events = []
+
+    paths, errors = cfpq_data.download_many(["skos"], progress=events.append)
+
+    assert sorted(paths) == ["skos"]
+    assert {event["stage"] for event in events} == set(cfpq_data.STAGES) - {
+        "materialize"
+    }
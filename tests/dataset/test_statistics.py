@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+import cfpq_data
+
+from conftest import make_archive
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 1 << 20])
+def test_csv_statistics(tmp_path, chunksize):
+    path = tmp_path / "test.csv"
+    path.write_text("0 1 b\n1 2 a\n2 0 b\n5 5 c\n")
+
+    statistics = cfpq_data.csv_statistics(path, chunksize=chunksize)
+    graph = cfpq_data.graph_from_csv(path)
+
+    assert statistics["nodes"] == graph.number_of_nodes()
+    assert statistics["edges"] == graph.number_of_edges()
+    assert statistics["labels"] == dict(cfpq_data.get_labels_frequency(graph))
+    assert list(statistics["labels"]) == cfpq_data.get_sorted_labels(graph)
+
+
+def test_dataset_statistics(dataset):
+    dataset.files["/graph/wc.tar.gz"] = make_archive(
+        "wc", {"wc.csv": b"0 1 a\n1 2 a\n2 0 b\n"}
+    )
+
+    statistics = cfpq_data.dataset_statistics(["skos", "wc"], max_workers=2)
+
+    assert statistics == {
+        "skos": {"nodes": 2, "edges": 2, "labels": {"a": 1, "b": 1}},
+        "wc": {"nodes": 3, "edges": 3, "labels": {"a": 2, "b": 1}},
+    }
+
+    cached = sorted((cfpq_data.config.DATA / "statistics").glob("*.json"))
+    assert len(cached) == 2
+
+    for path in cached:
+        path.write_text(json.dumps({"nodes": 0, "edges": 0, "labels": {}}))
+
+    statistics = cfpq_data.dataset_statistics(["wc"])
+
+    assert statistics == {"wc": {"nodes": 0, "edges": 0, "labels": {}}}
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 1 << 20])
+def test_csv_statistics_mixed_chunks(tmp_path, chunksize):
+    path = tmp_path / "test.csv"
+    path.write_text("1 2 1\n2 3 1\nx 1 a\n3 x 1\n1 y 2\n")
+
+    statistics = cfpq_data.csv_statistics(path, chunksize=chunksize)
+
+    assert statistics == {
+        "nodes": 5,
+        "edges": 5,
+        "labels": {"1": 3, "2": 1, "a": 1},
+    }
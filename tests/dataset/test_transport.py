@@ -0,0 +1,135 @@
+import contextlib
+import io
+import tarfile
+
+import pytest
+
+import cfpq_data
+
+from conftest import make_archive
+
+
+@pytest.fixture
+def mirror(dataset, tmp_path):
+    path = tmp_path / "mirror"
+
+    for url, archive in dataset.files.items():
+        (path / url[1:]).parent.mkdir(parents=True, exist_ok=True)
+        (path / url[1:]).write_bytes(archive)
+
+    yield path
+
+    cfpq_data.set_mirror()
+
+
+@pytest.mark.parametrize("as_uri", [True, False])
+@pytest.mark.parametrize("streaming", [True, False])
+def test_local_mirror(mirror, as_uri, streaming):
+    cfpq_data.set_mirror(mirror.as_uri() if as_uri else mirror)
+
+    path = cfpq_data.download("skos", streaming=streaming)
+
+    assert path.read_bytes() == b"0 1 a\n1 0 b\n"
+    assert cfpq_data.download_grammars("dyck", streaming=streaming).exists()
+    assert cfpq_data.download_grammars("dyck", graph_name="go") is None
+    assert cfpq_data.download_benchmark("MS_Reachability").exists()
+
+    with pytest.raises(FileNotFoundError):
+        cfpq_data.download("go", streaming=streaming)
+
+
+def test_local_mirror_resume(mirror):
+    cfpq_data.set_mirror(mirror)
+
+    archive = (mirror / "graph" / "skos.tar.gz").read_bytes()
+    partial = cfpq_data.config.GRAPHS_DIR / "skos.tar.gz.part"
+    partial.parent.mkdir(parents=True)
+    partial.write_bytes(archive[:10])
+
+    assert cfpq_data.download("skos").read_bytes() == b"0 1 a\n1 0 b\n"
+
+
+def test_build_mirror(dataset, tmp_path):
+    cfpq_data.download("skos")
+    cfpq_data.download_grammars("dyck")
+    cfpq_data.download_benchmark("MS_Reachability")
+
+    mirror = cfpq_data.build_mirror(tmp_path / "mirror")
+
+    assert sorted(
+        p.relative_to(mirror).as_posix() for p in mirror.rglob("*.tar.gz")
+    ) == [
+        "benchmark/MS_Reachability.tar.gz",
+        "grammar/example/dyck.tar.gz",
+        "graph/skos.tar.gz",
+    ]
+
+    cfpq_data.config.set_data_root(tmp_path / "node")
+    cfpq_data.set_mirror(mirror)
+
+    try:
+        assert cfpq_data.download("skos").read_bytes() == b"0 1 a\n1 0 b\n"
+        assert (cfpq_data.download_grammars("dyck") / "dyck.cfg").exists()
+        assert len(dataset.requests) == 3
+    finally:
+        cfpq_data.set_mirror()
+
+
+def test_build_mirror_partial(dataset, tmp_path):
+    dataset.files["/benchmark/MS_Reachability.tar.gz"] = make_archive(
+        "MS_Reachability",
+        {"core/queries/q1.txt": b"type*\n", "core/results/q1.txt": b"0 1\n"},
+    )
+
+    cfpq_data.download("skos")
+    cfpq_data.download_benchmark("MS_Reachability", members=["*/results/*"])
+
+    mirror = cfpq_data.build_mirror(tmp_path / "mirror")
+
+    assert sorted(
+        p.relative_to(mirror).as_posix() for p in mirror.rglob("*.tar.gz")
+    ) == ["graph/skos.tar.gz"]
+
+    cfpq_data.download_benchmark("MS_Reachability")
+    cfpq_data.build_mirror(mirror)
+
+    assert (mirror / "benchmark" / "MS_Reachability.tar.gz").exists()
+
+
+def test_build_mirror_materialized(dataset, tmp_path):
+    cfpq_data.download("skos", materialize="binary")
+
+    mirror = cfpq_data.build_mirror(tmp_path / "mirror")
+
+    with tarfile.open(mirror / "graph" / "skos.tar.gz") as tar:
+        assert sorted(tar.getnames()) == ["skos/skos.csv", "skos/skos.md"]
+
+
+def test_register_transport(dataset):
+    archives = {"memory://graph/skos.tar.gz": make_archive("skos", {"skos.csv": b""})}
+
+    @contextlib.contextmanager
+    def memory_open(url, offset):
+        if url not in archives:
+            raise FileNotFoundError(url)
+        yield io.BytesIO(archives[url]), 0, len(archives[url])
+
+    cfpq_data.register_transport("memory", memory_open)
+    cfpq_data.set_mirror("memory://")
+
+    try:
+        assert cfpq_data.download("skos").read_bytes() == b""
+        assert cfpq_data.download_grammars("dyck") is None
+    finally:
+        cfpq_data.set_mirror()
+        del cfpq_data.TRANSPORTS["memory"]
+
+
+def test_unknown_transport(dataset):
+    cfpq_data.set_mirror("unknown://")
+
+    try:
+        with pytest.raises(ValueError):
+            cfpq_data.download("skos")
+    finally:
+        cfpq_data.set_mirror()
@@ -0,0 +1,116 @@
+import os
+
+import pytest
+
+import cfpq_data
+
+pa = pytest.importorskip("pyarrow")
+
+g1 = cfpq_data.labeled_binomial_graph(42, 0.42, labels="abc", seed=42)
+g2 = cfpq_data.graph_from_text(["1 A 2", "x B y", "1 A 2", "y C 1"])
+
+
+def _edges(graph):
+    if isinstance(graph, cfpq_data.LabeledEdgeList):
+        graph = graph.to_networkx()
+
+    return sorted(tuple(map(str, edge)) for edge in graph.edges(data="label"))
+
+
+@pytest.mark.parametrize(
+    "write, read, path",
+    [
+        (cfpq_data.graph_to_parquet, cfpq_data.graph_from_parquet, "test.parquet"),
+        (cfpq_data.graph_to_feather, cfpq_data.graph_from_feather, "test.feather"),
+    ],
+)
+@pytest.mark.parametrize("graph", [g1, g2])
+@pytest.mark.parametrize("backend", ["networkx", "edgelist"])
+def test_arrow(write, read, path, graph, backend):
+    write(graph, path)
+    gin = read(path, backend=backend)
+
+    os.remove(path)
+
+    assert _edges(gin) == _edges(graph)
+
+
+@pytest.mark.parametrize(
+    "write, read, path",
+    [
+        (cfpq_data.graph_to_parquet, cfpq_data.graph_from_parquet, "test.parquet"),
+        (cfpq_data.graph_to_feather, cfpq_data.graph_from_feather, "test.feather"),
+    ],
+)
+@pytest.mark.parametrize("labels", [["a"], ["b", "c"], []])
+def test_arrow_labels(write, read, path, labels):
+    write(g1, path)
+    gin = read(path, labels=labels)
+
+    os.remove(path)
+
+    assert _edges(gin) == _edges(cfpq_data.filter_edges(g1, labels))
+
+
+def test_parquet_schema():
+    path = cfpq_data.graph_to_parquet(g1, "test.parquet")
+    table = cfpq_data.load_parquet_table(path)
+
+    os.remove("test.parquet")
+
+    assert table.column_names == ["from", "to", "label"]
+    assert pa.types.is_integer(table.schema.field("from").type)
+    assert pa.types.is_dictionary(table.schema.field("label").type)
+
+
+def test_parquet_row_groups():
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = cfpq_data.graph_to_parquet(g1, "test.parquet", row_group_size=10)
+
+    row_groups = pq.ParquetFile(path).metadata
+    statistics = [
+        row_groups.row_group(i).column(2).statistics
+        for i in range(row_groups.num_row_groups)
+    ]
+
+    table = cfpq_data.load_parquet_table(path, columns=["from", "to"], labels=["b"])
+
+    os.remove("test.parquet")
+
+    assert all(a.max <= b.min for a, b in zip(statistics, statistics[1:]))
+    assert table.column_names == ["from", "to"]
+    assert table.num_rows == sum(1 for _, _, e in g1.edges(data="label") if e == "b")
+
+
+def test_feather_projection():
+    path = cfpq_data.graph_to_feather(g2, "test.feather", compression=None)
+    table = cfpq_data.load_feather_table(path, columns=["to"], labels=["A"])
+
+    os.remove("test.feather")
+
+    assert table.column_names == ["to"]
+    assert table.to_pydict() == {"to": ["2", "2"]}
+
+
+@pytest.mark.parametrize(
+    "write, path",
+    [
+        (cfpq_data.graph_to_parquet, "test.parquet"),
+        (cfpq_data.graph_to_feather, "test.feather"),
+    ],
+)
+@pytest.mark.parametrize(
+    "edges",
+    [
+        [(1, "1", "a"), ("x", 1, "b")],
+        [(1, 2, 1), (2, 1, "1")],
+    ],
+)
+def test_arrow_ambiguous_names(write, path, edges):
+    graph = cfpq_data.LabeledEdgeList.from_edges(edges).to_networkx()
+
+    with pytest.raises(ValueError):
+        write(graph, path)
+
+    assert not os.path.exists(path)
@@ -0,0 +1,110 @@
+import os
+
+import pytest
+
+import cfpq_data
+
+g1 = cfpq_data.labeled_binomial_graph(42, 0.42, seed=42)
+g2 = cfpq_data.graph_from_text(["1 A 2", "x B y", "1 A 2"])
+
+
+@pytest.mark.parametrize(
+    "graph, chunksize",
+    [
+        (g1, 1),
+        (g1, 100),
+        (g1, 10**6),
+        (g2, 2),
+    ],
+)
+def test_iter_edges_csv(graph, chunksize):
+    path = cfpq_data.graph_to_csv(graph, "test.csv")
+
+    chunks = list(cfpq_data.iter_edges_csv(path, chunksize=chunksize))
+
+    os.remove("test.csv")
+
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == graph.number_of_edges()
+    assert sorted(
+        tuple(map(str, edge))
+        for chunk in chunks
+        for edge in chunk.itertuples(index=False, name=None)
+    ) == sorted(tuple(map(str, edge)) for edge in graph.edges(data="label"))
+
+
+@pytest.mark.parametrize("labels", [["a"], ["a", "b"], [], ["z"]])
+@pytest.mark.parametrize("backend", ["networkx", "edgelist"])
+def test_graph_from_csv_labels(labels, backend):
+    graph = cfpq_data.labeled_binomial_graph(42, 0.42, labels="abc", seed=42)
+    path = cfpq_data.graph_to_csv(graph, "test.csv")
+
+    gin = cfpq_data.graph_from_csv(path, labels=labels, backend=backend)
+
+    os.remove("test.csv")
+
+    if backend == "edgelist":
+        gin = gin.to_networkx()
+
+    expected = cfpq_data.filter_edges(graph, labels)
+
+    assert sorted(gin.edges(data="label")) == sorted(expected.edges(data="label"))
+
+
+@pytest.mark.parametrize("graph", [g1, g2])
+def test_graph_to_csv_format(graph):
+    path = cfpq_data.graph_to_csv(graph, "test.csv")
+
+    with open(path) as f:
+        text = f.read()
+
+    cfpq_data.graph_to_csv(cfpq_data.LabeledEdgeList.from_networkx(graph), path)
+
+    with open(path) as f:
+        edge_list_text = f.read()
+
+    os.remove("test.csv")
+
+    expected = "".join(f"{u} {v} {e}\n" for u, v, e in graph.edges(data="label"))
+
+    assert text == expected
+    assert sorted(edge_list_text.splitlines()) == sorted(expected.splitlines())
+
+
+@pytest.mark.parametrize("labels", [["1"], [1]])
+@pytest.mark.parametrize("chunksize", [1, 2, 10**6])
+def test_graph_from_csv_labels_chunks(labels, chunksize, monkeypatch):
+    monkeypatch.setattr(cfpq_data.graphs.readwrite.csv, "EDGES_CHUNK_SIZE", chunksize)
+
+    with open("test.csv", "w") as f:
+        f.write("1 2 1\n2 3 1\n3 4 a\n4 1 1\n")
+
+    gin = cfpq_data.graph_from_csv("test.csv", labels=labels)
+
+    os.remove("test.csv")
+
+    assert sorted(gin.edges(data="label")) == [(1, 2, "1"), (2, 3, "1"), (4, 1, "1")]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "1 2 a\n2 3 a\nx 2 a\n2 y a\n",
+        "1 2 a\n2 3 b\n3 1 a\n",
+        "1 2 a\n2 3 a\n3 x a\n",
+    ],
+)
+@pytest.mark.parametrize("chunksize", [1, 2, 3, 10**6])
+def test_graph_from_csv_labels_nodes_chunks(text, chunksize, monkeypatch):
+    monkeypatch.setattr(cfpq_data.graphs.readwrite.csv, "EDGES_CHUNK_SIZE", chunksize)
+
+    with open("test.csv", "w") as f:
+        f.write(text)
+
+    gin = cfpq_data.graph_from_csv("test.csv", labels=["a"])
+    expected = cfpq_data.filter_edges(cfpq_data.graph_from_csv("test.csv"), ["a"])
+
+    os.remove("test.csv")
+
+    assert sorted(map(repr, gin.nodes)) == sorted(map(repr, expected.nodes))
+    assert sorted(map(repr, gin.edges())) == sorted(map(repr, expected.edges()))
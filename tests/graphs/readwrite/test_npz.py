@@ -0,0 +1,82 @@
+import os
+import random
+
+import pytest
+
+import cfpq_data
+
+seed = 42
+random.seed(seed)
+
+g1 = cfpq_data.labeled_binomial_graph(42, 0.42, seed=seed)
+g2 = cfpq_data.labeled_binomial_graph(42, 0.73, seed=seed)
+g3 = cfpq_data.graph_from_text(["1 A 2", "x B y", "1 A 2"])
+
+
+@pytest.mark.parametrize(
+    "graph",
+    [
+        g1,
+        g2,
+        g3,
+    ],
+)
+def test_npz(graph):
+    path = cfpq_data.graph_to_npz(graph, "test.npz")
+    gin = cfpq_data.graph_from_npz(path)
+
+    os.remove("test.npz")
+
+    assert list(graph.nodes) == list(gin.nodes)
+    assert sorted(graph.edges(data="label")) == sorted(gin.edges(data="label"))
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_load_npz_arrays(mmap):
+    graph = cfpq_data.graph_from_text(["1 b 2", "1 a 2", "3 b 1", "1 b 3"])
+    path = cfpq_data.graph_to_npz(graph, "test.npz")
+
+    arrays = cfpq_data.load_npz_arrays(path, mmap=mmap)
+
+    assert arrays["nodes"].tolist() == ["1", "2", "3"]
+    assert arrays["labels"].tolist() == ["b", "a"]
+    assert arrays["label_indptr"].tolist() == [0, 2, 3]
+    assert arrays["rows"].tolist() == [0, 2, 0]
+    assert arrays["indptr"].tolist() == [0, 2, 3, 4]
+    assert arrays["indices"].tolist() == [1, 2, 0, 1]
+    assert arrays["label_codes"].tolist() == [0, 0, 0, 1]
+
+    del arrays
+    os.remove("test.npz")
+
+
+def test_csv_to_npz(tmp_path):
+    source = tmp_path / "test.csv"
+    source.write_text("0 1 a\n1 0 b\n5 1 a\n")
+
+    path = cfpq_data.graphs.readwrite.npz._csv_to_npz(source, tmp_path / "test.npz")
+
+    graph = cfpq_data.graph_from_csv(source)
+    gin = cfpq_data.graph_from_npz(path)
+
+    assert sorted(graph.edges(data="label")) == sorted(gin.edges(data="label"))
+
+
+def test_npz_missing_label():
+    graph = cfpq_data.graph_from_text(["1 a 2"])
+    graph.add_edge("2", "3")
+
+    with pytest.raises(ValueError):
+        cfpq_data.graph_to_npz(graph, "test.npz")
+
+    assert not os.path.exists("test.npz")
+
+
+def test_npz_ambiguous_nodes():
+    graph = cfpq_data.graph_from_text(["1 a 2", "3 b 4"])
+    graph.add_edge(1, "2", label="a")
+
+    with pytest.raises(ValueError):
+        cfpq_data.graph_to_npz(graph, "test.npz")
+
+    assert not os.path.exists("test.npz")
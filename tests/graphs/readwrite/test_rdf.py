@@ -1,6 +1,8 @@
 import os
 
 import pytest
+import rdflib
+import rdflib.compare
 
 import cfpq_data
 
@@ -36,3 +38,129 @@ def test_nodes():
 
     assert tmp.number_of_nodes() == g.number_of_nodes()
     assert tmp.number_of_edges() == g.number_of_edges()
+
+
+@pytest.mark.parametrize(
+    "labels, expected_edges", [(["A"], 2), (["A", "B"], 3), ([], 0)]
+)
+def test_labels(labels, expected_edges):
+    tmp = cfpq_data.graph_from_text(["1 A 2", "2 B 3", "3 A 1", "3 C 4"])
+    path = cfpq_data.graph_to_rdf(tmp, "test.ttl")
+    g = cfpq_data.graph_from_rdf(path, labels=labels)
+
+    os.remove("test.ttl")
+
+    assert g.number_of_edges() == expected_edges
+    assert sorted({str(label) for _, _, label in g.edges(data="label")}) == labels
+
+
+NTRIPLES = """\
+<http://example.org/s> <http://example.org/p> "he said \\"hi\\"\\n"@en .
+<http://example.org/s> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://example.org/C> .
+_:b1 <http://example.org/p> "1"^^<http://www.w3.org/2001/XMLSchema#integer> .
+_:b1 <http://example.org/q> <http://example.org/\\u00e9> .
+# comment
+_:b1 <http://example.org/q> <http://example.org/\\u00e9> .
+"""
+
+TURTLE = """\
+@prefix ex: <http://example.org/> .
+PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+
+ex:s a ex:C .
+_:b1 ex:p "x"^^xsd:string .
+_:b1 ex:p _:b2 .
+ex:s ex:p "y"@en-US.
+"""
+
+NESTED_TURTLE = """\
+@prefix ex: <http://example.org/> .
+
+ex:s ex:p [ ex:q ex:o ] ; ex:r 42 .
+"""
+
+
+@pytest.mark.parametrize(
+    "text, path",
+    [
+        (NTRIPLES, "test.nt"),
+        (TURTLE, "test.ttl"),
+        (NESTED_TURTLE, "test.ttl"),
+    ],
+)
+@pytest.mark.parametrize("backend", ["networkx", "edgelist"])
+def test_streaming(text, path, backend):
+    with open(path, "w") as f:
+        f.write(text)
+
+    g = cfpq_data.graph_from_rdf(path, backend=backend)
+
+    expected = rdflib.Graph()
+    expected.parse(path)
+
+    os.remove(path)
+
+    if backend == "edgelist":
+        g = g.to_networkx()
+
+    def terms(triples):
+        return sorted(
+            (
+                type(subj).__name__,
+                type(pred).__name__,
+                type(obj).__name__,
+                str(pred),
+                None if isinstance(obj, rdflib.BNode) else obj,
+            )
+            for subj, pred, obj in triples
+        )
+
+    assert g.number_of_nodes() == len(
+        set(expected.subjects()) | set(expected.objects())
+    )
+    assert terms((u, e, v) for u, v, e in g.edges(data="label")) == terms(expected)
+
+
+@pytest.mark.parametrize("path", ["test.nt", "test.ttl", "test.n3"])
+def test_graph_to_rdf(path):
+    tmp = cfpq_data.graph_from_text(["1 A 2", "2 A 1", "'x y' 'B \"\\\\ C' 1"])
+    cfpq_data.graph_to_rdf(tmp, path)
+
+    expected = rdflib.Graph()
+    for u, v, label in tmp.edges(data="label"):
+        expected.add(
+            (
+                rdflib.BNode(u),
+                rdflib.Literal(label, datatype=rdflib.XSD.string),
+                rdflib.BNode(v),
+            )
+        )
+
+    g = cfpq_data.graph_from_rdf(path)
+
+    actual = rdflib.Graph()
+    actual.parse(path, format="turtle")
+
+    os.remove(path)
+
+    assert rdflib.compare.isomorphic(actual, expected)
+    assert g.number_of_nodes() == tmp.number_of_nodes()
+    assert sorted(str(label) for _, _, label in g.edges(data="label")) == sorted(
+        label for _, _, label in tmp.edges(data="label")
+    )
+
+
+def test_graph_to_rdf_edge_list():
+    tmp = cfpq_data.labeled_two_cycles_graph(3, 4, labels=("a", "b"))
+    path = cfpq_data.graph_to_rdf(
+        cfpq_data.LabeledEdgeList.from_networkx(tmp), "test.nt"
+    )
+
+    g = cfpq_data.graph_from_rdf(path)
+
+    os.remove("test.nt")
+
+    assert g.number_of_nodes() == tmp.number_of_nodes()
+    assert sorted(str(label) for _, _, label in g.edges(data="label")) == sorted(
+        label for _, _, label in tmp.edges(data="label")
+    )
@@ -62,3 +62,93 @@ def test_text(graph, quoting):
 def test_text_format():
     with pytest.raises(ValueError):
         cfpq_data.graph_from_text(["1 2 3 4"])
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 1000])
+def test_iter_edges_txt(chunksize):
+    graph = cfpq_data.graph_from_text(["1 A 2", "2 B 3", "'x y' A 1", "3 B 1"])
+    path = cfpq_data.graph_to_txt(graph, "test.txt", quoting=True)
+
+    chunks = list(cfpq_data.iter_edges_txt(path, chunksize=chunksize))
+
+    os.remove("test.txt")
+
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    assert sorted(
+        edge for chunk in chunks for edge in chunk.itertuples(index=False, name=None)
+    ) == sorted(graph.edges(data="label"))
+
+
+@pytest.mark.parametrize("labels", [["A"], ["A", "B"], []])
+def test_graph_from_txt_labels(labels):
+    graph = cfpq_data.graph_from_text(["1 A 2", "2 B 3", "3 C 1", "4 A 4"])
+    path = cfpq_data.graph_to_txt(graph, "test.txt")
+
+    gin = cfpq_data.graph_from_txt(path, labels=labels)
+
+    os.remove("test.txt")
+
+    expected = cfpq_data.filter_edges(graph, labels)
+
+    assert sorted(gin.edges(data="label")) == sorted(expected.edges(data="label"))
+    assert set(gin.nodes) == {n for edge in gin.edges for n in edge[:2]}
+
+
+@pytest.mark.parametrize("labels", [[1], ["1"]])
+def test_graph_from_txt_labels_as_strings(labels):
+    with open("test.txt", "w") as f:
+        f.write("1 1 2\n2 a 3\n")
+
+    gin = cfpq_data.graph_from_txt("test.txt", labels=labels)
+
+    with open("test.csv", "w") as f:
+        f.write("1 2 1\n2 3 a\n")
+
+    expected = cfpq_data.graph_from_csv("test.csv", labels=labels)
+
+    os.remove("test.txt")
+    os.remove("test.csv")
+
+    assert list(gin.edges(data="label")) == [("1", "2", "1")]
+    assert [e for _, _, e in expected.edges(data="label")] == ["1"]
+
+
+@pytest.mark.parametrize("quoting", [True, False])
+def test_graph_to_txt_format(quoting):
+    path = cfpq_data.graph_to_txt(g1, "test.txt", quoting=quoting)
+
+    with open(path) as f:
+        text = f.read()
+
+    os.remove("test.txt")
+
+    if quoting:
+        expected = [f"'{u}' '{e}' '{v}'" for u, v, e in g1.edges(data="label")]
+    else:
+        expected = [f"{u} {e} {v}" for u, v, e in g1.edges(data="label")]
+
+    assert text == "".join(f"{line}\n" for line in expected)
+    assert list(cfpq_data.graph_to_text(g1, quoting=quoting)) == expected
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("1 A 2", ("1", "2", "A")),
+        ("1\tA  2\r\n", ("1", "2", "A")),
+        ("  1 A 2  \n", ("1", "2", "A")),
+        ("'1 2' A 3", ("1 2", "3", "A")),
+        ("\"1\" 'A' 2", ("1", "2", "A")),
+        ("1\\ 2 A 3", ("1 2", "3", "A")),
+    ],
+)
+def test_text_quoting(line, expected):
+    g = cfpq_data.graph_from_text([line])
+
+    assert list(g.edges(data="label")) == [expected]
+
+
+@pytest.mark.parametrize("line", ["1 A", "1 A 2 3", "'1 A 2", "1\x0bA 2"])
+def test_text_malformed(line):
+    with pytest.raises(ValueError):
+        cfpq_data.graph_from_text([line])
@@ -0,0 +1,123 @@
+import os
+
+import networkx as nx
+import pytest
+import rdflib
+
+import cfpq_data
+
+
+def _edges(graph):
+    if isinstance(graph, cfpq_data.LabeledEdgeList):
+        return sorted(map(str, graph.edges()))
+
+    return sorted(map(str, graph.edges(data="label")))
+
+
+@pytest.mark.parametrize(
+    "graph",
+    [
+        cfpq_data.labeled_two_cycles_graph(3, 4, labels=("a", "b")),
+        cfpq_data.graph_from_text(["x A y", "y B x", "y B x"]),
+        cfpq_data.labeled_cycle_graph(5, label="c"),
+    ],
+)
+def test_networkx_round_trip(graph):
+    edge_list = cfpq_data.LabeledEdgeList.from_networkx(graph)
+    gin = edge_list.to_networkx()
+
+    assert edge_list.number_of_nodes() == graph.number_of_nodes()
+    assert len(edge_list) == graph.number_of_edges()
+    assert list(gin.nodes) == list(graph.nodes)
+    assert _edges(gin) == _edges(graph)
+
+
+def test_isolated_nodes():
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from([0, 1, 2])
+    graph.add_edge(0, 1, label="a")
+
+    edge_list = cfpq_data.LabeledEdgeList.from_networkx(graph)
+
+    assert edge_list.number_of_nodes() == 3
+    assert edge_list.nodes.dtype.kind == "i"
+    assert list(edge_list.to_networkx().nodes) == [0, 1, 2]
+
+
+def test_mismatched_edges():
+    with pytest.raises(ValueError):
+        cfpq_data.LabeledEdgeList([0, 1], ["a"], [0, 1], [1], [0, 0])
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        cfpq_data.labeled_cycle_graph(3, backend="igraph")
+
+
+def test_generator_backend():
+    graph = cfpq_data.labeled_binomial_graph(20, 0.3, seed=42)
+    edge_list = cfpq_data.labeled_binomial_graph(20, 0.3, seed=42, backend="edgelist")
+
+    assert isinstance(edge_list, cfpq_data.LabeledEdgeList)
+    assert _edges(edge_list) == _edges(graph)
+
+
+@pytest.mark.parametrize(
+    "write, read, path",
+    [
+        (cfpq_data.graph_to_csv, cfpq_data.graph_from_csv, "test.csv"),
+        (cfpq_data.graph_to_txt, cfpq_data.graph_from_txt, "test.txt"),
+        (cfpq_data.graph_to_npz, cfpq_data.graph_from_npz, "test.npz"),
+    ],
+)
+def test_readers_backend(write, read, path):
+    graph = cfpq_data.labeled_two_cycles_graph(3, 4, labels=("a", "b"))
+    write(graph, path)
+
+    gin = read(path)
+    edge_list = read(path, backend="edgelist")
+
+    os.remove(path)
+
+    assert isinstance(edge_list, cfpq_data.LabeledEdgeList)
+    assert edge_list.number_of_nodes() == gin.number_of_nodes()
+    assert _edges(edge_list) == _edges(gin)
+
+
+def test_rdf_backend():
+    graph = cfpq_data.graph_from_text(["x A y", "y B x"])
+    cfpq_data.graph_to_rdf(graph, "test.ttl")
+
+    gin = cfpq_data.graph_from_rdf("test.ttl")
+    edge_list = cfpq_data.graph_from_rdf("test.ttl", backend="edgelist")
+
+    os.remove("test.ttl")
+
+    assert edge_list.number_of_nodes() == gin.number_of_nodes()
+    assert sorted(e for _, _, e in edge_list.edges()) == sorted(
+        e for _, _, e in gin.edges(data="label")
+    )
+    assert all(isinstance(node, rdflib.BNode) for node in edge_list.nodes)
+    assert all(isinstance(label, rdflib.Literal) for label in edge_list.labels)
+
+
+def test_unlabeled_edge():
+    graph = nx.MultiDiGraph()
+    graph.add_edge(0, 1, label="a")
+    graph.add_edge(1, 2)
+
+    with pytest.raises(ValueError):
+        cfpq_data.LabeledEdgeList.from_networkx(graph)
+
+
+def test_na_label_csv():
+    with open("test.csv", "w") as f:
+        f.write("1 2 a\n2 3 NA\n3 1 null\n")
+
+    gin = cfpq_data.graph_from_csv("test.csv")
+    edge_list = cfpq_data.graph_from_csv("test.csv", backend="edgelist")
+
+    os.remove("test.csv")
+
+    assert _edges(edge_list) == _edges(gin)
+    assert sorted(e for _, _, e in edge_list.edges()) == ["NA", "a", "null"]
@@ -0,0 +1,62 @@
+import os
+
+import pytest
+
+import cfpq_data
+
+pytest.importorskip("scipy")
+
+g1 = cfpq_data.labeled_two_cycles_graph(42, 29)
+g2 = cfpq_data.graph_from_text(["1 a 2", "1 a 2", "2 b 3", "3 a 1"])
+
+
+def edges(matrices, nodes):
+    names = {i: node for node, i in nodes.items()}
+    return sorted(
+        (names[u], names[v], label)
+        for label, matrix in matrices.items()
+        for u, v in zip(*matrix.nonzero())
+    )
+
+
+@pytest.mark.parametrize("graph", [g1, g2])
+def test_graph_to_label_matrices(graph):
+    matrices, nodes = cfpq_data.graph_to_label_matrices(graph)
+
+    assert list(nodes) == list(graph.nodes)
+    assert all(matrix.dtype == bool for matrix in matrices.values())
+    assert edges(matrices, nodes) == sorted(set(graph.edges(data="label")))
+
+
+@pytest.mark.parametrize("graph", [g1, g2])
+def test_label_matrices_from_files(graph, tmp_path):
+    expected = sorted(set(graph.edges(data="label")))
+
+    csv = cfpq_data.graph_to_csv(graph, tmp_path / "test.csv")
+    matrices, nodes = cfpq_data.label_matrices_from_csv(csv)
+    assert sorted((str(u), str(v), e) for u, v, e in edges(matrices, nodes)) == sorted(
+        (str(u), str(v), e) for u, v, e in expected
+    )
+
+    npz = cfpq_data.graph_to_npz(graph, tmp_path / "test.npz")
+    matrices, nodes = cfpq_data.label_matrices_from_npz(npz)
+    assert list(nodes) == list(graph.nodes)
+    assert edges(matrices, nodes) == expected
+
+
+def test_label_matrices_missing_label(tmp_path):
+    graph = cfpq_data.graph_from_text(["1 a 2", "2 b 3"])
+    graph.add_edge("3", "1")
+
+    with pytest.raises(ValueError):
+        cfpq_data.graph_to_label_matrices(graph)
+
+    csv = tmp_path / "test.csv"
+    csv.write_text("1 2 a\n2 3\n3 1 NA\n")
+
+    with pytest.raises(ValueError):
+        cfpq_data.label_matrices_from_csv(csv)
+
+    csv.write_text("1 2 a\n3 1 NA\n")
+    matrices, nodes = cfpq_data.label_matrices_from_csv(csv)
+    assert edges(matrices, nodes) == [(1, 2, "a"), (3, 1, "NA")]
@@ -0,0 +1,110 @@
+import importlib.util
+import os
+
+import pytest
+
+import cfpq_data
+
+SUFFIXES = [
+    ".gz",
+    ".bz2",
+    ".xz",
+    pytest.param(
+        ".zst",
+        marks=pytest.mark.skipif(
+            importlib.util.find_spec("zstandard") is None,
+            reason="zstandard is not installed",
+        ),
+    ),
+]
+
+MAGIC = {
+    ".gz": b"\x1f\x8b",
+    ".bz2": b"BZh",
+    ".xz": b"\xfd7zXZ",
+    ".zst": b"\x28\xb5\x2f\xfd",
+}
+
+graph = cfpq_data.labeled_two_cycles_graph(3, 4, labels=("a", "b"))
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("graph.csv", None),
+        ("graph.csv.gz", "gzip"),
+        ("graph.txt.BZ2", "bz2"),
+        ("graph.ttl.xz", "xz"),
+        ("graph.npz.zst", "zstd"),
+    ],
+)
+def test_compression_of(path, expected):
+    assert cfpq_data.compression_of(path) == expected
+
+
+@pytest.mark.parametrize("suffix", SUFFIXES)
+@pytest.mark.parametrize("mode", ["", "b"])
+def test_open_file(suffix, mode):
+    data = "1 a 2\n2 b 1\n"
+    if mode == "b":
+        data = data.encode()
+
+    path = f"test.txt{suffix}"
+
+    with cfpq_data.open_file(path, "w" + mode) as f:
+        f.write(data)
+
+    with open(path, "rb") as f:
+        magic = f.read(len(MAGIC[suffix]))
+
+    with cfpq_data.open_file(path, "r" + mode) as f:
+        actual = f.read()
+
+    os.remove(path)
+
+    assert magic == MAGIC[suffix]
+    assert actual == data
+
+
+@pytest.mark.parametrize("suffix", SUFFIXES)
+@pytest.mark.parametrize(
+    "write, read, name",
+    [
+        (cfpq_data.graph_to_csv, cfpq_data.graph_from_csv, "test.csv"),
+        (cfpq_data.graph_to_txt, cfpq_data.graph_from_txt, "test.txt"),
+        (cfpq_data.graph_to_npz, cfpq_data.graph_from_npz, "test.npz"),
+        (cfpq_data.graph_to_rdf, cfpq_data.graph_from_rdf, "test.ttl"),
+    ],
+)
+def test_graph_readwrite(suffix, write, read, name):
+    path = write(graph, name + suffix)
+    gin = read(path)
+
+    os.remove(path)
+
+    assert gin.number_of_nodes() == graph.number_of_nodes()
+    assert sorted(str(e) for _, _, e in gin.edges(data="label")) == sorted(
+        e for _, _, e in graph.edges(data="label")
+    )
+
+
+@pytest.mark.parametrize("suffix", SUFFIXES)
+def test_grammar_readwrite(suffix):
+    cfg = cfpq_data.cfg_from_text("S -> a S b S | epsilon")
+    path = cfpq_data.cfg_to_txt(cfg, "test.txt" + suffix)
+    actual = cfpq_data.cfg_from_txt(path)
+
+    os.remove(path)
+
+    assert cfpq_data.cfg_to_text(actual) == cfpq_data.cfg_to_text(cfg)
+
+
+@pytest.mark.parametrize("suffix", SUFFIXES)
+def test_multiple_source_readwrite(suffix):
+    reachable_pairs = {(1, 1), (1, 3), (2, 2), (3, 1)}
+    path = cfpq_data.multiple_source_result_to_txt(reachable_pairs, "test.txt" + suffix)
+    actual = cfpq_data.multiple_source_result_from_txt(path)
+
+    os.remove(path)
+
+    assert actual == reachable_pairs
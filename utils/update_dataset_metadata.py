@@ -0,0 +1,28 @@
+from json import dump
+
+from cfpq_data import DATASET, dataset_statistics
+from cfpq_data.dataset.cache import _load_manifest
+from cfpq_data.dataset.metadata import METADATA_PATH
+from cfpq_data.config import VERSION
+
+
+def update_dataset_metadata(dataset):
+    graphs = dict()
+    statistics = dataset_statistics(dataset)
+
+    for graph_name in dataset:
+        manifest = _load_manifest("graphs", graph_name)
+
+        graphs[graph_name] = {
+            **statistics[graph_name],
+            "archive_size": manifest["archive_size"],
+            "archive_sha256": manifest["archive_sha256"],
+        }
+
+    with open(METADATA_PATH, "w") as f:
+        dump({"version": f"{VERSION[0]}.0.0", "graphs": graphs}, f, indent=4)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    update_dataset_metadata(DATASET)
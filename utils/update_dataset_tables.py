@@ -1,48 +1,39 @@
-from csv import DictWriter, QUOTE_MINIMAL
-
-from cfpq_data import graph_from_dataset
+from cfpq_data import DATASET_URL, dataset_statistics
 from cfpq_data.dataset import DATASET
 from config import MAIN_FOLDER
 
+GRAPHS_INDEX = MAIN_FOLDER / "docs" / "graphs" / "index.rst"
+
+TABLE_HEADER = """.. list-table::
+   :header-rows: 1
+
+   * - Graph
+     - Num Nodes
+     - Num Edges
+     - Download
+"""
+
 
 def update_dataset_tables(dataset):
-    for graph_class in dataset.keys():
-        table = list()
-        fieldnames = ["Graph", "#Vertices", "#Edges"]
-
-        for graph_name in dataset[graph_class]:
-            graph = graph_from_dataset(graph_name)
-            table.append(
-                [
-                    graph_name,
-                    f"{graph.number_of_nodes():,}",
-                    f"{graph.number_of_edges():,}",
-                ]
-            )
-
-        table.sort(key=lambda row: int(row[2].replace(",", "")))
-
-        with open(
-            MAIN_FOLDER / "docs" / "dataset" / f"{graph_class}.csv", mode="w"
-        ) as csv_file:
-            csv_writer = DictWriter(
-                csv_file,
-                fieldnames=fieldnames,
-                delimiter=";",
-                quotechar='"',
-                quoting=QUOTE_MINIMAL,
-            )
-            csv_writer.writeheader()
-
-            for row in table:
-                csv_writer.writerow(
-                    dict(
-                        zip(
-                            fieldnames,
-                            row,
-                        )
-                    )
-                )
+    statistics = dataset_statistics(dataset)
+
+    table = TABLE_HEADER
+
+    for graph_name in sorted(dataset, key=lambda name: statistics[name]["edges"]):
+        table += (
+            f"   * - :ref:`{graph_name}`\n"
+            f"     - {statistics[graph_name]['nodes']}\n"
+            f"     - {statistics[graph_name]['edges']}\n"
+            f"     - `.tar.gz <{DATASET_URL}{graph_name}.tar.gz>`_ 📥\n"
+        )
+
+    with open(GRAPHS_INDEX, "r", encoding="utf-8") as f:
+        index = f.read()
+
+    index = index[: index.index(TABLE_HEADER)] + table
+
+    with open(GRAPHS_INDEX, "w", encoding="utf-8") as f:
+        f.write(index)
 
 
 if __name__ == "__main__":